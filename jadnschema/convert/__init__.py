@@ -1,8 +1,14 @@
 """
 JADN Message & Schema conversion
 """
+from typing import Any
 from .message import Message, MessageType, SerialFormats
-from .schema import *
+from . import schema
+from .schema import (
+    CommentLevels, SchemaFormats, JsonRootStyle, JsonEnumStyle, JsonImportStyle,
+    SchemaTranslationFormatsForJADN, SchemaTranslationFormatsForJSON, SchemaVisualizationFormats,
+    dump, dumps, load, loads
+)
 
 __all__ = [
     # Schema Conversions
@@ -23,6 +29,7 @@ __all__ = [
     "md_dump", "md_dumps",
     "plant_dump", "plant_dumps",
     # "proto_dump", "proto_dumps",
+    "py_dump", "py_dumps",
     "relax_dump", "relax_dumps",
     # "thrift_dump", "thrift_dumps",
     # "xsd_dump", "xsd_dumps"
@@ -30,12 +37,12 @@ __all__ = [
     # "cddl_load", "cddl_loads",
     "jadn_load", "jadn_loads",
     # "jas_load", "jas_loads",
-    # "jidl_load", "jidl_loads",
+    "jidl_load", "jidl_loads",
     "json_load", "json_loads",
     # "proto_load", "proto_loads",
     # "relax_load", "relax_load",
     # "thrift_load", "thrift_loads",
-    "validate_schema",
+    "validate_schema", "validate_schemas",
     # Schema Dynamic
     "dump", "dumps",
     "load", "loads",
@@ -47,3 +54,14 @@ __all__ = [
     "SchemaTranslationFormatsForJSON",
     "SchemaVisualizationFormats"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Converter functions are imported from their schema reader/writer module on first use
+    if name in schema.__all__:
+        return getattr(schema, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *schema.__all__})
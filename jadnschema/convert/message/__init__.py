@@ -1,9 +1,12 @@
 from .enums import MessageType
 from .message import Message
-from .serialize import SerialFormats, decode_msg
+from .serialize import Compression, DecodeLimits, MessageLimitError, SerialFormats, decode_msg
 
 __all__ = [
+    "Compression",
+    "DecodeLimits",
     "Message",
+    "MessageLimitError",
     "MessageType",
     "SerialFormats",
     "decode_msg"
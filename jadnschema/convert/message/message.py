@@ -1,14 +1,24 @@
 import struct
 import uuid
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from textwrap import shorten
-from typing import List, Union
+from typing import List, Tuple, Union
 from .enums import MessageType
-from .serialize import decode_msg, encode_msg, SerialFormats
+from .serialize import DecodeLimits, MessageLimitError, decode_msg, encode_msg, SerialFormats
 from ...utils import unixTimeMillis
 
+# Binary envelope, all integers are little-endian
+# <magic:3s><version:B><created ms:q><request_id:16s> <msg_type><content_type><origin> <count:H><recipient>... <length:I><CBOR content>
+# strings are UTF-8 prefixed with their length as <H>
+ENVELOPE_MAGIC = b"OC2"
+ENVELOPE_VERSION = 1
+ENVELOPE_HEADER = struct.Struct("<3sBq16s")
+STRING_LENGTH = struct.Struct("<H")
+CONTENT_LENGTH = struct.Struct("<I")
+EPOCH = datetime.fromtimestamp(0, timezone.utc)
+
 
 class Message:
     """
@@ -30,10 +40,10 @@ class Message:
     # Content_type application/openc2 identifies content defined by OpenC2 language specification versions 1.x, i.e.,
     # all versions that are compatible with version 1.0
     content_type: SerialFormats
-    # Message body as specified by serialization and msg_type
+    # Message body as specified by serialization and msg_type, decoded on first access when loaded from an envelope
     content: dict
 
-    __slots__ = ("recipients", "origin", "created", "msg_type", "request_id", "content_type", "content")
+    __slots__ = ("recipients", "origin", "created", "msg_type", "request_id", "content_type", "_content", "_encoded")
 
     def __init__(self, recipients: Union[str, List[str]] = "", origin: str = "", created: datetime = None, msg_type: MessageType = None, request_id: uuid.UUID = None, content_type: SerialFormats = None, content: dict = None):
         self.recipients = (recipients if isinstance(recipients, list) else [recipients]) if recipients else []
@@ -45,12 +55,23 @@ class Message:
         self.content = content or {}
 
     def __setattr__(self, key: str, val):
-        val = self._validate_content(val) if key == "content" else val
-        if key in self.__slots__:
+        if key == "content":
+            object.__setattr__(self, "_content", self._validate_content(val))
+            object.__setattr__(self, "_encoded", None)
+            return
+        if key in self.__slots__ and not key.startswith("_"):
             object.__setattr__(self, key, val)
             return
         raise AttributeError(f"Cannot set an unknown attribute of {key}")
 
+    @property
+    def content(self) -> dict:
+        # Content loaded from an envelope is kept encoded until it is accessed
+        if getattr(self, "_encoded", None) is not None:
+            encoded, limits = self._encoded
+            self.content = decode_msg(bytes(encoded), SerialFormats.CBOR, raw=True, limits=limits)
+        return self._content
+
     def __str__(self):
         msg = self.content.copy()
         if self.msg_type == MessageType.Request:
@@ -108,8 +129,8 @@ class Message:
         return encode_msg(msg, self.content_type, raw=True) if serialize else msg
 
     @classmethod
-    def oc2_loads(cls, m: Union[bytes, dict, str], serial: SerialFormats) -> "Message":
-        msg = decode_msg(m, serial) #get human readable text
+    def oc2_loads(cls, m: Union[bytes, dict, str], serial: SerialFormats, limits: DecodeLimits = None) -> "Message":
+        msg = decode_msg(m, serial, limits=limits) #get human readable text
             
         #decoded msg into json, turn into pkt
         #msg = Message('receiver---','origin---','crtd','msg_type','id---',serial,msg).oc2_message() 
@@ -147,15 +168,26 @@ class Message:
         raise TypeError(f"File is not expected string/BytesIO object, given {type(file)}")
 
     def dumps(self) -> bytes:
-        return b"\xF5\xBE".join([  # §¥
-            b"\xF5\xBD".join(map(str.encode, self.recipients)),  # §¢
-            self.origin.encode(),
-            struct.pack("LI", *map(int, str(self.created.timestamp()).split("."))),
-            struct.pack("s", self.msg_type),
-            self.request_id.bytes,
-            struct.pack("s", self.content_type),
-            encode_msg(self.content, SerialFormats.CBOR, raw=True)
-        ])
+        """
+        Serialize the message to the binary envelope, the headers are length prefixed and the content is CBOR encoded
+        A naive created date/time is taken as UTC
+        :return: serialized message
+        """
+        created = self.created if self.created.tzinfo else self.created.replace(tzinfo=timezone.utc)
+        created = (created - EPOCH) // timedelta(milliseconds=1)
+        out = bytearray(ENVELOPE_HEADER.pack(ENVELOPE_MAGIC, ENVELOPE_VERSION, created, self.request_id.bytes))
+        for val in (self.msg_type.value, self.content_type.value, self.origin or ""):
+            _pack_string(val, out)
+        out += STRING_LENGTH.pack(len(self.recipients))
+        for recipient in self.recipients:
+            _pack_string(recipient, out)
+        if (encoded := getattr(self, "_encoded", None)) is not None:
+            content = encoded[0]
+        else:
+            content = encode_msg(self.content, SerialFormats.CBOR, raw=True)
+        out += CONTENT_LENGTH.pack(len(content))
+        out += content
+        return bytes(out)
 
     @classmethod
     def load(cls, file: Union[str, BytesIO]) -> "Message":
@@ -167,21 +199,57 @@ class Message:
         raise TypeError(f"File is not expected string/BytesIO object, given {type(file)}")
 
     @classmethod
-    def loads(cls, m: bytes) -> "Message":
-        msg = m.split(b"\xF5\xBE")
-        if len(msg) != 7:
-            raise ValueError("The OpenC2 message was not properly loaded")
-        [recipients, origin, created, msg_type, request_id, serialization, content] = msg
+    def loads(cls, m: Union[bytes, bytearray, memoryview], limits: DecodeLimits = None) -> "Message":
+        """
+        Load a message from the binary envelope, only the headers are parsed
+        The content is decoded, and checked against the limits, on first access, the created date/time is naive UTC
+        The content of a writable buffer is copied, the buffer is not held by the message
+        :param m: serialized message
+        :param limits: size/depth/element limits of the content
+        :raise ValueError: message is not a valid envelope
+        :return: loaded message
+        """
+        with memoryview(m) as buf:
+            try:
+                magic, version, created, request_id = ENVELOPE_HEADER.unpack_from(buf)
+                if magic != ENVELOPE_MAGIC:
+                    raise ValueError("The OpenC2 message is not a message envelope")
+                if version != ENVELOPE_VERSION:
+                    raise ValueError(f"The OpenC2 message envelope version {version} is not supported")
+                pos = ENVELOPE_HEADER.size
+                msg_type, pos = _unpack_string(buf, pos)
+                content_type, pos = _unpack_string(buf, pos)
+                origin, pos = _unpack_string(buf, pos)
+                count = STRING_LENGTH.unpack_from(buf, pos)[0]
+                pos += STRING_LENGTH.size
+                recipients = []
+                for _ in range(count):
+                    recipient, pos = _unpack_string(buf, pos)
+                    recipients.append(recipient)
+                length = CONTENT_LENGTH.unpack_from(buf, pos)[0]
+                pos += CONTENT_LENGTH.size
+            except struct.error as err:
+                raise ValueError("The OpenC2 message was not properly loaded") from err
+            if pos + length != len(buf):
+                raise ValueError("The OpenC2 message was not properly loaded, the content length is invalid")
+            if limits and limits.max_bytes is not None and length > limits.max_bytes:
+                raise MessageLimitError(f"Message exceeds the maximum size of {limits.max_bytes} bytes")
+            # A writable buffer can be changed or resized by the caller, only an immutable one is kept
+            content = buf[pos:] if buf.readonly else bytes(buf[pos:])
 
-        return cls(
-            recipients=list(filter(None, map(bytes.decode, recipients.split(b"\xF5\xBD")))),
-            origin=origin.decode(),
-            created=datetime.fromtimestamp(float(".".join(map(str, struct.unpack("LI", created))))),
-            msg_type=MessageType(struct.unpack("s", msg_type)[0]),
-            request_id=uuid.UUID(bytes=request_id),
-            content_type=SerialFormats.from_value(struct.unpack("s", serialization)[0]),
-            content=decode_msg(content, SerialFormats.CBOR, raw=True)
-        )
+        msg = cls.__new__(cls)
+        for key, val in (
+            ("recipients", recipients),
+            ("origin", origin),
+            ("created", (EPOCH + timedelta(milliseconds=created)).replace(tzinfo=None)),
+            ("msg_type", MessageType.from_value(msg_type)),
+            ("request_id", uuid.UUID(bytes=request_id)),
+            ("content_type", SerialFormats.from_value(content_type)),
+            ("_content", None),
+            ("_encoded", (content, limits))
+        ):
+            object.__setattr__(msg, key, val)
+        return msg
 
     # Utility Functions
     #OpenC2 specific validation
@@ -200,3 +268,18 @@ class Message:
         else:
             print("Message property `msg_type` not set, cannot validate message")
         return val
+
+
+# Envelope Helpers
+def _pack_string(val: str, out: bytearray) -> None:
+    data = val.encode("utf-8")
+    out += STRING_LENGTH.pack(len(data))
+    out += data
+
+
+def _unpack_string(buf: memoryview, pos: int) -> Tuple[str, int]:
+    length = STRING_LENGTH.unpack_from(buf, pos)[0]
+    pos += STRING_LENGTH.size
+    if pos + length > len(buf):
+        raise ValueError("The OpenC2 message was not properly loaded, a header is truncated")
+    return str(buf[pos:pos + length], "utf-8"), pos + length
@@ -2,27 +2,19 @@
 Message Serialization
 """
 import base64
-import bson
-import cbor2
-import edn_format
+import importlib
 import json
-import msgpack
-import toml
-import ubjson
-import yaml
-
-from typing import Union
-from amazon.ion import simpleion as ion, simple_types as ion_types
-from . import pybinn, pysmile
+import sys
+
+from typing import Any, Callable, Union
+from .compress import Compression
 from .enums import SerialFormats
-from .helpers import bencode_encode, bencode_decode, sp_encode, sp_decode, xml_encode, xml_decode
+from .guards import DecodeLimits, MessageLimitError, check_limits
 from ....utils import FrozenDict, default_encode, isBase64
-
-try:
-    from yaml import CLoader as Loader, CDumper as Dumper
-except ImportError:
-    from yaml import Loader, Dumper
 __all__ = [
+    "Compression",
+    "DecodeLimits",
+    "MessageLimitError",
     "decode_msg",
     "encode_msg",
     "serializations",
@@ -30,56 +22,86 @@ __all__ = [
 ]
 
 
+def lazy_import(module: str, attr: str, **defaults) -> Callable:
+    """
+    Create a function that imports the serialization function on first use
+    :param module: module containing the function, relative modules are resolved against this package
+    :param attr: name of the function within the module
+    :param defaults: keyword arguments passed on every call
+    :return: function that calls the imported function
+    """
+    fun = None
+
+    def wrapper(msg: Any, *args, **kwargs) -> Any:
+        nonlocal fun
+        if fun is None:
+            fun = getattr(importlib.import_module(module, __name__), attr)
+        return fun(msg, *args, **{**defaults, **kwargs})
+
+    wrapper.__name__ = attr
+    return wrapper
+
+
 serializations = FrozenDict(
     encode=FrozenDict(
-        binn=pybinn.dumps,
-        bencode=bencode_encode,
-        bson=bson.dumps,
-        cbor=cbor2.dumps,
-        edn=edn_format.dumps,
+        binn=lazy_import(".pybinn", "dumps"),
+        bencode=lazy_import(".helpers", "bencode_encode"),
+        bson=lazy_import("bson", "dumps"),
+        cbor=lazy_import("cbor2", "dumps"),
+        edn=lazy_import("edn_format", "dumps"),
         json=json.dumps,
-        ion=lambda m: ion.dumps(m, binary=True),
-        msgpack=lambda m: msgpack.packb(m, use_bin_type=True),
-        sexp=sp_encode,  # S-Expression
-        smile=pysmile.encode,
-        toml=toml.dumps,
-        xml=xml_encode,
-        ubjson=ubjson.dumpb,
-        yaml=lambda m: yaml.dump(m, Dumper=Dumper)
+        ion=lazy_import("amazon.ion.simpleion", "dumps", binary=True),
+        msgpack=lazy_import("msgpack", "packb", use_bin_type=True),
+        protobuf=lazy_import(".protobuf", "dumps"),
+        sexp=lazy_import(".helpers", "sp_encode"),  # S-Expression
+        smile=lazy_import(".pysmile", "encode"),
+        toml=lazy_import("toml", "dumps"),
+        xml=lazy_import(".helpers", "xml_encode"),
+        ubjson=lazy_import("ubjson", "dumpb"),
+        yaml=lazy_import(".helpers", "yaml_encode")
     ),
     decode=FrozenDict(
-        binn=pybinn.loads,
-        bencode=bencode_decode,
-        bson=bson.loads,
-        cbor=cbor2.loads,
-        edn=edn_format.loads,
+        binn=lazy_import(".pybinn", "loads"),
+        bencode=lazy_import(".helpers", "bencode_decode"),
+        bson=lazy_import("bson", "loads"),
+        cbor=lazy_import("cbor2", "loads"),
+        edn=lazy_import("edn_format", "loads"),
         json=json.loads,
-        ion=ion.loads,
-        msgpack=msgpack.unpackb,
-        sexp=sp_decode,  # S-Expression
-        smile=pysmile.decode,
-        toml=toml.loads,
-        xml=xml_decode,
-        ubjson=ubjson.loadb,
-        yaml=lambda m: yaml.load(m, Loader=Loader)
+        ion=lazy_import("amazon.ion.simpleion", "loads"),
+        msgpack=lazy_import("msgpack", "unpackb"),
+        protobuf=lazy_import(".protobuf", "loads"),
+        sexp=lazy_import(".helpers", "sp_decode"),  # S-Expression
+        smile=lazy_import(".pysmile", "decode"),
+        toml=lazy_import("toml", "loads"),
+        xml=lazy_import(".helpers", "xml_decode"),
+        ubjson=lazy_import("ubjson", "loadb"),
+        yaml=lazy_import(".helpers", "yaml_decode")
     )
 )
 
-extra_decoders = FrozenDict({
-    # Builtin Types
-    bytes: bytes.decode,
+
+def get_extra_decoders() -> FrozenDict:
+    """
+    Get the decoders for the serialization specific types, only the serializations already imported are included
+    :return: type specific decoders
+    """
+    decoders = {bytes: bytes.decode}  # Builtin Types
     # Serialization Types
-    ion_types.IonPyDict: dict,
-    edn_format.immutable_dict.ImmutableDict: dict
-})
+    if ion_types := sys.modules.get("amazon.ion.simple_types"):
+        decoders[ion_types.IonPyDict] = dict
+    if edn_dict := sys.modules.get("edn_format.immutable_dict"):
+        decoders[edn_dict.ImmutableDict] = dict
+    return FrozenDict(decoders)
 
 
-def encode_msg(msg: dict, enc: SerialFormats = SerialFormats.JSON, raw: bool = False) -> Union[bytes, str]:
+def encode_msg(msg: dict, enc: SerialFormats = SerialFormats.JSON, raw: bool = False, *, compression: Compression = None, **kwargs) -> Union[bytes, str]:
     """
     Encode the given message using the serialization specified
     :param msg: message to encode
     :param enc: serialization to encode
     :param raw: message is in raw form (bytes/string) or safe string (base64 bytes as string)
+    :param compression: compress the encoded message with a schema dictionary, see `Compression.from_schema`
+    :param kwargs: key/value args of the serialization, protobuf requires the `schema` and `root` type of the message
     :return: encoded message
     """
     if not isinstance(msg, dict):
@@ -91,19 +113,25 @@ def encode_msg(msg: dict, enc: SerialFormats = SerialFormats.JSON, raw: bool = F
 
     enc = (enc if isinstance(enc, str) else enc.value).lower()
     if encoder := serializations.encode.get(enc):
-        encoded = encoder(msg)
+        encoded = encoder(msg, **kwargs) if kwargs else encoder(msg)
+        if compression and compression.applies(enc):
+            encoded = compression.compress(encoded)
         if raw:
             return encoded
         return base64.b64encode(encoded).decode("utf-8") if isinstance(encoded, bytes) else encoded
     raise ReferenceError(f"Invalid encoding `{enc}` specified, must be one of {', '.join(serializations.encode.keys())}")
 
 
-def decode_msg(msg: Union[bytes, dict, str], enc: SerialFormats, raw: bool = False, *args, **kwargs) -> dict:
+def decode_msg(msg: Union[bytes, dict, str], enc: SerialFormats, raw: bool = False, *args, limits: DecodeLimits = None, compression: Compression = None, **kwargs) -> dict:
     """
     Decode the given message using the serialization specified
     :param msg: message to decode
     :param enc: serialization to decode
     :param raw: message is in raw form (bytes/string) or safe string (base64 bytes as string)
+    :param limits: size/depth/element limits checked before the message is decoded, see `DecodeLimits.from_schema`
+    :param compression: decompress the message with a schema dictionary, see `Compression.from_schema`
+    :param kwargs: key/value args of the serialization, protobuf requires the `schema` and `root` type of the message
+    :raise MessageLimitError: message exceeds the given limits
     :return: decoded message
     """
     if isinstance(msg, dict):
@@ -111,18 +139,21 @@ def decode_msg(msg: Union[bytes, dict, str], enc: SerialFormats, raw: bool = Fal
 
     if isinstance(msg, (bytes, str)):
         if not raw and isBase64(msg):
+            if limits and limits.max_bytes is not None and len(msg) * 3 // 4 > limits.max_bytes + 2:
+                raise MessageLimitError(f"Message exceeds the maximum size of {limits.max_bytes} bytes")
             msg = base64.b64decode(msg if isinstance(msg, bytes) else msg.encode())
 
+        if compression and compression.applies(enc):
+            msg = compression.decompress(msg.encode("utf-8") if isinstance(msg, str) else msg, limits.max_bytes if limits else None)
+            msg = msg if enc.is_binary(enc) else msg.decode("utf-8")
         msg = msg.encode("utf-8") if enc.is_binary(enc) and isinstance(msg, str) else msg
         enc = (enc if isinstance(enc, str) else enc.value).lower()
         if decoder := serializations.decode.get(enc):
-            
-            root = kwargs.get('root', None)
-            if root != None:
-                msg = decoder(msg, root=root)
-            else:
-                msg = decoder(msg)
-            
-            return default_encode(msg, extra_decoders)
+            if limits:
+                check_limits(msg, enc, limits)
+
+            kwargs = {k: v for k, v in kwargs.items() if v is not None}
+            msg = decoder(msg, **kwargs) if kwargs else decoder(msg)
+            return default_encode(msg, get_extra_decoders())
         raise ReferenceError(f"Invalid encoding `{enc}` specified, must be one of {', '.join(serializations.decode.keys())}")
     raise TypeError(f"Message is not expected type {bytes}/{str}, got {type(msg)}")
@@ -0,0 +1,128 @@
+"""
+Message Compression
+Compress encoded messages with a zlib preset dictionary built from the field and enumeration vocabulary of a schema,
+small messages that compress poorly on their own reuse the names they share with the schema
+"""
+import json
+import zlib
+
+from collections import OrderedDict
+from threading import Lock
+from typing import List, NamedTuple, Optional, Union
+from .enums import SerialFormats
+from .guards import MessageLimitError
+__all__ = ["Compression", "schema_dictionary"]
+CACHE_SIZE = 16        # Dictionaries cached for the most recently used schemas
+MAX_DICT_SIZE = 32768  # zlib only references the last 32K of the dictionary
+TEXT_FORMATS = (SerialFormats.JSON, SerialFormats.XML, SerialFormats.YAML)
+FIELD_TYPES = ("Array", "Choice", "Map", "Record")
+
+
+class Compression(NamedTuple):
+    """
+    Compression stage of the encoded messages of a schema, both peers must use the dictionary of the same schema
+    """
+    zdict: bytes          #: zlib preset dictionary
+    level: int = 9        #: zlib compression level
+    binary: bool = False  #: Also compress the binary serializations, the text serializations are always compressed
+
+    @property
+    def dict_id(self) -> int:
+        """
+        Identifier of the dictionary in the zlib header, the Adler-32 checksum of the dictionary
+        """
+        return zlib.adler32(self.zdict)
+
+    @classmethod
+    def from_schema(cls, schema: Union["Schema", dict], level: int = 9, binary: bool = False) -> "Compression":
+        """
+        Create the compression stage of the messages of a schema
+        :param schema: schema the messages are validated against
+        :param level: zlib compression level
+        :param binary: also compress the binary serializations
+        :return: compression stage
+        """
+        return cls(schema_dictionary(schema), level, binary)
+
+    def applies(self, enc: Union[SerialFormats, str]) -> bool:
+        """
+        Determine if messages of the serialization are compressed
+        :param enc: serialization of the message
+        """
+        return enc in TEXT_FORMATS or (self.binary and SerialFormats.is_binary(enc))
+
+    def compress(self, msg: Union[bytes, str]) -> bytes:
+        """
+        Compress an encoded message
+        :param msg: encoded message
+        :return: zlib stream referencing the preset dictionary
+        """
+        compressor = zlib.compressobj(self.level, zdict=self.zdict)
+        return compressor.compress(msg.encode("utf-8") if isinstance(msg, str) else msg) + compressor.flush()
+
+    def decompress(self, msg: bytes, max_bytes: Optional[int] = None) -> bytes:
+        """
+        Decompress an encoded message
+        :param msg: zlib stream referencing the preset dictionary
+        :param max_bytes: maximum size of the decompressed message, the stream is not inflated past the limit
+        :raise MessageLimitError: decompressed message exceeds the maximum size
+        :raise ValueError: message is not compressed with the dictionary
+        :return: encoded message
+        """
+        if len(msg) < 6 or not msg[1] & 0x20:
+            raise ValueError("Message is not compressed with a preset dictionary")
+        if int.from_bytes(msg[2:6], "big") != self.dict_id:
+            raise ValueError("Message is compressed with the dictionary of a different schema")
+        decompressor = zlib.decompressobj(zdict=self.zdict)
+        try:
+            if max_bytes is None:
+                data = decompressor.decompress(msg)
+            else:
+                data = decompressor.decompress(msg, max_bytes + 1)
+                if len(data) > max_bytes:
+                    raise MessageLimitError(f"Message exceeds the maximum size of {max_bytes} bytes")
+        except zlib.error as err:
+            raise ValueError(f"Message cannot be decompressed - {err}") from err
+        if not decompressor.eof:
+            raise ValueError("Message is truncated")
+        return data
+
+
+def _vocabulary(types: List[list]) -> List[str]:
+    # Later strings are cheaper to reference, the types are reversed so the leading (exported) types are last
+    words = []
+    for type_def in reversed(types):
+        if len(type_def) < 5:
+            continue
+        if type_def[1] == "Enumerated":
+            if "=" not in type_def[2]:
+                words.extend(f'"{item[1]}"' for item in reversed(type_def[4]))
+        elif type_def[1] in FIELD_TYPES:
+            words.extend(f'"{field[1]}": ' for field in reversed(type_def[4]))
+    return list(reversed(OrderedDict.fromkeys(reversed(words))))  # keep the last occurrence of each word
+
+
+_dictionaries: "OrderedDict[str, bytes]" = OrderedDict()
+_dictionaries_lock = Lock()
+
+
+def schema_dictionary(schema: Union["Schema", dict]) -> bytes:
+    """
+    Get the zlib preset dictionary of a schema, the dictionaries are cached by the hash of the schema
+    :param schema: schema or schema dict
+    :return: preset dictionary
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+    schema = schema if isinstance(schema, dict) else schema.schema()
+    digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+    with _dictionaries_lock:
+        if (zdict := _dictionaries.get(digest)) is not None:
+            _dictionaries.move_to_end(digest)
+            return zdict
+
+    zdict = "".join(_vocabulary(schema.get("types", []))).encode("utf-8")[-MAX_DICT_SIZE:]
+    with _dictionaries_lock:
+        _dictionaries[digest] = zdict
+        if len(_dictionaries) > CACHE_SIZE:
+            _dictionaries.popitem(last=False)
+    return zdict
@@ -15,6 +15,7 @@ class SerialFormats(str, EnumBase):
     BSON = 'bson'
     ION = 'ion'
     MSGPACK = 'msgpack'
+    PROTOBUF = 'protobuf'  # Requires the schema and root type of the message
     SMILE = 'smile'
     # Text
     BENCODE = 'bencode'
@@ -31,4 +32,4 @@ class SerialFormats(str, EnumBase):
         Determine if the format is binary or text based
         :param fmt: Serialization
         """
-        return fmt in (cls.BINN, cls.BSON, cls.CBOR, cls.ION, cls.MSGPACK, cls.SMILE, cls.UBJSON)
+        return fmt in (cls.BINN, cls.BSON, cls.CBOR, cls.ION, cls.MSGPACK, cls.PROTOBUF, cls.SMILE, cls.UBJSON)
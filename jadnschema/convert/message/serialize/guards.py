@@ -0,0 +1,384 @@
+"""
+Message Decoding Guards
+Enforce size, depth and element count ceilings on an encoded message before it is deserialized
+"""
+import json
+import re
+
+from typing import Callable, List, NamedTuple, NoReturn, Optional, Union
+from ....utils import FrozenDict
+__all__ = [
+    "DecodeLimits",
+    "MessageLimitError",
+    "check_limits",
+    "scan_cbor",
+    "scan_json",
+    "scan_msgpack"
+]
+DEFAULT_MAX_DEPTH = 32
+# Types whose `maxv` option raises a limit: {type: limit}
+LIMITED_TYPES = FrozenDict(
+    Binary="Binary",
+    String="String",
+    Array="Elements",
+    ArrayOf="Elements",
+    Map="Elements",
+    MapOf="Elements",
+    Record="Elements"
+)
+JSON_TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{},]', re.S)
+JSON_TOKENS_BYTES = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{},]', re.S)
+JSON_STRINGS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+JSON_STRINGS_BYTES = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+JSON_ESCAPES = re.compile(r'\\.', re.S)
+JSON_ESCAPES_BYTES = re.compile(rb'\\.', re.S)
+JSON_INNER = re.compile(rb'\[,*\]')
+# Octets of a JSON message other than brackets and commas & objects as arrays
+JSON_VALUES = bytes(c for c in range(256) if c not in b"[]{},")
+JSON_BRACKETS = bytes.maketrans(b"{}", b"[]")
+# Initial bytes that can start an array/map: {serialization: bytes}
+CONTAINER_BYTES = FrozenDict(
+    cbor=bytes(range(0x80, 0xc0)),
+    msgpack=bytes([*range(0x80, 0xa0), 0xdc, 0xdd, 0xde, 0xdf])
+)
+
+
+class MessageLimitError(ValueError):
+    """
+    Encoded message exceeds a decoding limit
+    """
+
+
+class DecodeLimits(NamedTuple):
+    """
+    Ceilings of an encoded message, a limit of None is not checked
+    """
+    max_bytes: Optional[int] = None                #: Maximum size of the encoded message in bytes
+    max_depth: Optional[int] = DEFAULT_MAX_DEPTH  #: Maximum nesting depth of arrays/objects
+    max_elements: Optional[int] = None             #: Maximum items/properties of a single array/object
+    max_string: Optional[int] = None               #: Maximum characters of a single string
+    max_binary: Optional[int] = None               #: Maximum octets of a single byte string
+
+    @classmethod
+    def from_config(cls, config: Union["Config", dict] = None, max_bytes: int = None, max_depth: int = DEFAULT_MAX_DEPTH) -> "DecodeLimits":
+        """
+        Create limits from the `$MaxElements`, `$MaxString` and `$MaxBinary` of a schema config
+        Binary values may be carried as base64/hex strings, so strings are limited to the larger of the two
+        :param config: schema config or config dict, defaults to the JADN defaults
+        :param max_bytes: maximum size of the encoded message in bytes
+        :param max_depth: maximum nesting depth of arrays/objects
+        :return: decoding limits
+        """
+        from jadnschema.schema.info import Config  # pylint: disable=import-outside-toplevel
+        if config is None or isinstance(config, dict):
+            config = Config(**(config or {}))
+        return cls(
+            max_bytes=max_bytes,
+            max_depth=max_depth,
+            max_elements=config.MaxElements,
+            max_string=max(config.MaxString, config.MaxBinary * 2),
+            max_binary=config.MaxBinary
+        )
+
+    @classmethod
+    def from_schema(cls, schema: "Schema", max_bytes: int = None, max_depth: int = DEFAULT_MAX_DEPTH) -> "DecodeLimits":
+        """
+        Create limits from the config of a schema, raised to the largest `maxv` of the schema types
+        :param schema: schema the messages are validated against
+        :param max_bytes: maximum size of the encoded message in bytes
+        :param max_depth: maximum nesting depth of arrays/objects
+        :return: decoding limits
+        """
+        config = schema.info.config if schema.info and schema.info.config else None
+        limits = cls.from_config(config, max_bytes, max_depth)
+        max_vals = {"Binary": limits.max_binary, "String": limits.max_string, "Elements": limits.max_elements}
+        for def_cls in (schema.types or {}).values():
+            opts = def_cls.__options__
+            if key := LIMITED_TYPES.get(opts.data_type):
+                if isinstance(opts.maxv, int) and opts.maxv > max_vals[key]:
+                    max_vals[key] = opts.maxv
+        return limits._replace(
+            max_elements=max_vals["Elements"],
+            max_string=max(max_vals["String"], max_vals["Binary"] * 2),
+            max_binary=max_vals["Binary"]
+        )
+
+
+# Scanners
+def _check_depth(depth: int, limits: DecodeLimits) -> NoReturn:
+    if limits.max_depth is not None and depth > limits.max_depth:
+        raise MessageLimitError(f"Message exceeds the maximum nesting depth of {limits.max_depth}")
+
+
+def _check_elements(count: int, limits: DecodeLimits) -> NoReturn:
+    if limits.max_elements is not None and count > limits.max_elements:
+        raise MessageLimitError(f"Message exceeds the maximum of {limits.max_elements} elements")
+
+
+def _check_string(length: int, limits: DecodeLimits) -> NoReturn:
+    if limits.max_string is not None and length > limits.max_string:
+        raise MessageLimitError(f"Message exceeds the maximum string length of {limits.max_string}")
+
+
+def _check_binary(length: int, limits: DecodeLimits) -> NoReturn:
+    if limits.max_binary is not None and length > limits.max_binary:
+        raise MessageLimitError(f"Message exceeds the maximum binary length of {limits.max_binary}")
+
+
+def scan_json(msg: Union[bytes, str], limits: DecodeLimits) -> NoReturn:
+    """
+    Scan the structure of a JSON message without decoding the values
+    The strings are split out at the quotes and the innermost arrays/objects are removed once per level of nesting,
+    so the cost is a few passes over the message rather than a step per token
+    :param msg: encoded message
+    :param limits: decoding limits
+    :raise MessageLimitError: message exceeds a limit
+    """
+    if limits.max_depth is None and limits.max_elements is not None:
+        # Without a depth limit the passes are unbounded, walk the tokens instead
+        _scan_json_tokens(msg, limits)
+        return
+    text, binary = msg, isinstance(msg, (bytes, bytearray))
+    empty, quote, escape = (b"", b'"', b"\\") if binary else ("", '"', "\\")
+    if escape in text:  # an escape is one character and may be a quote
+        text = (JSON_ESCAPES_BYTES if binary else JSON_ESCAPES).sub(b"_" if binary else "_", text)
+    parts = text.split(quote)
+    if limits.max_string is not None and max(map(len, parts[1::2]), default=0) > limits.max_string:
+        # UTF-8 and escapes only make the encoded string longer, decode the strings to confirm
+        for string in (JSON_STRINGS_BYTES if binary else JSON_STRINGS).findall(msg):
+            if len(string) - 2 > limits.max_string:
+                _check_string(len(json.loads(string)), limits)
+
+    structure = empty.join(parts[::2])
+    structure = (structure if binary else structure.encode("utf-8", "ignore")).translate(JSON_BRACKETS, JSON_VALUES)
+    if limits.max_elements is not None and structure.count(b",") >= limits.max_elements:
+        _scan_json_elements(structure, limits)
+    if limits.max_depth is not None:
+        nested, depth = structure.replace(b",", b""), 0
+        while nested:
+            reduced = nested.replace(b"[]", b"")
+            if len(reduced) == len(nested):  # malformed, left to the decoder
+                break
+            depth += 1
+            _check_depth(depth, limits)
+            nested = reduced
+
+
+def _scan_json_elements(structure: bytes, limits: DecodeLimits) -> NoReturn:
+    # Brackets and commas of the innermost arrays/objects, the elements are one more than the commas
+    while structure:
+        longest = max(map(len, JSON_INNER.findall(structure)), default=2)
+        _check_elements(longest - 1 if longest > 2 else 0, limits)
+        reduced = JSON_INNER.sub(b"", structure)
+        if len(reduced) == len(structure):
+            break
+        structure = reduced
+
+
+def _scan_json_tokens(msg: Union[bytes, str], limits: DecodeLimits) -> NoReturn:
+    counts: List[int] = []  # commas seen in each open array/object
+    for token in (JSON_TOKENS_BYTES if isinstance(msg, (bytes, bytearray)) else JSON_TOKENS).finditer(msg):
+        start = token.start()
+        char = msg[start:start + 1]
+        if char in ('"', b'"'):
+            # Escapes only make the encoded string longer, decode to confirm
+            if limits.max_string is not None and token.end() - start - 2 > limits.max_string:
+                _check_string(len(json.loads(token.group())), limits)
+        elif char in ("[", "{", b"[", b"{"):
+            counts.append(0)
+            _check_depth(len(counts), limits)
+        elif char in ("]", "}", b"]", b"}"):
+            if counts:
+                counts.pop()
+        elif counts:
+            counts[-1] += 1
+            _check_elements(counts[-1] + 1, limits)
+
+
+def _binary_within(msg: bytes, limits: DecodeLimits, containers: bytes) -> bool:
+    """
+    Check that a binary message cannot exceed a limit, an item or string is never longer than the message
+    and every byte that can start an array/map may add a level of nesting
+    :param msg: encoded message
+    :param limits: decoding limits
+    :param containers: initial bytes that can start an array/map
+    :return: message is within the limits without walking the items
+    """
+    bound = len(msg) - 1
+    if any(limit is not None and bound > limit for limit in (limits.max_elements, limits.max_string, limits.max_binary)):
+        return False
+    return limits.max_depth is None or len(msg) - len(bytes(msg).translate(None, containers)) <= limits.max_depth
+
+
+def _scan_binary(msg: bytes, limits: DecodeLimits, header: Callable[[bytes, int], tuple]) -> NoReturn:
+    """
+    Walk the item headers of a binary message without decoding the values
+    :param msg: encoded message
+    :param limits: decoding limits
+    :param header: function that reads the item at an offset -> (offset of next item, kind, length or octets of a string)
+    :raise MessageLimitError: message exceeds a limit
+    """
+    # [remaining items or None if indefinite length, items seen, items per element(, length of the chunks)] of each open container
+    stack: List[list] = [[1, 0, 1]]
+    offset, size = 0, len(msg)
+    while stack and offset < size:
+        offset, kind, length = header(msg, offset)
+        if kind == "tag":  # tags annotate the next item
+            continue
+        if kind == "break":
+            stack.pop()
+        else:
+            container = stack[-1]
+            container[1] += 1
+            if container[0] is None:
+                _check_elements(-(-container[1] // container[2]), limits)
+            else:
+                container[0] -= 1
+            if kind == "str":
+                if limits.max_string is not None:
+                    if len(container) > 3:  # chunk of an indefinite length string
+                        container[3] += _char_count(msg, offset, length)
+                        _check_string(container[3], limits)
+                    elif length > limits.max_string:
+                        # UTF-8 uses up to 4 octets per character, count the characters to confirm
+                        _check_string(_char_count(msg, offset, length), limits)
+            elif kind == "bin":
+                if len(container) > 3:  # chunk of an indefinite length byte string
+                    container[3] += length
+                    length = container[3]
+                _check_binary(length, limits)
+            elif kind in ("array", "map"):
+                per_elem = 2 if kind == "map" else 1
+                if length == -1:
+                    stack.append([None, 0, per_elem])
+                else:
+                    _check_elements(length, limits)
+                    stack.append([length * per_elem, 0, per_elem])
+                _check_depth(len(stack) - 1, limits)
+            elif kind == "chunks":
+                stack.append([None, 0, 1, 0])  # the chunk lengths are added up
+        while stack and stack[-1][0] == 0:
+            stack.pop()
+
+
+def _char_count(msg: bytes, end: int, length: int) -> int:
+    # Characters of the UTF-8 string ending at the offset
+    return len(msg[end - length:end].decode("utf-8", "ignore"))
+
+
+def _cbor_header(msg: bytes, offset: int) -> tuple:
+    initial = msg[offset]
+    major, info = initial >> 5, initial & 0x1f
+    offset += 1
+    if info < 24:
+        arg = info
+    elif info < 28:
+        width = 1 << (info - 24)
+        arg = int.from_bytes(msg[offset:offset + width], "big")
+        offset += width
+    elif info == 31:
+        if major == 7:
+            return offset, "break", 0
+        if major in (2, 3):  # indefinite strings are sequences of chunks ended by a break
+            return offset, "chunks", -1
+        return offset, ("array", "map")[major - 4] if major in (4, 5) else "value", -1
+    else:
+        raise MessageLimitError(f"Message has an invalid CBOR header at offset {offset - 1}")
+
+    if major == 2:
+        return offset + arg, "bin", arg
+    if major == 3:
+        return offset + arg, "str", arg
+    if major in (4, 5):
+        return offset, ("array", "map")[major - 4], arg
+    if major == 6:
+        return offset, "tag", 0
+    return offset, "value", 0
+
+
+def _msgpack_header(msg: bytes, offset: int) -> tuple:
+    initial = msg[offset]
+    offset += 1
+    if initial <= 0x7f or initial >= 0xe0 or initial in (0xc0, 0xc2, 0xc3):
+        return offset, "value", 0
+    if 0x80 <= initial <= 0x9f:
+        return offset, "map" if initial <= 0x8f else "array", initial & 0x0f
+    if 0xa0 <= initial <= 0xbf:
+        length = initial & 0x1f
+        return offset + length, "str", length
+    if initial in MSGPACK_FIXED:
+        return offset + MSGPACK_FIXED[initial], "value", 0
+    if initial in MSGPACK_SIZED:
+        kind, width = MSGPACK_SIZED[initial]
+        length = int.from_bytes(msg[offset:offset + width], "big")
+        offset += width
+        if kind in ("array", "map"):
+            return offset, kind, length
+        if kind == "ext":
+            return offset + length + 1, "bin", length
+        return offset + length, kind, length
+    raise MessageLimitError(f"Message has an invalid MessagePack header at offset {offset - 1}")
+
+
+# MessagePack headers: {type byte: payload octets} & {type byte: (kind, length octets)}
+MSGPACK_FIXED = FrozenDict({
+    0xca: 4, 0xcb: 8,                           # float
+    0xcc: 1, 0xcd: 2, 0xce: 4, 0xcf: 8,         # uint
+    0xd0: 1, 0xd1: 2, 0xd2: 4, 0xd3: 8,         # int
+    0xd4: 2, 0xd5: 3, 0xd6: 5, 0xd7: 9, 0xd8: 17  # fixext, type + data
+})
+MSGPACK_SIZED = FrozenDict({
+    0xc4: ("bin", 1), 0xc5: ("bin", 2), 0xc6: ("bin", 4),
+    0xc7: ("ext", 1), 0xc8: ("ext", 2), 0xc9: ("ext", 4),
+    0xd9: ("str", 1), 0xda: ("str", 2), 0xdb: ("str", 4),
+    0xdc: ("array", 2), 0xdd: ("array", 4),
+    0xde: ("map", 2), 0xdf: ("map", 4)
+})
+
+
+def scan_cbor(msg: bytes, limits: DecodeLimits) -> NoReturn:
+    """
+    Walk the item headers of a CBOR message without decoding the values
+    The walk is a step per item, messages too small to exceed a limit are not walked
+    :param msg: encoded message
+    :param limits: decoding limits
+    :raise MessageLimitError: message exceeds a limit
+    """
+    if not _binary_within(msg, limits, CONTAINER_BYTES["cbor"]):
+        _scan_binary(msg, limits, _cbor_header)
+
+
+def scan_msgpack(msg: bytes, limits: DecodeLimits) -> NoReturn:
+    """
+    Walk the item headers of a MessagePack message without decoding the values
+    The walk is a step per item, messages too small to exceed a limit are not walked
+    :param msg: encoded message
+    :param limits: decoding limits
+    :raise MessageLimitError: message exceeds a limit
+    """
+    if not _binary_within(msg, limits, CONTAINER_BYTES["msgpack"]):
+        _scan_binary(msg, limits, _msgpack_header)
+
+
+scanners = FrozenDict(
+    cbor=scan_cbor,
+    json=scan_json,
+    msgpack=scan_msgpack
+)
+
+
+def check_limits(msg: Union[bytes, str], enc: str, limits: DecodeLimits) -> NoReturn:
+    """
+    Check an encoded message against the decoding limits before it is decoded
+    Serializations without a scanner are only checked for size
+    JSON costs about as much as decoding it, CBOR and MessagePack messages larger than a limit are walked
+    an item at a time which costs several times the decoding
+    :param msg: encoded message
+    :param enc: serialization of the message
+    :param limits: decoding limits
+    :raise MessageLimitError: message exceeds a limit
+    """
+    if limits.max_bytes is not None and len(msg) > limits.max_bytes:
+        raise MessageLimitError(f"Message exceeds the maximum size of {limits.max_bytes} bytes")
+    if scanner := scanners.get(enc):
+        scanner(msg, limits)
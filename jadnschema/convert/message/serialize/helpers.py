@@ -1,13 +1,11 @@
 """
 Serialization encode/decode helper functions
 """
-import bencode
 import collections
-import sexpdata
-import xmltodict
 
 from typing import Any, Union
 from ....utils import check_values, default_encode, floatString
+# Serialization backends are imported on first use to keep import time down
 
 
 # Message Conversion helpers for Bencode
@@ -17,6 +15,7 @@ def bencode_encode(msg: dict) -> str:
     :param msg: message to convert
     :return: Bencode formatted message
     """
+    import bencode  # pylint: disable=import-outside-toplevel
     return bencode.bencode(default_encode(msg, {float: floatString})).decode('UTF-8')
 
 
@@ -26,11 +25,13 @@ def bencode_decode(msg: str) -> dict:
     :param msg: message to convert
     :return: JSON formatted message
     """
+    import bencode  # pylint: disable=import-outside-toplevel
     return default_encode(bencode.bdecode(msg), {bytes: floatString})
 
 
 # Message Conversion helpers for S-Expression
 def _sp_decode(val: Any) -> Any:
+    import sexpdata  # pylint: disable=import-outside-toplevel
     if isinstance(val, list) and isinstance(val[0], sexpdata.Symbol):
         rtn = {}
         for idx in range(0, len(val), 2):
@@ -47,6 +48,7 @@ def sp_encode(msg: dict) -> str:
     :param msg: message to convert
     :return: S-Expression formatted message
     """
+    import sexpdata  # pylint: disable=import-outside-toplevel
     return sexpdata.dumps(msg)
 
 
@@ -56,6 +58,7 @@ def sp_decode(msg: str) -> dict:
     :param msg: message to convert
     :return: JSON formatted message
     """
+    import sexpdata  # pylint: disable=import-outside-toplevel
     rtn = sexpdata.loads(msg)
     return _sp_decode(rtn)
 
@@ -107,6 +110,7 @@ def xml_encode(msg: dict, *args, **kwargs) -> str:
     if root == None:
         root = "message"    
     
+    import xmltodict  # pylint: disable=import-outside-toplevel
     return xmltodict.unparse({root: msg})
 
 
@@ -121,4 +125,26 @@ def xml_decode(msg: str, *args, **kwargs) -> dict:
     if root == None:
         root = "message"  
     
+    import xmltodict  # pylint: disable=import-outside-toplevel
     return _xml_to_dict(xmltodict.parse(msg))[root]
+
+
+# Message Conversion helpers for YAML
+def yaml_encode(msg: dict) -> str:
+    """
+    Encode the given message to YAML format, using the C dumper if available
+    :param msg: message to convert
+    :return: YAML formatted message
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+    return yaml.dump(msg, Dumper=getattr(yaml, "CDumper", yaml.Dumper))
+
+
+def yaml_decode(msg: str) -> dict:
+    """
+    Decode the given message to JSON format, using the C loader if available
+    :param msg: message to convert
+    :return: JSON formatted message
+    """
+    import yaml  # pylint: disable=import-outside-toplevel
+    return yaml.load(msg, Loader=getattr(yaml, "CLoader", yaml.Loader))
@@ -0,0 +1,401 @@
+"""
+Protobuf Wire Serialization
+Encodes messages in the protobuf wire format using the field numbers of the proto3 schema writer, the JADN field ids,
+so protobuf consumers of the generated `.proto` can read the messages without generated stubs
+"""
+import json
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, NamedTuple, NoReturn, Optional, Tuple, Union
+from ....exceptions import SchemaException
+__all__ = ["ProtoField", "ProtoMessage", "ProtobufCodec", "dumps", "get_codec", "loads"]
+
+# Wire types
+VARINT = 0
+I64 = 1
+LEN = 2
+I32 = 5
+CACHE_SIZE = 8  # Codecs cached for the most recently used schemas
+
+# Value kinds of the primitive types, matching the proto3 writer's field types
+PRIMITIVE_KINDS = {
+    "Binary": "string",  # base64 text, as serialized in JSON
+    "Boolean": "bool",
+    "Integer": "int",    # int64
+    "Number": "number",  # string
+    "String": "string"
+}
+STRUCTURE_TYPES = ("Array", "Choice", "Map", "Record")
+VARINT_KINDS = ("bool", "enum", "int")
+
+
+class ProtoField(NamedTuple):
+    """
+    Wire encoding of a JADN field
+    """
+    number: int               #: Field number, the JADN field id
+    name: str                 #: JADN field name
+    kind: str                 #: Value encoding; bool, enum, int, json, map, message, number, or string
+    repeated: bool = False    #: The field is repeated, the JADN field or its type is an array
+    ref: Optional[str] = None  #: Enumerated, MapOf or message type of the value
+
+
+class ProtoMessage(NamedTuple):
+    """
+    Precomputed field table of a message type
+    """
+    name: str                      #: Name of the JADN type
+    array: bool                    #: JADN Array, values are positional
+    fields: Tuple[ProtoField, ...]  #: Fields in definition order
+    numbers: Dict[int, ProtoField]  #: {field number: field}
+    names: Dict[str, ProtoField]    #: {field name or id: field}
+
+
+class ProtobufCodec:
+    """
+    Protobuf wire encoder/decoder of the messages of a schema, the field tables are built once per type on first use
+    """
+    __slots__ = ("schema", "messages", "enums", "maps", "_lock")
+    schema: "Schema"
+    messages: Dict[str, ProtoMessage]                                # {type name: field table}
+    enums: Dict[str, Tuple[Dict[Any, int], Dict[int, Any]]]          # {type name: (value to number, number to value)}
+    maps: Dict[str, Tuple[ProtoField, ProtoField]]                   # {type name: (key field, value field)}
+    _lock: Lock
+
+    def __init__(self, schema: "Schema"):
+        self.schema = schema
+        self.messages = {}
+        self.enums = {}
+        self.maps = {}
+        self._lock = Lock()
+
+    # Encoding
+    def encode(self, msg: Union[dict, list], root: str) -> bytes:
+        """
+        Encode a message to the protobuf wire format
+        :param msg: message, as serialized in JSON, of the root type
+        :param root: name of the message type
+        :return: encoded message
+        """
+        out = bytearray()
+        self._encode_message(msg, self.message(root), out)
+        return bytes(out)
+
+    def _encode_message(self, msg: Union[dict, list], table: ProtoMessage, out: bytearray) -> NoReturn:
+        if table.array:
+            items = zip(table.fields, msg)
+        elif isinstance(msg, dict):
+            items = []
+            for key, val in msg.items():
+                if (field := table.names.get(key)) is None:
+                    raise ValueError(f"{key} is not a field of {table.name}")
+                items.append((field, val))
+        else:
+            raise TypeError(f"{table.name} is not expected type {dict}, got {type(msg)}")
+
+        for field, val in items:
+            if val is None:
+                continue
+            if field.repeated:
+                if not isinstance(val, (list, tuple)):
+                    raise TypeError(f"{table.name}.{field.name} is not expected type {list}, got {type(val)}")
+                if field.kind in VARINT_KINDS:  # Packed, the proto3 default for scalars
+                    packed = bytearray()
+                    for v in val:
+                        _varint(self._scalar(field, v), packed)
+                    _tag(field.number, LEN, out)
+                    _varint(len(packed), out)
+                    out += packed
+                else:
+                    for v in val:
+                        self._encode_field(field, v, out)
+            else:
+                self._encode_field(field, val, out)
+
+    def _encode_field(self, field: ProtoField, val: Any, out: bytearray) -> NoReturn:
+        kind = field.kind
+        if kind in VARINT_KINDS:
+            _tag(field.number, VARINT, out)
+            _varint(self._scalar(field, val), out)
+            return
+
+        if kind == "string":
+            data = val.encode("utf-8")
+        elif kind in ("json", "number"):
+            data = json.dumps(val).encode("utf-8")
+        elif kind == "message":
+            data = bytearray()
+            self._encode_message(val, self.message(field.ref), data)
+        elif kind == "map":
+            key_field, val_field = self.maps[field.ref]
+            for k, v in (val.items() if isinstance(val, dict) else zip(val[::2], val[1::2])):
+                entry = bytearray()
+                self._encode_field(key_field, k, entry)
+                self._encode_field(val_field, v, entry)
+                _tag(field.number, LEN, out)
+                _varint(len(entry), out)
+                out += entry
+            return
+        else:
+            raise ValueError(f"Unknown protobuf value kind {kind}")
+        _tag(field.number, LEN, out)
+        _varint(len(data), out)
+        out += data
+
+    def _scalar(self, field: ProtoField, val: Any) -> int:
+        if field.kind == "enum":
+            try:
+                return self.enums[field.ref][0][val]
+            except KeyError as err:
+                raise ValueError(f"{val} is not a valid item of {field.ref}") from err
+        if field.kind == "bool":
+            return 1 if val else 0
+        return int(val)
+
+    # Decoding
+    def decode(self, msg: Union[bytes, bytearray, memoryview], root: str) -> Union[dict, list]:
+        """
+        Decode a message from the protobuf wire format
+        :param msg: encoded message
+        :param root: name of the message type
+        :return: message, as serialized in JSON
+        """
+        buf = memoryview(msg)
+        return self._decode_message(buf, 0, len(buf), self.message(root))
+
+    def _decode_message(self, buf: memoryview, pos: int, end: int, table: ProtoMessage) -> Union[dict, list]:
+        values: Dict[ProtoField, Any] = {}
+        while pos < end:
+            key, pos = _read_varint(buf, pos)
+            number, wire = key >> 3, key & 0x07
+            if (field := table.numbers.get(number)) is None:
+                pos = _skip(buf, pos, wire)
+                continue
+            if wire == LEN and field.kind in VARINT_KINDS:  # Packed scalars
+                length, pos = _read_varint(buf, pos)
+                stop = pos + length
+                vals = values.setdefault(field, [])
+                while pos < stop:
+                    raw, pos = _read_varint(buf, pos)
+                    vals.append(self._from_scalar(field, raw))
+                continue
+            val, pos = self._decode_field(buf, pos, wire, field)
+            if field.repeated or field.kind == "map":
+                values.setdefault(field, []).append(val)
+            else:
+                values[field] = val
+        for field, val in values.items():
+            if field.kind == "map" and not field.repeated:
+                # Maps with String or Enumerated name keys are objects, other keys are serialized as [key, value, ...]
+                if all(isinstance(k, str) for k, _ in val):
+                    values[field] = dict(val)
+                else:
+                    values[field] = [i for pair in val for i in pair]
+
+        if table.array:
+            result = [values.get(f) for f in table.fields]
+            while result and result[-1] is None:
+                result.pop()
+            return result
+        return {f.name: v for f, v in values.items()}
+
+    def _decode_field(self, buf: memoryview, pos: int, wire: int, field: ProtoField) -> Tuple[Any, int]:
+        if field.kind in VARINT_KINDS:
+            if wire != VARINT:
+                raise ValueError(f"Invalid wire type {wire} of the field {field.name}")
+            raw, pos = _read_varint(buf, pos)
+            return self._from_scalar(field, raw), pos
+
+        if wire != LEN:
+            raise ValueError(f"Invalid wire type {wire} of the field {field.name}")
+        length, pos = _read_varint(buf, pos)
+        end = pos + length
+        if end > len(buf):
+            raise ValueError(f"Truncated value of the field {field.name}")
+        if field.kind == "string":
+            return str(buf[pos:end], "utf-8"), end
+        if field.kind in ("json", "number"):
+            return json.loads(str(buf[pos:end], "utf-8")), end
+        if field.kind == "message":
+            return self._decode_message(buf, pos, end, self.message(field.ref)), end
+        if field.kind == "map":
+            key_field, val_field = self.maps[field.ref]
+            entry = {}
+            while pos < end:
+                key, pos = _read_varint(buf, pos)
+                number, wire = key >> 3, key & 0x07
+                if number in (1, 2):
+                    entry[number], pos = self._decode_field(buf, pos, wire, key_field if number == 1 else val_field)
+                else:
+                    pos = _skip(buf, pos, wire)
+            return (entry.get(1), entry.get(2)), end
+        raise ValueError(f"Unknown protobuf value kind {field.kind}")
+
+    def _from_scalar(self, field: ProtoField, raw: int) -> Any:
+        if field.kind == "enum":
+            try:
+                return self.enums[field.ref][1][raw]
+            except KeyError as err:
+                raise ValueError(f"{raw} is not a valid item of {field.ref}") from err
+        if field.kind == "bool":
+            return bool(raw)
+        return raw - (1 << 64) if raw >= 1 << 63 else raw
+
+    # Field Tables
+    def message(self, name: str) -> ProtoMessage:
+        """
+        Get the field table of a message type
+        :param name: name of the JADN type
+        :raise SchemaException: the type is not a message type of the schema
+        :return: field table
+        """
+        if (table := self.messages.get(name)) is None:
+            with self._lock:
+                if (table := self.messages.get(name)) is None:
+                    table = self._build_message(name)
+        return table
+
+    def _build_message(self, name: str) -> ProtoMessage:
+        def_cls = self.schema.types.get(name)
+        if def_cls is None or def_cls.data_type not in STRUCTURE_TYPES:
+            raise SchemaException(f"{name} is not a valid message type within the schema")
+        fields = []
+        names = {}
+        for field in def_cls.__fields__.values():
+            info = field.field_info.extra
+            opts = info["options"]
+            kind, ref, repeated = self._kind(info["type"], opts)
+            if opts.isArray():
+                if repeated or kind == "map":  # Nested arrays can't be represented, the value is sent as JSON
+                    kind, ref = "json", None
+                repeated = True
+            proto_field = ProtoField(info["id"], field.alias, kind, repeated, ref)
+            fields.append(proto_field)
+            names[field.alias] = names[str(info["id"])] = proto_field
+        table = ProtoMessage(name, def_cls.data_type == "Array", tuple(fields), {f.number: f for f in fields}, names)
+        self.messages[name] = table
+        return table
+
+    def _kind(self, type_: str, opts=None) -> Tuple[str, Optional[str], bool]:
+        if kind := PRIMITIVE_KINDS.get(type_):
+            return kind, None, False
+        if (def_cls := self.schema.types.get(type_)) is None:
+            # Anonymous types are written as string fields, the derived enumerations are sent as their values
+            return ("string" if type_ == "Enumerated" else "json"), None, False
+
+        data_type = def_cls.data_type
+        if data_type in STRUCTURE_TYPES:
+            if data_type == "Array" and def_cls.__options__.format:  # Formatted arrays are serialized as strings
+                return "string", None, False
+            return "message", type_, False
+        if data_type == "Enumerated":
+            if type_ not in self.enums:
+                by_id = def_cls.__options__.id
+                items = {(f.value.extra["id"] if by_id else f.value.default): f.value.extra["id"] for f in def_cls.__enums__}
+                self.enums[type_] = (items, {v: k for k, v in items.items()})
+            return "enum", type_, False
+        if data_type == "ArrayOf":
+            kind, ref, repeated = self._kind(def_cls.__options__.vtype)
+            if repeated or kind == "map":
+                return "json", None, False
+            return kind, ref, True
+        if data_type == "MapOf":
+            if type_ not in self.maps:
+                opts = def_cls.__options__
+                self.maps[type_] = (self._entry_field(1, "key", opts.ktype), self._entry_field(2, "value", opts.vtype))
+            return "map", type_, False
+        return self._kind(data_type)
+
+    def _entry_field(self, number: int, name: str, type_: str) -> ProtoField:
+        kind, ref, repeated = self._kind(type_)
+        if repeated or kind == "map":  # Map entries hold single values
+            return ProtoField(number, name, "json")
+        return ProtoField(number, name, kind, False, ref)
+
+
+# Wire Helpers
+def _tag(number: int, wire: int, out: bytearray) -> NoReturn:
+    _varint(number << 3 | wire, out)
+
+
+def _varint(value: int, out: bytearray) -> NoReturn:
+    value &= 0xFFFFFFFFFFFFFFFF  # Negative values are sent as 64-bit two's complement
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: memoryview, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(buf) or shift > 63:
+            raise ValueError("Truncated or invalid varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _skip(buf: memoryview, pos: int, wire: int) -> int:
+    if wire == VARINT:
+        return _read_varint(buf, pos)[1]
+    if wire == I64:
+        return pos + 8
+    if wire == LEN:
+        length, pos = _read_varint(buf, pos)
+        return pos + length
+    if wire == I32:
+        return pos + 4
+    raise ValueError(f"Unsupported wire type {wire}")
+
+
+# Codec Cache
+_codecs: "OrderedDict[int, ProtobufCodec]" = OrderedDict()
+_codecs_lock = Lock()
+
+
+def get_codec(schema: "Schema") -> ProtobufCodec:
+    """
+    Get the codec of a schema, the codecs of the most recently used schemas are kept
+    :param schema: schema of the messages
+    :return: protobuf codec
+    """
+    with _codecs_lock:
+        # The cached codec holds the schema, its id is not reused while it is cached
+        if codec := _codecs.get(id(schema)):
+            _codecs.move_to_end(id(schema))
+            return codec
+        codec = _codecs[id(schema)] = ProtobufCodec(schema)
+        if len(_codecs) > CACHE_SIZE:
+            _codecs.popitem(last=False)
+        return codec
+
+
+def dumps(msg: Union[dict, list], schema: "Schema" = None, root: str = None, **kwargs) -> bytes:
+    """
+    Encode a message to the protobuf wire format
+    :param msg: message to encode
+    :param schema: schema of the message
+    :param root: name of the message type
+    :return: encoded message
+    """
+    if schema is None or root is None:
+        raise ValueError("Protobuf serialization requires the `schema` and `root` type of the message")
+    return get_codec(schema).encode(msg, root)
+
+
+def loads(msg: Union[bytes, bytearray, memoryview], schema: "Schema" = None, root: str = None, **kwargs) -> Union[dict, list]:
+    """
+    Decode a message from the protobuf wire format
+    :param msg: message to decode
+    :param schema: schema of the message
+    :param root: name of the message type
+    :return: decoded message
+    """
+    if schema is None or root is None:
+        raise ValueError("Protobuf serialization requires the `schema` and `root` type of the message")
+    return get_codec(schema).decode(msg, root)
@@ -15,6 +15,7 @@ class SchemaFormats(str, EnumBase):
     # JAS = "jas"        #: Convert to [JAS Format]()
     MarkDown = "md"    #: Convert to MarkDown Format
     # Proto = "proto"    #: Convert to [ProtoBuf Format](https://developers.google.com/protocol-buffers/docs/proto3)
+    Python = "py"      #: Convert to an importable Python module of the definitions
     # Relax = "rng"      #: Convert to [RelaxNG Format](https://relaxng.org/spec-20011203.html)
     # Thrift = "thrift"  #: Convert to [Thrift Format](https://thrift.apache.org/)
     JSON = "json"        #: Using JADN PyPkg, no logic in JADN Schema 
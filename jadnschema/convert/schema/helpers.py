@@ -2,8 +2,10 @@
 Converter helpers
 """
 from pathlib import Path
-from typing import Callable, Literal, Union
+from typing import Callable, Literal, Optional, Union
 from .enums import CommentLevels, SchemaFormats
+from .readers import load_reader
+from .writers import load_writer
 from ...schema import Schema
 from ...utils import FrozenDict
 __all__ = [
@@ -20,6 +22,19 @@ registered = FrozenDict(
 
 
 # Helper
+def get_registered(rw: Literal["reader", "writer"], fmt: str) -> Optional[Callable]:
+    """
+    Get the registered converter of the given format, importing the converter module if not yet registered
+    :param rw: registered as a reader or writer
+    :param fmt: format of the converter
+    :return: converter class or None if the format has no converter
+    """
+    if (cls := registered[rw].get(fmt, None)) is None:
+        if (load_reader if rw == "reader" else load_writer)(fmt):
+            cls = registered[rw].get(fmt, None)
+    return cls
+
+
 def register(rw: Literal["reader", "writer"], fmt: Union[str, Callable] = None, override: bool = False) -> Callable:
     """
     Decorator for a class to register it as a JADN converter
@@ -77,7 +92,7 @@ def dump(schema: Union[dict, str, Schema], fname: str, source: str = "", comm: s
     :param fmt: format of the desired output schema
     :return: None
     """
-    cls = registered["writer"].get(fmt, None)
+    cls = get_registered("writer", fmt)
     if cls:
         comm = comm if comm in CommentLevels else CommentLevels.ALL
         return cls(schema, comm).dump(fname, source, **kwargs)
@@ -93,7 +108,7 @@ def dumps(schema: Union[dict, str, Schema], comm: str = CommentLevels.ALL, fmt:
     :param fmt: format of the desired output schema
     :return: formatted schema
     """
-    cls = registered["writer"].get(fmt, None)
+    cls = get_registered("writer", fmt)
     if cls:
         comm = comm if comm in CommentLevels else CommentLevels.ALL
         return cls(schema, comm).dumps(**kwargs)
@@ -108,7 +123,7 @@ def load(schema: Union[str, Path], fmt: SchemaFormats = SchemaFormats.JADN, **kw
     :param fmt: format of the input schema
     :return: loaded JADN schema
     """
-    if cls := registered["reader"].get(fmt, None):
+    if cls := get_registered("reader", fmt):
         return cls().load(schema).parse_schema(**kwargs)
 
     raise ReferenceError(f"The format specified is not a known format - {fmt}")
@@ -121,7 +136,7 @@ def loads(schema: Union[bytes, bytearray, str], fmt: SchemaFormats = SchemaForma
     :param fmt: format of the input schema
     :return: loaded JADN schema
     """
-    if cls := registered["reader"].get(fmt, None):
+    if cls := get_registered("reader", fmt):
         return cls().loads(schema).parse_schema(**kwargs)
 
     raise ReferenceError(f"The format specified is not a known format - {fmt}")
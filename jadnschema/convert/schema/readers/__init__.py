@@ -1,33 +1,58 @@
 """
 JADN conversion readers
+Reader modules are imported on first use of one of their functions or formats
 """
-from .baseReader import BaseReader
-# from .cddl import cddl_load, cddl_loads
-# from .graphviz import dot_load, dot_loads
-# from .html import html_load, html_loads
-from .jadn import jadn_load, jadn_loads
-# from .jadn_idl import jidl_load, jidl_loads
-# from .jas import jas_load, jas_loads
-from .json_schema import json_load, json_loads
-# from .markdown import md_load, md_loads
-# from .proto import proto_load, proto_loads
-# from .relax_ng import relax_load, relax_loads
-# from .thrift import thrift_load, thrift_loads
-# from .xsd import xsd_load, xsd_loads
-
-__all__ = [
-    "BaseReader",
+from importlib import import_module
+from typing import Any
+from ....utils import FrozenDict
+
+# Module of each public name
+READER_MODULES = FrozenDict(
+    BaseReader=".baseReader",
     # Convert Functions
-    # "cddl_load", "cddl_loads",
-    # "dot_load", "dot_loads",
-    # "html_load", "html_loads",
-    "jadn_load", "jadn_loads",
-    # "jidl_load", "jidl_loads",
-    # "jas_load", "jas_loads",
-    "json_load", "json_loads",
-    # "md_load", "md_loads",
-    # "proto_load", "proto_loads",
-    # "relax_load", "relax_loads",
-    # "thrift_load", "thrift_loads",
-    # "xsd_load", "xsd_loads"
-]
+    # cddl_load=".cddl", cddl_loads=".cddl",
+    # dot_load=".graphviz", dot_loads=".graphviz",
+    # html_load=".html", html_loads=".html",
+    jadn_load=".jadn", jadn_loads=".jadn",
+    jidl_load=".jadn_idl", jidl_loads=".jadn_idl",
+    # jas_load=".jas", jas_loads=".jas",
+    json_load=".json_schema", json_loads=".json_schema",
+    # md_load=".markdown", md_loads=".markdown",
+    # proto_load=".proto", proto_loads=".proto",
+    # relax_load=".relax_ng", relax_loads=".relax_ng",
+    # thrift_load=".thrift", thrift_loads=".thrift",
+    # xsd_load=".xsd", xsd_loads=".xsd"
+)
+
+# Module of each registered reader format
+READER_FORMATS = FrozenDict(
+    jadn=".jadn",
+    jidl=".jadn_idl",
+    json=".json_schema"
+)
+
+__all__ = list(READER_MODULES)
+
+
+def load_reader(fmt: str) -> bool:
+    """
+    Import the reader module of the given format so the reader is registered
+    :param fmt: format of the reader
+    :return: True/False if the format has a reader module
+    """
+    if module := READER_FORMATS.get(fmt):
+        import_module(module, __name__)
+        return True
+    return False
+
+
+def __getattr__(name: str) -> Any:
+    if module := READER_MODULES.get(name):
+        attr = getattr(import_module(module, __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *READER_MODULES})
@@ -0,0 +1,361 @@
+"""
+JADN IDL to JADN
+Single pass tokenizer and line parser that builds the JADN type definitions directly from the JIDL text
+"""
+import json
+import re
+
+from pathlib import Path
+from typing import List, NoReturn, Optional, Tuple, Union
+from .baseReader import BaseReader
+from ..helpers import register_reader
+from ....exceptions import FormatError
+from ....schema import Schema
+from ....schema.consts import OPTIONS, OPTION_ID
+__pdoc__ = {
+    "IDLtoJADN.format": "File extension of the given format"
+}
+
+# JIDL tokens, matched in order at the current position
+TOKENS = re.compile(r"""
+    (?P<nl>\n)
+    |(?P<ws>[ \t\r\f\v]+)
+    |(?P<block>/\*[\s\S]*?\*/)
+    |(?P<desc>//[^\n]*)
+    |(?P<format>(?<=\s)/[A-Za-z][-\w]*)
+    |(?P<pattern>\(%.*?%\))
+    |(?P<range>\{(?:"(?:[^"\\\n]|\\.)*"|[^}"\n])*\})
+    |(?P<mult>\[[^\]\n]*\])
+    |(?P<punct>[=(),:])
+    |(?P<word>[^\s=(),:\[\]{}"/]+(?::[^\s=(),:\[\]{}"/]+)*/?)
+    |(?P<error>.)
+""", re.VERBOSE)
+WHITESPACE = re.compile(r"[ \t\r\f\v]*")
+FIELD_NAME = re.compile(r"^([^:]+)::\s*(.*)$")
+KEYWORDS = ("unique", "set", "unordered")
+FUNCTIONS = {"enum": OPTION_ID["enum"], "pointer": OPTION_ID["pointer"], "tagid": OPTION_ID["tagid"]}
+OPTION_ORDER = {chr(k): v[2] for k, v in OPTIONS.items()}
+
+Token = Tuple[str, str, int]  # (kind, text, position)
+
+
+class IDLParser:
+    """
+    Parser of a JIDL document, errors are reported with the line and column of the invalid token
+    """
+    __slots__ = ("text", "info", "types", "_line", "_line_start")
+    text: str
+    info: dict
+    types: List[list]
+    _line: int
+    _line_start: int
+
+    def __init__(self, text: str):
+        self.text = text
+        self.info = {}
+        self.types = []
+        self._line = 1
+        self._line_start = 0
+
+    def parse(self) -> dict:
+        """
+        Parse the JIDL document
+        :raise FormatError: invalid JIDL, the message gives the line and column
+        :return: JADN schema
+        """
+        text = self.text
+        match = TOKENS.match
+        pos = 0
+        end = len(text)
+        tokens: List[Token] = []
+        desc: Optional[Token] = None
+        while pos < end:
+            m = match(text, pos)
+            kind = m.lastgroup
+            pos = m.end()
+            if kind == "nl":
+                if tokens:
+                    self._parse_line(tokens, desc)
+                tokens = []
+                desc = None
+                self._line += 1
+                self._line_start = pos
+            elif kind == "ws":
+                continue
+            elif kind == "punct" and m.group() == ":" and len(tokens) == 1 and tokens[0][0] == "word":
+                # Info values are JSON, decoded from the text instead of tokenized
+                pos = self._parse_info(tokens[0], pos)
+                tokens = []
+            elif kind == "desc":
+                desc = (kind, m.group()[2:].strip(), m.start())
+            elif kind == "block":
+                self._newlines(m.start(), pos)
+            elif kind == "error":
+                self._error(m.start(), f"unexpected character {m.group()!r}")
+            else:
+                tokens.append((kind, m.group(), m.start()))
+        if tokens:
+            self._parse_line(tokens, desc)
+        self._close_type()
+        return {"info": self.info, "types": self.types} if self.info else {"types": self.types}
+
+    # Line Parsers
+    def _parse_line(self, tokens: List[Token], desc: Optional[Token]) -> NoReturn:
+        first = tokens[0]
+        if len(tokens) > 1 and tokens[1][1] == "=":
+            self._parse_type(tokens, desc)
+        elif first[0] == "word" and first[1].isdigit():
+            self._parse_field(tokens, desc)
+        else:
+            self._error(first[2], f"expected a type definition or field, found {first[1]!r}")
+
+    def _parse_info(self, key: Token, pos: int) -> int:
+        pos = WHITESPACE.match(self.text, pos).end()
+        try:
+            value, end = json.JSONDecoder().raw_decode(self.text, pos)
+        except json.JSONDecodeError as err:
+            self._error(err.pos, f"invalid value of {key[1]} - {err.msg}")
+        self._newlines(pos, end)
+        self.info[key[1]] = value
+        # Only whitespace or a comment may follow the value
+        end = WHITESPACE.match(self.text, end).end()
+        if (rest := TOKENS.match(self.text, end)) and rest.lastgroup not in ("nl", "desc", "block"):
+            self._error(end, f"unexpected {rest.group()!r} after the value of {key[1]}")
+        return end
+
+    def _parse_type(self, tokens: List[Token], desc: Optional[Token]) -> NoReturn:
+        self._close_type()
+        name = tokens[0]
+        if name[0] != "word":
+            self._error(name[2], f"invalid type name {name[1]!r}")
+        base, opts, field_opts, idx = self._parse_typestr(tokens, 2)
+        if idx < len(tokens):
+            self._error(tokens[idx][2], f"unexpected {tokens[idx][1]!r} in the definition of {name[1]}")
+        if field_opts:
+            self._error(name[2], f"field options are not valid for the type {name[1]}")
+        self.types.append([name[1], base, opts, desc[1] if desc else "", []])
+
+    def _parse_field(self, tokens: List[Token], desc: Optional[Token]) -> NoReturn:
+        if not self.types:
+            self._error(tokens[0][2], "field without a type definition")
+        type_def = self.types[-1]
+        fields = type_def[4]
+        fid = int(tokens[0][1])
+        fdesc = desc[1] if desc else ""
+        id_type = type_def[1] == "Array" or OPTION_ID["id"] in type_def[2]
+
+        if type_def[1] == "Enumerated":
+            if id_type:
+                if len(tokens) > 1:
+                    self._error(tokens[1][2], f"unexpected {tokens[1][1]!r} in an Enumerated.ID item")
+                name, fdesc = self._split_name(tokens[0], fdesc)
+            else:
+                if len(tokens) < 2:
+                    self._error(tokens[0][2], "Enumerated item without a value")
+                name = self.text[tokens[1][2]:tokens[-1][2] + len(tokens[-1][1])]
+            fields.append([fid, name, fdesc])
+            return
+
+        idx = 1
+        if id_type:
+            name, fdesc = self._split_name(tokens[0], fdesc)
+        else:
+            if len(tokens) < 3 or tokens[1][0] != "word":
+                self._error(tokens[min(1, len(tokens) - 1)][2], "field without a name and type")
+            name = tokens[1][1]
+            idx = 2
+        ftype, topts, fopts, idx = self._parse_typestr(tokens, idx)
+        if ftype in ("Key", "Link"):
+            self._error(tokens[idx - 1][2], f"{ftype} requires a type")
+        if name.endswith("/"):
+            name = name[:-1]
+            fopts.append(OPTION_ID["dir"])
+
+        minc = maxc = 1
+        for kind, text, pos in tokens[idx:]:
+            if kind == "mult":
+                minc, maxc = self._multiplicity(text, pos)
+            elif text == "optional":
+                minc = 0
+            else:
+                self._error(pos, f"unexpected {text!r} in the field {name}")
+        if minc != 1:
+            fopts.append(f"{OPTION_ID['minc']}{minc}")
+        if maxc != 1:
+            fopts.append(f"{OPTION_ID['maxc']}{maxc}")
+        fields.append([fid, name, ftype, self._sort(fopts + topts), fdesc])
+
+    def _close_type(self) -> NoReturn:
+        """Replace the field names of the TagId options of the last type with the field ids"""
+        if not self.types:
+            return
+        fields = self.types[-1][4]
+        tagid = OPTION_ID["tagid"]
+        for field in fields:
+            if len(field) > 3:
+                for i, opt in enumerate(field[3]):
+                    if opt[0] == tagid and not opt[1:].isdigit():
+                        ids = {f[1]: f[0] for f in fields}
+                        if opt[1:] not in ids:
+                            raise FormatError(f"JIDL: TagId field {opt[1:]} is not a field of {self.types[-1][0]}")
+                        field[3][i] = f"{tagid}{ids[opt[1:]]}"
+
+    # Type String Parsers
+    def _parse_typestr(self, tokens: List[Token], idx: int) -> Tuple[str, List[str], List[str], int]:
+        """
+        Parse a type string starting at the given token
+        :return: base type, type options, field options, index of the token after the type string
+        """
+        if idx >= len(tokens) or tokens[idx][0] != "word":
+            self._error(tokens[min(idx, len(tokens) - 1)][2], "expected a type")
+        field_opts = []
+        name = tokens[idx][1]
+        if name in ("Key", "Link") and idx + 1 < len(tokens) and tokens[idx + 1][1] == "(":
+            # Key(TypeString) / Link(TypeString)
+            field_opts.append(OPTION_ID[name.lower()])
+            base, opts, inner, idx = self._parse_typestr(tokens, idx + 2)
+            if idx >= len(tokens) or tokens[idx][1] != ")":
+                self._error(tokens[idx - 1][2], f"unclosed {name}(")
+            return base, opts, field_opts + inner, idx + 1
+
+        opts = []
+        idx += 1
+        if name.endswith(".ID"):
+            name = name[:-3]
+            opts.append(OPTION_ID["id"])
+        if idx < len(tokens) and tokens[idx][1] == "(":
+            idx = self._parse_args(tokens, idx + 1, name, opts, field_opts)
+        while idx < len(tokens):
+            kind, text, pos = tokens[idx]
+            if kind == "range":
+                opts.extend(self._range(name, text, pos))
+            elif kind == "pattern":
+                opts.append(f"{OPTION_ID['pattern']}{text[2:-2]}")
+            elif kind == "format":
+                opts.append(f"{OPTION_ID['format']}{text[1:]}")
+            elif kind == "word" and text in KEYWORDS:
+                opts.append(OPTION_ID[text])
+            else:
+                break
+            idx += 1
+        return name, self._sort(opts), field_opts, idx
+
+    def _parse_args(self, tokens: List[Token], idx: int, name: str, opts: List[str], field_opts: List[str]) -> int:
+        args = []
+        while idx < len(tokens) and tokens[idx][1] != ")":
+            kind, text, pos = tokens[idx]
+            if kind != "word":
+                self._error(pos, f"unexpected {text!r} in the arguments of {name}")
+            if idx + 1 < len(tokens) and tokens[idx + 1][0] == "mult":
+                func = text.lower()
+                if func not in FUNCTIONS:
+                    self._error(pos, f"unknown function {text}")
+                text = f"{FUNCTIONS[func]}{tokens[idx + 1][1][1:-1]}"
+                idx += 1
+            args.append((text, pos))
+            idx += 1
+            if idx < len(tokens) and tokens[idx][1] == ",":
+                idx += 1
+        if idx >= len(tokens):
+            self._error(tokens[-1][2], f"unclosed arguments of {name}")
+        if len(args) != (2 if name == "MapOf" else 1):
+            self._error(tokens[idx][2], f"invalid number of arguments of {name}")
+
+        if name == "MapOf":
+            opts.extend((f"{OPTION_ID['ktype']}{args[0][0]}", f"{OPTION_ID['vtype']}{args[1][0]}"))
+        elif name == "ArrayOf":
+            opts.append(f"{OPTION_ID['vtype']}{args[0][0]}")
+        elif args[0][0][0] == OPTION_ID["tagid"]:
+            field_opts.append(args[0][0])
+        elif args[0][0][0] in (OPTION_ID["enum"], OPTION_ID["pointer"]):
+            opts.append(args[0][0])
+        else:
+            self._error(args[0][1], f"{args[0][0]} is not a valid argument of {name}")
+        return idx + 1
+
+    def _range(self, name: str, text: str, pos: int) -> List[str]:
+        body = text[1:-1].strip()
+        if body.startswith("pattern="):
+            # The pattern is the raw text between the quotes, it is not escaped
+            if len(body) < 10 or body[8] != '"' or body[-1] != '"':
+                self._error(pos, f"invalid pattern {body[8:]}")
+            return [f"{OPTION_ID['pattern']}{body[9:-1]}"]
+        lo, sep, hi = body.partition("..")
+        hi = hi if sep else lo  # A single value is an exact size
+        try:
+            if name == "Number":
+                return [f"{OPTION_ID[k]}{float(v)}" for k, v in (("minf", lo), ("maxf", hi)) if v != "*"]
+            if name != "Integer" and lo != "*" and int(lo) == 0:
+                lo = "*"  # Default minimum size
+            return [f"{OPTION_ID[k]}{int(v)}" for k, v in (("minv", lo), ("maxv", hi)) if v != "*"]
+        except ValueError:
+            self._error(pos, f"invalid range {text}")
+
+    # Helpers
+    def _multiplicity(self, text: str, pos: int) -> Tuple[int, int]:
+        lo, sep, hi = text[1:-1].partition("..")
+        try:
+            minc = int(lo)
+            maxc = (0 if hi == "*" else int(hi)) if sep else minc
+        except ValueError:
+            self._error(pos, f"invalid multiplicity {text}")
+        return minc, maxc
+
+    def _split_name(self, token: Token, desc: str) -> Tuple[str, str]:
+        if m := FIELD_NAME.match(desc):
+            return m.group(1), m.group(2)
+        self._error(token[2], "expected the field name as `// name:: description`")
+
+    @staticmethod
+    def _sort(opts: List[str]) -> List[str]:
+        return sorted(opts, key=lambda o: OPTION_ORDER.get(o[0], 0))
+
+    def _newlines(self, start: int, end: int) -> NoReturn:
+        """Track the line of a token spanning lines"""
+        if (count := self.text.count("\n", start, end)) > 0:
+            self._line += count
+            self._line_start = self.text.rfind("\n", start, end) + 1
+
+    def _error(self, pos: int, msg: str) -> NoReturn:
+        line = self._line - self.text.count("\n", pos, self._line_start) if pos < self._line_start else self._line
+        column = pos - self.text.rfind("\n", 0, pos)
+        raise FormatError(f"JIDL line {line}, column {column}: {msg}")
+
+
+# Conversion Class
+@register_reader
+class IDLtoJADN(BaseReader):  # pylint: disable=abstract-method
+    format = "jidl"
+
+    def parse_jadn(self, **kwargs) -> dict:
+        """
+        Parse the JIDL schema into the JADN type definitions without creating the schema definitions
+        :return: JADN schema
+        """
+        return IDLParser(self._schema.getvalue()).parse()
+
+    def parse_schema(self, **kwargs) -> Schema:
+        return Schema.parse_obj(self.parse_jadn(**kwargs))
+
+
+# Reader Functions
+def jidl_load(schema: Union[str, Path], **kwargs) -> Schema:
+    """
+    Convert the JIDL schema file to JADN
+    :param schema: Schema to convert
+    :param kwargs: key/value args for the conversion
+    :return: JADN schema
+    """
+    return IDLtoJADN.load(schema).parse_schema(**kwargs)
+
+
+def jidl_loads(schema: Union[bytes, bytearray, str], **kwargs) -> Schema:
+    """
+    Convert the JIDL schema to JADN
+    :param schema: Schema to convert
+    :param kwargs: key/value args for the conversion
+    :return: JADN schema
+    """
+    if isinstance(schema, (bytes, bytearray)):
+        schema = schema.decode("utf-8")
+    return IDLtoJADN.loads(schema).parse_schema(**kwargs)
@@ -1,39 +1,68 @@
 """
 JADN conversion writers
+Writer modules are imported on first use of one of their functions or formats
 """
-from .baseWriter import BaseWriter
-from .cddl import cddl_dump, cddl_dumps
-from .graphviz import dot_dump, dot_dumps
-from .html import html_dump, html_dumps
-from .jadn import jadn_dump, jadn_dumps
-from .jadn_idl import jidl_dump, jidl_dumps
-# from .jas import jas_dump, jas_dumps
-from .json_schema import json_dump, json_dumps, validate_schema
-from .markdown import md_dump, md_dumps
-from .proto import proto_dump, proto_dumps
-from .relax_ng import relax_dump, relax_dumps
-from .thrift import thrift_dump, thrift_dumps
-# from .xsd import xsd_dump, xsd_dumps
-from .plant_w import plant_dump, plant_dumps
-from .js_to_jadn import json_to_jadn_dump, json_to_jadn_dumps
-
-__all__ = [
+from importlib import import_module
+from typing import Any
+from ....utils import FrozenDict
+
+# Module of each public name
+WRITER_MODULES = FrozenDict(
     # Base
-    "BaseWriter",
+    BaseWriter=".baseWriter",
     # Convert Functions
-    "cddl_dump", "cddl_dumps",
-    "dot_dump", "dot_dumps",
-    "html_dump", "html_dumps",
-    "jadn_dump", "jadn_dumps",
-    "json_to_jadn_dump", "json_to_jadn_dumps",
-    "jidl_dump", "jidl_dumps",
-    # "jas_dump", "jas_dumps",
-    "json_dump", "json_dumps",
-    "md_dump", "md_dumps",
-    "plant_dump", "plant_dumps",
-    "proto_dump", "proto_dumps",
-    "relax_dump", "relax_dumps",
-    "thrift_dump", "thrift_dumps",
-    "validate_schema",
-    # "xsd_dump", "xsd_dumps"
-]
+    cddl_dump=".cddl", cddl_dumps=".cddl",
+    dot_dump=".graphviz", dot_dumps=".graphviz",
+    html_dump=".html", html_dumps=".html",
+    jadn_dump=".jadn", jadn_dumps=".jadn",
+    json_to_jadn_dump=".js_to_jadn", json_to_jadn_dumps=".js_to_jadn",
+    jidl_dump=".jadn_idl", jidl_dumps=".jadn_idl",
+    # jas_dump=".jas", jas_dumps=".jas",
+    json_dump=".json_schema", json_dumps=".json_schema",
+    md_dump=".markdown", md_dumps=".markdown",
+    plant_dump=".plant_w", plant_dumps=".plant_w",
+    proto_dump=".proto", proto_dumps=".proto",
+    py_dump=".python", py_dumps=".python",
+    relax_dump=".relax_ng", relax_dumps=".relax_ng",
+    thrift_dump=".thrift", thrift_dumps=".thrift",
+    validate_schema=".json_schema", validate_schemas=".json_schema",
+    # xsd_dump=".xsd", xsd_dumps=".xsd"
+)
+
+# Module of each registered writer format
+WRITER_FORMATS = FrozenDict(
+    gv=".graphviz",
+    html=".html",
+    jadn=".jadn",
+    jidl=".jadn_idl",
+    json=".json_schema",
+    md=".markdown",
+    py=".python",
+    rng=".relax_ng"
+)
+
+__all__ = list(WRITER_MODULES)
+
+
+def load_writer(fmt: str) -> bool:
+    """
+    Import the writer module of the given format so the writer is registered
+    :param fmt: format of the writer
+    :return: True/False if the format has a writer module
+    """
+    if module := WRITER_FORMATS.get(fmt):
+        import_module(module, __name__)
+        return True
+    return False
+
+
+def __getattr__(name: str) -> Any:
+    if module := WRITER_MODULES.get(name):
+        attr = getattr(import_module(module, __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *WRITER_MODULES})
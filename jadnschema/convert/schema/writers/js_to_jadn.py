@@ -1,7 +1,7 @@
 import jadn
 import json
 from jadn.definitions import TypeName
-from typing import Union
+from typing import Dict, Union
 from ..enums import CommentLevels
 from ..helpers import register_writer
 from ....schema import Schema
@@ -9,38 +9,6 @@ from ....schema import Schema
 DEBUG = False
 D = [(f'${n}' if DEBUG else '') for n in range(10)]
 
-jss: dict = {}
-jssx: dict = {}
-
-def typedefname(jsdef: str) -> str:
-    """
-    Infer type name from a JSON Schema definition
-    """
-    assert isinstance(jsdef, str), f'Not a type definition name: {jsdef}'
-    if d := jss['definitions'].get(jsdef, ''):
-        if ':' in jsdef:  # qualified definition name
-            return maketypename('', jsdef.split(':', maxsplit=1)[1]) + D[1]
-        if ref := d.get('$ref', ''):
-            return ref.removeprefix('#/definitions/')+ D[2]
-    return jsdef.removeprefix('#/definitions/') + D[0]     # Exact type name or none
-
-
-def typerefname(jsref: dict) -> str:
-    """
-    Infer a type name from a JSON Schema property reference
-    """
-    if (t := jsref.get('type', '')) in ('string', 'integer', 'number', 'boolean'):
-        return t.capitalize() + D[4]    # Built-in type
-    if ref := jsref.get('$ref', ''):
-        td = jssx.get(ref, ref)
-        if td.startswith('#/definitions/'):  # Exact type name
-            return td.removeprefix('#/definitions/') + D[5]
-        if ':' in td:
-            return maketypename('', td.split(':', maxsplit=1)[1]) + D[6]  # Extract type name from $id
-        if td2 := jss['definitions'].get(td, {}):
-            return typerefname(td2) + D[7]
-    return ''
-
 
 def singular(name: str) -> str:
     """
@@ -56,137 +24,195 @@ def singular(name: str) -> str:
     return name + '-item'
 
 
-def maketypename(tn: str, name: str) -> str:
-    """
-    Convert a type and property name to type name
-    """
-    tn = typedefname(tn)
-    name = f'{tn}${name}' if tn else name.capitalize()
-    return name + '1' if jadn.definitions.is_builtin(name) else name
-
-
-def scandef(tn: str, tv: dict, nt: list):
+class JSONSchemaToJADN:
     """
-    Process nested type definitions, add to list nt
+    Converter of a single JSON Schema to JADN, holds the state of one conversion so conversions can run concurrently
+    The $id and type name indexes are built once per JSON Schema, references are resolved by lookup
     """
-
-    if not (td := define_jadn_type(tn, tv)):
-        return
-    nt.append(td)
-    if tv.get('type', '') == 'object':
-        for k, v in tv.get('properties', {}).items():
-            if v.get('$ref', '') or v.get('type', '') in ('string', 'number', 'integer', 'boolean'):     # Not nested
-                pass
-            elif v.get('type', '') == 'array':
-                scandef(maketypename('', k), v, nt)
-                scandef(singular(maketypename('', k)), v['items'], nt)  # TODO: primitive with options or none
-            elif v.get('anyOf', '') or v.get('allOf', ''):
-                scandef(maketypename(tn, k), v, nt)
-            elif typerefname(v):
-                print('  nested property type:', f'{td[TypeName]}${k}', v)
-
-        if not tn:
-            print(f'  nested type: "{tv.get("title", "")}"')
-    elif (tc := tv.get('anyOf', '')) or (tc := tv.get('allOf', '')):
-        for n, v in enumerate(tc, start=1):
-            scandef(maketypename(tn, n), v, nt)
-    pass
-
-
-def define_jadn_type(tn: str, tv: dict) -> list:
-    topts = []
-    tdesc = tv.get('description', '')
-    fields = []
-    if (jstype := tv.get('type', '')) == 'object':
-        basetype = 'Record'
-        req = tv.get('required', [])
-        for n, (k, v) in enumerate(tv.get('properties', {}).items(), start=1):
-            fopts = ['[0'] if k not in req else []
-            fdesc = v.get('description', '')
-            if v.get('type', '') == 'array':
-                ftype = maketypename('', k)
-                idesc = jss['definitions'].get(jssx.get(v['items'].get('$ref', ''), ''), {}).get('description', '')
-                fdesc = fdesc if fdesc else v['items'].get('description', idesc)
-            elif v.get('type', '') == 'object':
-                ftype = tn
-            elif t := jssx.get(v.get('$ref', ''), ''):
-                rt = jss['definitions'][t].get('$ref', '')
-                ftype = typedefname(rt if rt else t)
-                ft = jss['definitions'][t]
-                fdesc = ft.get('description', '')
-            elif v.get('anyOf', '') or v.get('allOf', ''):
-                ftype = maketypename(tn, k)
-            else:
-                ftype = typerefname(v)
-            fdef = [n, k, ftype, fopts, fdesc]
-            if not ftype:
-                raise ValueError(f'  empty field type {tn}${k}')
-            fields.append(fdef)
-    elif (td := tv.get('anyOf', '')) or (td := tv.get('allOf', '')):
-        basetype = 'Choice'
-        # topts = ['<', '∪'] if 'allOf' in tv else ['<']    # TODO: update Choice in JADN library
-        # topts = ['∪'] if 'allOf' in tv else []
-        for n, v in enumerate(td, start=1):
-            fd = typerefname(v)
-            ftype = fd if fd else maketypename(tn, n)
-            fdef = [n, f'c{n}', ftype, [], '']
-            fields.append(fdef)
-    elif td := tv.get('enum', ''):
-        basetype = 'Enumerated'
-        for n, v in enumerate(td, start=1):
-            fields.append([n, v, ''])
-    elif jstype == 'array':     # TODO: process individual items
-        basetype = 'ArrayOf'
-        topts = [f'{{{tv["minItems"]}'] if 'minItems' in tv else []
-        topts.append(f'}}{tv["maxItems"]}') if 'maxItems' in tv else []
-        ref = jss['definitions'].get(jssx.get(tv['items'].get('$ref', ''), ''), {})
-        tr = typerefname(ref)
-        tr = tr if tr else typerefname(tv['items'])
-        tr = tr if tr else singular(tn)
-        topts.append(f'*{tr}')
-    elif jstype in ('string', 'integer', 'number', 'boolean'):
-        if p := tv.get('pattern', ''):
-            topts.append(f'%{p}')
-        basetype = jstype.capitalize()
-    else:
-        return []
-
-    return [typedefname(tn), basetype, topts, tdesc, fields]
+    __slots__ = ('jss', 'definitions', 'ids', '_def_names', '_ref_names')
+    jss: dict                       # JSON Schema to convert
+    definitions: Dict[str, dict]    # {definition name: definition}
+    ids: Dict[str, str]             # {$id or definition name: definition name}
+    _def_names: Dict[str, str]      # {definition name or reference: type name}
+    _ref_names: Dict[str, str]      # {$ref: type name}
+
+    def __init__(self, schema: Union[str, dict]):
+        self.jss = json.loads(schema) if isinstance(schema, str) else schema
+        self.definitions = self.jss.get('definitions', {})
+        self.ids = {v.get('$id', k): k for k, v in self.definitions.items()}    # Index from $id to definition
+        self._def_names = {}
+        self._ref_names = {}
+
+    def typedefname(self, jsdef: str) -> str:
+        """
+        Infer type name from a JSON Schema definition
+        """
+        if (name := self._def_names.get(jsdef)) is None:
+            assert isinstance(jsdef, str), f'Not a type definition name: {jsdef}'
+            name = self._def_names[jsdef] = self._typedefname(jsdef)
+        return name
+
+    def _typedefname(self, jsdef: str) -> str:
+        if d := self.definitions.get(jsdef, ''):
+            if ':' in jsdef:  # qualified definition name
+                return self.maketypename('', jsdef.split(':', maxsplit=1)[1]) + D[1]
+            if ref := d.get('$ref', ''):
+                return ref.removeprefix('#/definitions/') + D[2]
+        return jsdef.removeprefix('#/definitions/') + D[0]     # Exact type name or none
+
+    def typerefname(self, jsref: dict) -> str:
+        """
+        Infer a type name from a JSON Schema property reference
+        """
+        if (t := jsref.get('type', '')) in ('string', 'integer', 'number', 'boolean'):
+            return t.capitalize() + D[4]    # Built-in type
+        if ref := jsref.get('$ref', ''):
+            if (name := self._ref_names.get(ref)) is None:
+                name = self._ref_names[ref] = self._refname(ref)
+            return name
+        return ''
+
+    def _refname(self, ref: str) -> str:
+        td = self.ids.get(ref, ref)
+        if td.startswith('#/definitions/'):  # Exact type name
+            return td.removeprefix('#/definitions/') + D[5]
+        if ':' in td:
+            return self.maketypename('', td.split(':', maxsplit=1)[1]) + D[6]  # Extract type name from $id
+        if td2 := self.definitions.get(td, {}):
+            return self.typerefname(td2) + D[7]
+        return ''
+
+    def refdef(self, jsref: dict) -> dict:
+        """
+        Get the definition referenced by a JSON Schema property reference
+        """
+        return self.definitions.get(self.ids.get(jsref.get('$ref', ''), ''), {})
+
+    def maketypename(self, tn: str, name: str) -> str:
+        """
+        Convert a type and property name to type name
+        """
+        tn = self.typedefname(tn)
+        name = f'{tn}${name}' if tn else name.capitalize()
+        return name + '1' if jadn.definitions.is_builtin(name) else name
+
+    def scandef(self, tn: str, tv: dict, nt: list):
+        """
+        Process nested type definitions, add to list nt
+        """
+        if not (td := self.define_jadn_type(tn, tv)):
+            return
+        nt.append(td)
+        if tv.get('type', '') == 'object':
+            for k, v in tv.get('properties', {}).items():
+                if v.get('$ref', '') or v.get('type', '') in ('string', 'number', 'integer', 'boolean'):     # Not nested
+                    pass
+                elif v.get('type', '') == 'array':
+                    self.scandef(self.maketypename('', k), v, nt)
+                    self.scandef(singular(self.maketypename('', k)), v['items'], nt)  # TODO: primitive with options or none
+                elif v.get('anyOf', '') or v.get('allOf', ''):
+                    self.scandef(self.maketypename(tn, k), v, nt)
+                elif self.typerefname(v):
+                    print('  nested property type:', f'{td[TypeName]}${k}', v)
+
+            if not tn:
+                print(f'  nested type: "{tv.get("title", "")}"')
+        elif (tc := tv.get('anyOf', '')) or (tc := tv.get('allOf', '')):
+            for n, v in enumerate(tc, start=1):
+                self.scandef(self.maketypename(tn, n), v, nt)
+
+    def define_jadn_type(self, tn: str, tv: dict) -> list:
+        topts = []
+        tdesc = tv.get('description', '')
+        fields = []
+        if (jstype := tv.get('type', '')) == 'object':
+            basetype = 'Record'
+            req = tv.get('required', [])
+            for n, (k, v) in enumerate(tv.get('properties', {}).items(), start=1):
+                fopts = ['[0'] if k not in req else []
+                fdesc = v.get('description', '')
+                if v.get('type', '') == 'array':
+                    ftype = self.maketypename('', k)
+                    idesc = self.refdef(v['items']).get('description', '')
+                    fdesc = fdesc if fdesc else v['items'].get('description', idesc)
+                elif v.get('type', '') == 'object':
+                    ftype = tn
+                elif t := self.ids.get(v.get('$ref', ''), ''):
+                    ft = self.definitions[t]
+                    rt = ft.get('$ref', '')
+                    ftype = self.typedefname(rt if rt else t)
+                    fdesc = ft.get('description', '')
+                elif v.get('anyOf', '') or v.get('allOf', ''):
+                    ftype = self.maketypename(tn, k)
+                else:
+                    ftype = self.typerefname(v)
+                fdef = [n, k, ftype, fopts, fdesc]
+                if not ftype:
+                    raise ValueError(f'  empty field type {tn}${k}')
+                fields.append(fdef)
+        elif (td := tv.get('anyOf', '')) or (td := tv.get('allOf', '')):
+            basetype = 'Choice'
+            # topts = ['<', '∪'] if 'allOf' in tv else ['<']    # TODO: update Choice in JADN library
+            # topts = ['∪'] if 'allOf' in tv else []
+            for n, v in enumerate(td, start=1):
+                fd = self.typerefname(v)
+                ftype = fd if fd else self.maketypename(tn, n)
+                fdef = [n, f'c{n}', ftype, [], '']
+                fields.append(fdef)
+        elif td := tv.get('enum', ''):
+            basetype = 'Enumerated'
+            for n, v in enumerate(td, start=1):
+                fields.append([n, v, ''])
+        elif jstype == 'array':     # TODO: process individual items
+            basetype = 'ArrayOf'
+            topts = [f'{{{tv["minItems"]}'] if 'minItems' in tv else []
+            topts.append(f'}}{tv["maxItems"]}') if 'maxItems' in tv else []
+            tr = self.typerefname(self.refdef(tv['items']))
+            tr = tr if tr else self.typerefname(tv['items'])
+            tr = tr if tr else singular(tn)
+            topts.append(f'*{tr}')
+        elif jstype in ('string', 'integer', 'number', 'boolean'):
+            if p := tv.get('pattern', ''):
+                topts.append(f'%{p}')
+            basetype = jstype.capitalize()
+        else:
+            return []
+
+        return [self.typedefname(tn), basetype, topts, tdesc, fields]
+
+    def convert(self) -> dict:
+        """
+        Create a JADN type from each definition in the JSON Schema
+        :return: JADN schema
+        """
+        for k in self.definitions:     # Index the type name of each definition
+            self.typedefname(k)
+
+        info = {'package': self.jss['$id']}
+        info.update({'comment': self.jss['$comment']} if '$comment' in self.jss else {})
+        info.update({'exports': ['$Root']})
+        info.update({'config': {'$MaxString': 1000, '$FieldName': '^[$a-z][-_$A-Za-z0-9]{0,63}$'}})
+
+        nt = []     # Walk nested type definition tree to build type list
+        self.scandef('$Root', self.jss, nt)
+        for tn, tv in self.definitions.items():
+            self.scandef(tn, tv, nt)
+
+        ntypes = []     # Prune identical type definitions, keyed by their serialized form
+        seen = set()
+        for t in nt:
+            if (key := json.dumps(t)) not in seen:
+                seen.add(key)
+                ntypes.append(t)
+        return {'info': info, 'types': ntypes}
 
 
 def json_to_jadn_dumps(schema: Union[str, dict, Schema], comm: CommentLevels = CommentLevels.ALL, **kwargs) -> str:
     """
     Create a JADN type from each definition in a Metaschema-generated JSON Schema
+    Each call uses its own converter, calls may run in parallel threads or processes
     """
-    
-    global jss
-    if isinstance(schema, str):
-        jss = json.loads(schema)
-    else:
-        jss = schema    
-    
-    global jssx
-    jssx = {v.get('$id', k): k for k, v in jss['definitions'].items()}      # Index from $id to definition
-    types = {typedefname(k): v for k, v in jss['definitions'].items()}      # Index from type name to definition
-    assert len(types) == len(set(types)), f'Type name collision'
-
-    info = {'package': jss['$id']}
-    info.update({'comment': jss['$comment']} if '$comment' in jss else {})
-    info.update({'exports': ['$Root']})
-    info.update({'config': {'$MaxString': 1000, '$FieldName': '^[$a-z][-_$A-Za-z0-9]{0,63}$'}})
-
-    nt = []     # Walk nested type definition tree to build type list
-    scandef('$Root', jss, nt)
-    for tn, tv in jss['definitions'].items():
-        scandef(tn, tv, nt)
-
-    ntypes = []     # Prune identical type definitions
-    for t in nt:
-        if t not in ntypes:     # O(n^2) runtime because type definitions aren't hashable
-            ntypes.append(t)    # Convert to immutable types if it becomes an issue
-
-    return {'info': info, 'types': ntypes}
-    # print('\n'.join([f'{k:>15}: {v}' for k, v in jadn.analyze(jadn.check(schema)).items()]))
+    return JSONSchemaToJADN(schema).convert()
 
 
 def json_to_jadn_dump(schema: Union[str, dict, Schema], comm: CommentLevels = CommentLevels.ALL, **kwargs) -> None:
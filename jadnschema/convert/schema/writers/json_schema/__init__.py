@@ -1,3 +1,3 @@
 from .converter import JADNtoJSON, json_dump, json_dumps
-from .schema_validator import validate_schema
-__all__ = ["JADNtoJSON", "json_dump", "json_dumps", "validate_schema"]
+from .schema_validator import validate_schema, validate_schemas
+__all__ = ["JADNtoJSON", "json_dump", "json_dumps", "validate_schema", "validate_schemas"]
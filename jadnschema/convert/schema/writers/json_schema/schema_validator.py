@@ -1,150 +1,178 @@
+"""
+JSON Schema & JADN Schema Syntax Validation
+The meta-schemas and their validators are created once and shared by every call
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, Tuple
 from jsonschema import Draft201909Validator, ValidationError, SchemaError
+from jsonschema.exceptions import best_match
+__all__ = ["JADN_META_SCHEMA", "validate_schema", "validate_schema_jadn_syntax", "validate_schemas"]
 
-def validate_schema(schema: dict)-> tuple[bool, str]:
-    #TODO: Allow the ability to chose different Draft Validator versions
-
-    try:
-        Draft201909Validator.check_schema(schema)
-        return True, "Schema is Valid"
-
-    except ValidationError as e:
-        
-        if isinstance(e, SchemaError):
-            raise SchemaError(e.message)
-        
-        raise ValueError(e.message)
-
-def validate_schema_jadn_syntax(schema: dict)-> tuple[bool, str]:
-   
-    meta = {
-        "$schema": "https://json-schema.org/draft/2019-09/schema",
-        "$id": "https://oasis-open.org/openc2/jadn/v1.0",
-        "description": "Validates structure of a JADN schema, does not check values (required values included)",
+# Structure of a JADN schema, does not check values
+JADN_META_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2019-09/schema",
+    "$id": "https://oasis-open.org/openc2/jadn/v1.0",
+    "description": "Validates structure of a JADN schema, does not check values (required values included)",
+    "type": "object",
+    "additionalProperties": False,
+    "properties": {
+        "info": {
         "type": "object",
         "additionalProperties": False,
         "properties": {
-            "info": {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "package": {"type": "string"},
-                "version": {"type": "string"},
-                "title": {"type": "string"},
-                "description": {"type": "string"},
-                "comment": {"type":  "string"},
-                "copyright": {"type": "string"},
-                "license": {"type": "string"},
-                "namespaces": {"$ref": "#/definitions/Namespaces"},
-                "exports": {"$ref": "#/definitions/Exports"},
-                "config": {"$ref": "#/definitions/Config"}
-            }
-            },
-            "types": {
-            "type": "array",
-            "items": {
-                "type": "array",
-                "minItems": 1,
-                "maxItems": 5,
-                "items": [
-                {"$ref": "#/definitions/TypeName"},
-                {"$ref": "#/definitions/BaseType"},
-                {"$ref": "#/definitions/Options"},
-                {"$ref": "#/definitions/Description"},
-                {"$ref": "#/definitions/Fields"}
-                ]
-            }
-            }
+            "package": {"type": "string"},
+            "version": {"type": "string"},
+            "title": {"type": "string"},
+            "description": {"type": "string"},
+            "comment": {"type":  "string"},
+            "copyright": {"type": "string"},
+            "license": {"type": "string"},
+            "namespaces": {"$ref": "#/definitions/Namespaces"},
+            "exports": {"$ref": "#/definitions/Exports"},
+            "config": {"$ref": "#/definitions/Config"}
+        }
         },
-        "definitions": {
-            "Namespaces": {
-            "type": "object",
-            "propertyNames": {"$ref": "#/definitions/NSID"},
-            "patternProperties": {
-                "": {
-                "type": "string",
-                "format": "uri"
-                }
-            }
-            },
-            "Exports": {
-            "type": "array",
-            "items": {"type": "string"}
-            },
-            "Config": {
-            "type": "object",
-            "additionalProperties": False,
-            "properties": {
-                "$MaxBinary": {"type": "integer", "minValue": 1},
-                "$MaxString": {"type": "integer", "minValue": 1},
-                "$MaxElements": {"type": "integer", "minValue": 1},
-                "$Sys": {"type": "string", "minLength": 1, "maxLength": 1},
-                "$TypeName": {"type": "string", "minLength": 1, "maxLength": 127},
-                "$FieldName": {"type": "string", "minLength": 1, "maxLength": 127},
-                "$NSID": {"type": "string", "minLength": 1, "maxLength": 127}
-            }
-            },
-            "Fields": {
-            "type": "array",
-            "items": [
-                {"anyOf": [
-                {"$ref": "#/definitions/Item"},
-                {"$ref": "#/definitions/Field"}
-                ]}
-            ]
-            },
-            "Item": {
-            "type": "array",
-            "minItems": 2,
-            "maxItems": 3,
-            "items": [
-                {"type": "integer"},
-                {"type": "string"},
-                {"$ref": "#/definitions/Description"}
-            ]
-            },
-            "Field": {
+        "types": {
+        "type": "array",
+        "items": {
             "type": "array",
-            "minItems": 3,
+            "minItems": 1,
             "maxItems": 5,
             "items": [
-                {"type": "integer"},
-                {"$ref": "#/definitions/FieldName"},
-                {"$ref": "#/definitions/TypeRef"},
-                {"$ref": "#/definitions/Options"},
-                {"$ref": "#/definitions/Description"}
+            {"$ref": "#/definitions/TypeName"},
+            {"$ref": "#/definitions/BaseType"},
+            {"$ref": "#/definitions/Options"},
+            {"$ref": "#/definitions/Description"},
+            {"$ref": "#/definitions/Fields"}
             ]
-            },
-            "NSID": {
-            "type": "string"
-            },
-            "TypeName": {
-            "type": "string"
-            },
-            "TypeRef": {
-            "type": "string"
-            },
-            "FieldName": {
-            "type": "string"
-            },
-            "BaseType": {
+        }
+        }
+    },
+    "definitions": {
+        "Namespaces": {
+        "type": "object",
+        "propertyNames": {"$ref": "#/definitions/NSID"},
+        "patternProperties": {
+            "": {
             "type": "string",
-            "enum": ["Binary", "Boolean", "Integer", "Number", "String",
-                    "Enumerated", "Choice",
-                    "Array", "ArrayOf", "Map", "MapOf", "Record"]
-            },
-            "Options": {
-            "type": "array",
-            "items": {"type": "string"}
-            },
-            "Description": {
-            "type": "string"
+            "format": "uri"
             }
         }
+        },
+        "Exports": {
+        "type": "array",
+        "items": {"type": "string"}
+        },
+        "Config": {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "$MaxBinary": {"type": "integer", "minValue": 1},
+            "$MaxString": {"type": "integer", "minValue": 1},
+            "$MaxElements": {"type": "integer", "minValue": 1},
+            "$Sys": {"type": "string", "minLength": 1, "maxLength": 1},
+            "$TypeName": {"type": "string", "minLength": 1, "maxLength": 127},
+            "$FieldName": {"type": "string", "minLength": 1, "maxLength": 127},
+            "$NSID": {"type": "string", "minLength": 1, "maxLength": 127}
+        }
+        },
+        "Fields": {
+        "type": "array",
+        "items": [
+            {"anyOf": [
+            {"$ref": "#/definitions/Item"},
+            {"$ref": "#/definitions/Field"}
+            ]}
+        ]
+        },
+        "Item": {
+        "type": "array",
+        "minItems": 2,
+        "maxItems": 3,
+        "items": [
+            {"type": "integer"},
+            {"type": "string"},
+            {"$ref": "#/definitions/Description"}
+        ]
+        },
+        "Field": {
+        "type": "array",
+        "minItems": 3,
+        "maxItems": 5,
+        "items": [
+            {"type": "integer"},
+            {"$ref": "#/definitions/FieldName"},
+            {"$ref": "#/definitions/TypeRef"},
+            {"$ref": "#/definitions/Options"},
+            {"$ref": "#/definitions/Description"}
+        ]
+        },
+        "NSID": {
+        "type": "string"
+        },
+        "TypeName": {
+        "type": "string"
+        },
+        "TypeRef": {
+        "type": "string"
+        },
+        "FieldName": {
+        "type": "string"
+        },
+        "BaseType": {
+        "type": "string",
+        "enum": ["Binary", "Boolean", "Integer", "Number", "String",
+                "Enumerated", "Choice",
+                "Array", "ArrayOf", "Map", "MapOf", "Record"]
+        },
+        "Options": {
+        "type": "array",
+        "items": {"type": "string"}
+        },
+        "Description": {
+        "type": "string"
+        }
     }
+}
+
+# Compiled validators of the meta-schemas, validator instances hold no per-call state
+_JSON_SCHEMA_VALIDATOR = Draft201909Validator(Draft201909Validator.META_SCHEMA, format_checker=Draft201909Validator.FORMAT_CHECKER)
+_JADN_SCHEMA_VALIDATOR = Draft201909Validator(JADN_META_SCHEMA)
+
 
+def validate_schema(schema: dict) -> tuple[bool, str]:
+    #TODO: Allow the ability to chose different Draft Validator versions
+    if error := best_match(_JSON_SCHEMA_VALIDATOR.iter_errors(schema)):
+        raise SchemaError.create_from(error)
+    return True, "Schema is Valid"
+
+
+def validate_schema_jadn_syntax(schema: dict) -> tuple[bool, str]:
+    if error := best_match(_JADN_SCHEMA_VALIDATOR.iter_errors(schema)):
+        raise ValueError(error.message)
+    return True, "Schema is Valid"
+
+
+def _check_schema(schema: dict, jadn: bool = False) -> Tuple[bool, str]:
     try:
-        Draft201909Validator(meta).validate(schema)
-        return True, "Schema is Valid"
+        return validate_schema_jadn_syntax(schema) if jadn else validate_schema(schema)
+    except (SchemaError, ValidationError, ValueError) as err:
+        return False, getattr(err, "message", str(err))
+
 
-    except Exception as e:
-        raise ValueError(e.message)
\ No newline at end of file
+def validate_schemas(schemas: Iterable[dict], jadn: bool = False, processes: int = 0, chunksize: int = 16) -> List[Tuple[bool, str]]:
+    """
+    Validate a batch of schemas with the shared meta-schema validators, invalid schemas do not stop the batch
+    :param schemas: JSON Schemas, or JADN schemas if `jadn` is set
+    :param jadn: validate the syntax of JADN schemas instead of JSON Schemas
+    :param processes: number of worker processes, 0 validates in the current process
+    :param chunksize: number of schemas sent to a worker process at a time
+    :return: list of (valid, message) in the order of the given schemas
+    """
+    check = partial(_check_schema, jadn=jadn)
+    if processes:
+        # Each worker builds the validators once when it imports this module
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(check, schemas, chunksize=chunksize))
+    return list(map(check, schemas))
@@ -0,0 +1,156 @@
+"""
+JADN to Python module
+Writes the definitions of a schema as an importable module of static classes, equivalent to the definitions
+created by `make_def`, so the schema does not need to be loaded and validated at runtime
+"""
+import keyword
+
+from pathlib import Path
+from typing import List, NoReturn, Union
+from .baseWriter import BaseWriter
+from ..enums import CommentLevels
+from ..helpers import register_writer
+from ....schema import Schema
+from ....schema.consts import FieldAlias
+from ....schema.definitions import Definition, Options, clsName, def_field, enum_field, jadn_def
+from ....schema.definitions.options import validated_options
+__pdoc__ = {
+    "JADNtoPython.format": "File extension of the given format",
+    "JADNtoPython.comment_multi": "Multiline comment characters; Tuple[START_CHAR, END_CHAR]",
+    "JADNtoPython.comment_single": "Single line comment character",
+}
+
+
+# Conversion Class
+@register_writer
+class JADNtoPython(BaseWriter):
+    format = "py"
+    comment_multi = ('"""', '"""')
+    comment_single = "#"
+
+    def dumps(self, **kwargs) -> str:
+        """
+        Converts the JADN schema to a Python module, the output only depends on the schema
+        :return: Python module source
+        """
+        types = list(self._schema.types.values())
+        info = self._schema.info.schema() if self._schema._info and self._schema.info else None
+        namespaces = sorted(info["namespaces"]) if info and "namespaces" in info else None
+        title = f"{info.get('title', '')} {info.get('package', '')}".strip() if info else ""
+
+        # Imports are private names, the schema types may use any valid type name
+        lines = [
+            '"""',
+            f"JADN Schema{f' - {title}' if title else ''}",
+            "Generated from the JADN schema, changes are overwritten when the module is generated again",
+            '"""',
+            "import enum as _enum",
+            "import typing as _typing",
+            "import jadnschema.schema.definitions as _defs",
+            "from jadnschema.schema import Schema as _Schema",
+            "from jadnschema.schema.schema import resolve_types as _resolve_types",
+            "",
+            f"_NAMESPACES = {namespaces!r}",
+            f"_INFO = {info!r}",
+            ""
+        ]
+        for def_cls in types:
+            df = getattr(self, f"_format{def_cls.data_type}", self._formatCustom)
+            lines.extend(["", "", df(def_cls)])
+
+        type_list = "".join(f"\n    {clsName(t.name)}," for t in types)
+        lines.extend([
+            "",
+            "# Schema",
+            f"_TYPES = {{d.name: d for d in ({type_list}\n)}}",
+            "_resolve_types(_TYPES, {**{d.__name__: d for d in _TYPES.values()}, **_defs.DefTypes}, set(_NAMESPACES) if _NAMESPACES else None)",
+            "for _def in _TYPES.values():",
+            "    _def._field_index()",
+            "",
+            "",
+            "def load_schema() -> _Schema:",
+            '    """',
+            "    Create the schema from the generated definitions",
+            "    :return: schema instance",
+            '    """',
+            "    return _Schema(**({'info': _INFO} if _INFO else {}), types=dict(_TYPES))",
+            ""
+        ])
+        return "\n".join(lines)
+
+    def dump(self, fname: Union[str, Path], source: str = None, **kwargs) -> NoReturn:
+        """
+        Convert the JADN schema to a Python module and write it to the given file
+        The source is noted without a timestamp so the module only changes with the schema
+        :param fname: module file to write
+        :param source: source information
+        :param kwargs: key/value args to use for conversion
+        """
+        fname = str(fname)
+        output = fname if fname.endswith(f".{self.format}") else f"{fname}.{self.format}"
+        with open(output, "w", encoding="UTF-8") as f:
+            if source:
+                f.write(f"{self.comment_single} Generated from {source}\n")
+            f.write(self.dumps(**kwargs))
+
+    # Structure Formats
+    def _formatCustom(self, itm: Definition, **kwargs) -> str:
+        def_obj = jadn_def(*itm.schema())
+        lines = self._classHeader(def_obj)
+        for field in def_obj.fields:
+            field_obj = def_field(*field)
+            name = field_obj.name
+            args = {
+                "id": field_obj.id,
+                "type": field_obj.type,
+                "description": field_obj.description
+            }
+            if alias := FieldAlias.get(name, f"{name}_" if keyword.iskeyword(name) else None):
+                args["alias"] = name
+                name = alias
+            field_opts = Options(field_obj.options, name=f"{def_obj.name}.{field_obj.name}", data_type=field_obj.type)
+            optional = def_obj.type == "Choice" or field_opts.isOptional()
+            args["required"] = not optional
+            annotation = f"_typing.Optional[{clsName(field_obj.type)!r}]" if optional else repr(clsName(field_obj.type))
+            opts = self._options(field_obj.options, name=field_opts.name, data_type=field_obj.type)
+            field_args = ", ".join(f"{k}={v!r}" for k, v in args.items())
+            lines.append(f"    {name}: {annotation} = _defs.Field({field_args}, options={opts})")
+        return "\n".join(lines)
+
+    def _formatEnumerated(self, itm: Definition, **kwargs) -> str:
+        def_obj = jadn_def(*itm.schema())
+        lines = self._classHeader(def_obj)
+        items = []
+        for field in def_obj.fields:
+            item = enum_field(*field)
+            items.append(f"        {item.name!r}: _defs.Field(id={item.id!r}, description={item.description!r}, default={item.name!r}),")
+        lines.append("    __enums__ = _enum.Enum('__enums__', {")
+        lines.extend(items)
+        lines.append("    })")
+        return "\n".join(lines)
+
+    _formatArray = _formatArrayOf = _formatChoice = _formatMap = _formatMapOf = _formatRecord = _formatCustom
+
+    # Helpers
+    def _classHeader(self, def_obj: jadn_def) -> List[str]:
+        return [
+            f"class {clsName(def_obj.name)}(_defs.{def_obj.type}):",
+            f"    __doc__ = {def_obj.description!r}",
+            f"    __options__ = {self._options(def_obj.options, name=def_obj.name)}"
+        ]
+
+    def _options(self, opts: List[str], **kwargs) -> str:
+        # The options are validated when the module is written, importing the module does not parse them again
+        values = {**dict(validated_options(tuple(opts))), **kwargs}
+        return f"_defs.Options.from_validated({values!r})"
+
+
+# Writer Functions
+def py_dump(schema: Union[str, dict, Schema], fname: str, source: str = "", comm: CommentLevels = CommentLevels.ALL, **kwargs):
+    comm = comm if comm in CommentLevels else CommentLevels.ALL
+    return JADNtoPython(schema, comm).dump(fname, source, **kwargs)
+
+
+def py_dumps(schema: Union[str, dict, Schema], comm: CommentLevels = CommentLevels.ALL, **kwargs):
+    comm = comm if comm in CommentLevels else CommentLevels.ALL
+    return JADNtoPython(schema, comm).dumps(**kwargs)
@@ -4,6 +4,8 @@ JADN Schema definition objects
 from pydantic import Field
 from .info import Information
 from .schema import Schema
+from .backends import ValidatorBackend
+from .definitions.check import CheckResult, ErrorMode
 from .definitions.primitives import Binary, Boolean, Integer, Number, String
 from .definitions.structures import Array, ArrayOf, Choice, Map, Enumerated, MapOf, Record
 
@@ -25,5 +27,8 @@ __all__ = [
     "MapOf",
     "Record",
     # Helpers
+    "CheckResult",
+    "ErrorMode",
+    "ValidatorBackend",
     "Field"
 ]
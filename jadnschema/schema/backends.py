@@ -0,0 +1,193 @@
+"""
+JADN Schema Validator Backends
+Validate data against a schema with the pydantic definitions or with the JSON Schema generated from the schema
+"""
+import threading
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, NoReturn, Union
+from .definitions.check import CheckError, CheckErrors, CheckResult, ErrorMode, StopCheck, pointer
+from ..exceptions import SchemaException, ValidationError
+from ..utils import EnumBase
+__all__ = ["JsonSchemaValidator", "PydanticValidator", "SchemaValidator", "ValidatorBackend", "ValidatorBackends"]
+
+
+class ValidatorBackend(str, EnumBase):
+    """Backend used to validate data against a schema"""
+    Pydantic = "pydantic"      #: Validate with the pydantic definitions, including the semantic formats
+    JsonSchema = "jsonschema"  #: Validate the structure with the JSON Schema generated from the schema, requires `fastjsonschema`
+
+
+class SchemaValidator(ABC):
+    """
+    Validator of data against the types of a schema
+    """
+    backend: ValidatorBackend
+    _schema: "Schema"
+
+    def __init__(self, schema: "Schema"):
+        self._schema = schema
+
+    def validate(self, value: Any) -> Any:
+        """
+        Validate the given data against the exported types, the candidate exports are selected by the shape of the data
+        :param value: data to validate
+        :raise SchemaException: data is not an instance of any exported type
+        :return: validated data
+        """
+        candidates = self._schema.dispatch(value)
+        if len(candidates) == 1:
+            return self.validate_as(candidates[0], value)
+        error = None
+        for export in candidates:
+            try:
+                return self.validate_as(export, value)
+            except (TypeError, ValueError, ValidationError) as err:
+                error = err
+        raise SchemaException("Value is not a valid exported type") from error
+
+    @abstractmethod
+    def validate_as(self, type_: str, value: Any) -> Any:
+        """
+        Validate the given data against a specific type
+        :param type_: name of the type
+        :param value: data to validate
+        :return: validated data
+        """
+
+    @abstractmethod
+    def check_as(self, type_: str, value: Any, mode: Union[ErrorMode, str] = ErrorMode.CollectAll) -> CheckResult:
+        """
+        Check the given data against a specific type
+        :param type_: name of the type
+        :param value: data to check
+        :param mode: error mode, `collect` all violations or `fail-fast` at the first violation
+        :return: check result, truthy if the data is valid, the errors are addressed by JSON pointer
+        """
+
+
+class PydanticValidator(SchemaValidator):
+    """
+    Validator using the pydantic definitions of the schema, data is validated to instances of the definitions
+    """
+    backend = ValidatorBackend.Pydantic
+
+    def validate(self, value: Any) -> Any:
+        return self._schema.validate(value)
+
+    def validate_as(self, type_: str, value: Any) -> Any:
+        return self._schema.validate_as(type_, value)
+
+    def check_as(self, type_: str, value: Any, mode: Union[ErrorMode, str] = ErrorMode.CollectAll) -> CheckResult:
+        return self._schema.check_as(type_, value, mode)
+
+
+class JsonSchemaValidator(SchemaValidator):
+    """
+    Validator using the JSON Schema generated from the schema, the JSON Schema is generated once and compiled per type
+    Requires `fastjsonschema` (`jadn_schema[fastjsonschema]`), the generated code stops at the first violation so a
+    check reports at most one error
+    Only the structure of the data is validated, the keywords generated from the semantic formats are removed so the
+    formats are not checked and the data is not converted
+    """
+    backend = ValidatorBackend.JsonSchema
+    _definitions: Dict[str, dict]
+    _validators: Dict[str, Callable[[Any, CheckErrors], NoReturn]]
+    _lock: threading.Lock
+
+    def __init__(self, schema: "Schema"):
+        super().__init__(schema)
+        try:
+            import fastjsonschema  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as err:
+            raise SchemaException("The jsonschema backend requires fastjsonschema, install jadn_schema[fastjsonschema]") from err
+        from ..convert.schema.writers.json_schema import JADNtoJSON  # pylint: disable=import-outside-toplevel
+        try:
+            json_schema = JADNtoJSON(schema).schema()
+        except Exception as err:  # pylint: disable=broad-except
+            raise SchemaException(f"JSON Schema cannot be generated from the schema - {err}") from err
+        self._definitions = _structural(json_schema.get("definitions", {}))
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def validate_as(self, type_: str, value: Any) -> Any:
+        """
+        Validate the given data against a specific type
+        :param type_: name of the type
+        :param value: data to validate
+        :raise ValidationError: data is not valid for the type
+        :return: original data
+        """
+        result = self.check_as(type_, value, ErrorMode.FailFast)
+        if not result:
+            raise ValidationError(f"{type_} is invalid - {result.errors[0]}")
+        return value
+
+    def check_as(self, type_: str, value: Any, mode: Union[ErrorMode, str] = ErrorMode.CollectAll) -> CheckResult:
+        errors = CheckErrors(mode)
+        try:
+            self._validator(type_)(value, errors)
+        except StopCheck:
+            pass
+        return CheckResult(errors)
+
+    # Helpers
+    def _validator(self, type_: str) -> Callable[[Any, CheckErrors], NoReturn]:
+        if (validator := self._validators.get(type_)) is None:
+            if type_ not in self._definitions:
+                raise SchemaException(f"{type_} is not a valid type within the schema")
+            with self._lock:
+                if (validator := self._validators.get(type_)) is None:
+                    validator = self._validators[type_] = self._compile({
+                        "$schema": "http://json-schema.org/draft-07/schema#",
+                        "definitions": self._definitions,
+                        "$ref": f"#/definitions/{type_}"
+                    })
+        return validator
+
+    @staticmethod
+    def _compile(json_schema: dict) -> Callable[[Any, CheckErrors], NoReturn]:
+        import fastjsonschema  # pylint: disable=import-outside-toplevel
+        validate = fastjsonschema.compile(json_schema, use_formats=False)
+
+        def check(value: Any, errors: CheckErrors) -> NoReturn:
+            try:
+                validate(value)
+            except fastjsonschema.JsonSchemaValueException as err:
+                path = ""
+                for key in err.path[1:]:  # the first item is the name of the root value
+                    path = pointer(path, key)
+                errors.append(CheckError(path, "Value `{}` is invalid for `{}: {}`", (err.value, err.rule, err.rule_definition)))
+        return check
+
+
+def _structural(json_schema: Any) -> Any:
+    """
+    Remove the keywords generated from the JADN semantic formats, the formats are checked by the JADN format validators,
+    which accept values the generated keywords do not, such as Binary addresses in the default base64 encoding
+    :param json_schema: JSON Schema or part of a JSON Schema
+    :return: JSON Schema without the format keywords
+    """
+    from ..convert.schema.writers.json_schema.consts import JADN_FMT  # pylint: disable=import-outside-toplevel
+    patterns = {fmt["pattern"] for fmt in JADN_FMT.values() if "pattern" in fmt}
+
+    def strip(val: Any) -> Any:
+        if isinstance(val, dict):
+            rtn = {}
+            for key, item in val.items():
+                if key in ("definitions", "properties", "patternProperties"):  # keys are names, not keywords
+                    rtn[key] = {k: strip(v) for k, v in item.items()}
+                elif key not in ("format", "contentEncoding") and not (key == "pattern" and item in patterns):
+                    rtn[key] = strip(item)
+            return rtn
+        if isinstance(val, list):
+            return [strip(v) for v in val]
+        return val
+    return {k: strip(v) for k, v in json_schema.items()}
+
+
+# Validator classes of each backend: {backend: validator class}
+ValidatorBackends = {
+    ValidatorBackend.Pydantic: PydanticValidator,
+    ValidatorBackend.JsonSchema: JsonSchemaValidator
+}
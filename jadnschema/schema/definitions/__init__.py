@@ -7,6 +7,7 @@ from typing import Callable, Dict, Type, Optional, Tuple, Union, get_args
 from pydantic import create_model  # pylint: disable=no-name-in-module
 from pydantic.fields import FieldInfo  # pylint: disable=no-name-in-module
 from ..consts import FieldAlias, SysAlias, ValidName
+from .check import CheckError, CheckResult, ErrorMode
 from .options import Options
 from .definitionBase import DefinitionBase
 from .field import Field
@@ -30,6 +31,9 @@ __all__ = [
     # Helpers
     "Primitive",
     "Structure",
+    "CheckError",
+    "CheckResult",
+    "ErrorMode",
     "Definition",
     "DefTypes",
     "Field",
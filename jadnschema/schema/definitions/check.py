@@ -0,0 +1,116 @@
+"""
+JADN validate-only check results
+"""
+import reprlib
+
+from typing import Any, List, NamedTuple, NoReturn, Tuple, Union
+from ...utils import EnumBase
+__all__ = ["CheckError", "CheckErrors", "CheckResult", "ErrorMode", "StopCheck", "pointer"]
+MAX_VALUE_LEN = 64  # Maximum length of a value within a formatted error message
+
+
+class ErrorMode(str, EnumBase):
+    """Error handling of the check of a value"""
+    CollectAll = "collect"  #: Check the entire value and report all violations
+    FailFast = "fail-fast"  #: Stop at the first violation
+
+
+def pointer(path: str, key: object) -> str:
+    """
+    Append a key to a JSON pointer, RFC 6901
+    :param path: JSON pointer of the parent value
+    :param key: key or index of the child value
+    :return: JSON pointer of the child value
+    """
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def short(value: Any) -> str:
+    """
+    Convert a value to a string for an error message, long values are truncated
+    :param value: value to convert
+    :return: string of the value
+    """
+    if isinstance(value, (str, bytes)):
+        return str(value) if len(value) <= MAX_VALUE_LEN else f"{value[:MAX_VALUE_LEN]}...(length {len(value)})"
+    if isinstance(value, (dict, list, tuple, set)):
+        return reprlib.repr(value)
+    return str(value)
+
+
+class CheckError(NamedTuple):
+    """
+    A single violation found while checking a value
+    The message is formatted from the template and arguments only when requested
+    """
+    path: str          #: JSON pointer to the invalid value
+    template: str      #: `str.format` template of the description of the violation
+    args: tuple = ()   #: Arguments of the template, values are truncated when formatted
+
+    def __str__(self):
+        return f"{self.path or '/'}: {self.message}"
+
+    @property
+    def message(self) -> str:
+        """Description of the violation"""
+        return self.template.format(*map(short, self.args))
+
+
+class StopCheck(Exception):
+    """
+    Raised by the error list of a fail-fast check to stop at the first violation
+    """
+
+
+class CheckErrors(list):
+    """
+    Violations found while checking a value, stops the check at the first violation in fail-fast mode
+    """
+    __slots__ = ("fail_fast", )
+
+    def __init__(self, mode: Union[ErrorMode, str] = ErrorMode.CollectAll):
+        super().__init__()
+        self.fail_fast = ErrorMode(mode) == ErrorMode.FailFast
+
+    def append(self, error: CheckError) -> NoReturn:
+        super().append(error)
+        if self.fail_fast:
+            raise StopCheck()
+
+    def add(self, path: str, template: str, *args: Any) -> NoReturn:
+        """
+        Add a violation with a lazily formatted message
+        :param path: JSON pointer to the invalid value
+        :param template: `str.format` template of the description of the violation
+        :param args: arguments of the template
+        """
+        self.append(CheckError(path, template, args))
+
+
+class CheckResult:
+    """
+    Result of checking a value against a definition, truthy if the value is valid
+    """
+    __slots__ = ("errors", )
+    errors: List[CheckError]
+
+    def __init__(self, errors: List[CheckError] = None):
+        self.errors = list(errors or [])
+
+    def __bool__(self):
+        return not self.errors
+
+    def __repr__(self):
+        return f"CheckResult(valid={self.valid}, errors={self.messages()})"
+
+    @property
+    def valid(self) -> bool:
+        """The value is valid for the definition"""
+        return not self.errors
+
+    def messages(self) -> List[Tuple[str, str]]:
+        """
+        Format the found violations
+        :return: list of violations as (JSON pointer, message)
+        """
+        return [(e.path, e.message) for e in self.errors]
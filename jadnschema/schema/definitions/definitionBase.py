@@ -4,14 +4,16 @@ Customized from `jadnschema.schema.baseModel.BaseModel`
 """
 from copy import deepcopy
 from enum import Enum
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Dict, Hashable, NoReturn, Optional, Sequence, Type, Union
 from pydantic import create_model  # pylint: disable=no-name-in-module
+from pydantic.fields import ModelField  # pylint: disable=no-name-in-module
 from pydantic.main import ModelMetaclass  # pylint: disable=no-name-in-module
+from .check import CheckErrors, CheckResult, ErrorMode, StopCheck, pointer
 from .options import Options
 from .field import getFieldSchema, getFieldType
 from ..consts import SELECTOR_TYPES, STRUCTURED_TYPES, FIELD_TYPES
 from ..baseModel import BaseModel
-from ...utils import classproperty, ellipsis_str
+from ...utils import canonical, classproperty, ellipsis_str
 __pdoc__ = {
     "DefinitionBase.name": "The definition's valid schema name",
     "DefinitionBase.description": "The definition's description",
@@ -120,6 +122,90 @@ class DefinitionBase(BaseModel, metaclass=DefinitionMeta):  # pylint: disable=in
                 return True
         return False
 
+    # Validate only
+    @classmethod
+    def check(cls, value: Any, path: str = "", mode: Union[ErrorMode, str] = ErrorMode.CollectAll) -> CheckResult:
+        """
+        Check the given value against the definition without creating model instances, values are not coerced
+        :param value: value to check
+        :param path: JSON pointer of the value within the checked message
+        :param mode: error mode, collect all violations or stop at the first
+        :return: check result, truthy if the value is valid
+        """
+        errors = CheckErrors(mode)
+        try:
+            cls._check(value, path, errors)
+        except StopCheck:
+            pass
+        return CheckResult(errors)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        """
+        Determine if all the given values are valid without validating each value individually
+        Primitive types check the types and bounds of the values in one pass, other definitions have no batch check
+        A False result does not mean a value is invalid, the values must then be validated individually
+        :param values: values to check
+        :return: True if all the values are valid
+        """
+        return False
+
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        """
+        Check the given value, appending any violations to errors
+        Definitions without a validate-only implementation fall back to pydantic validation
+        :param value: value to check
+        :param path: JSON pointer of the value within the checked message
+        :param errors: found violations
+        """
+        try:
+            cls.validate(value)
+        except (TypeError, ValueError) as err:
+            errors.add(path, "{}", err)
+
+    @classmethod
+    def _check_field(cls, field: ModelField, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        """
+        Check the value of a field against the field type, including each instance of a multi-value field
+        :param field: field to check the value against
+        :param value: value of the field
+        :param path: JSON pointer of the value within the checked message
+        :param errors: found violations
+        """
+        field_cls = cls._field_class(field)
+        if field_cls is None:
+            errors.add(path, "{}.{} type `{}` is unknown", cls.name, field.alias, getFieldType(field))
+            return
+        opts = field.field_info.extra["options"]
+        if opts.isArray() and isinstance(value, list):
+            for idx, val in enumerate(value):
+                field_cls._check(val, pointer(path, idx), errors)
+        else:
+            field_cls._check(value, path, errors)
+
+    @classmethod
+    def _field_class(cls, field: ModelField) -> Optional[Type["DefinitionBase"]]:
+        """
+        Get the definition class of the field type
+        :param field: field to get the type of
+        :return: definition class or None if the type is not defined
+        """
+        if isinstance(field.type_, type) and issubclass(field.type_, DefinitionBase):
+            return field.type_
+        return cls.__config__.types.get(getFieldType(field))
+
+    @classmethod
+    def _field_index(cls) -> Dict[str, ModelField]:
+        """
+        Get the fields of the definition by their JADN name, built once per definition
+        :return: fields by name
+        """
+        if (index := cls.__dict__.get("__field_index__")) is None:
+            index = {f.alias: f for f in cls.__fields__.values() if f.name != "__root__"}
+            setattr(cls, "__field_index__", index)
+        return index
+
     # Helpers
     @classmethod
     def expandCompact(cls, value: Any) -> Any:
@@ -132,6 +218,15 @@ class DefinitionBase(BaseModel, metaclass=DefinitionMeta):  # pylint: disable=in
             return rtn
         return value
 
+    @classmethod
+    def canonical(cls, value: Any) -> Hashable:
+        """
+        Convert the given value of the definition to a hashable canonical form, used to compare values
+        :param value: value to convert
+        :return: canonical form of the value
+        """
+        return canonical(value)
+
     @classproperty
     def name(cls) -> str:  # pylint: disable=no-self-argument
         """The definition's valid schema name"""
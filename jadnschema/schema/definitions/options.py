@@ -3,8 +3,9 @@ JADN Definition & Type Options
 """
 import inspect
 
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple, Union
-from pydantic import Extra, root_validator
+from pydantic import Extra, root_validator, validate_model
 from ..baseModel import BaseModel
 from ..consts import ALLOWED_TYPE_OPTIONS, REQUIRED_TYPE_OPTIONS, OPTIONS, OPTION_ID, TYPE_OPTION_KEYS, FIELD_OPTION_KEYS
 from ..formats import ValidationFormats
@@ -13,6 +14,62 @@ __all__ = ["Options"]
 # Consts
 NULL_ARGS = (None, "")
 MULTI_CHECK: Callable[[int, int], bool] = lambda x, y: True
+CUSTOM_TYPES = {"data_type": str, "name": (str, type(None)), "validation": dict}
+REQUIRED_OPTIONS = {k: frozenset(v) for k, v in REQUIRED_TYPE_OPTIONS.items()}
+ALLOWED_OPTIONS = {k: frozenset(v) for k, v in ALLOWED_TYPE_OPTIONS.items()}
+NON_TYPE_KEYS = frozenset((*CUSTOM_TYPES, *FIELD_OPTION_KEYS))
+
+
+def check_options(opts: dict) -> dict:
+    """
+    Validate the options for the attached data type
+    :param opts: options to validate
+    :raise ValueError: invalid options given
+    :return: original options
+    """
+    if fields := opts.keys() - NON_TYPE_KEYS:
+        data_type = opts.get("data_type")
+        if required := REQUIRED_OPTIONS.get(data_type):
+            if missing := (required - fields):
+                raise ValueError(f"{data_type} missing required option of {missing.pop()}")
+        if allowed := ALLOWED_OPTIONS.get(data_type):
+            if extra := (fields - allowed):
+                raise ValueError(f"{data_type} has extra options of {extra}")
+    return opts
+
+
+@lru_cache(maxsize=4096)
+def parse_options(opts: Tuple[str, ...]) -> Tuple[Tuple[str, Union[bool, int, float, str]], ...]:
+    """
+    Convert a JADN formatted option tuple to key/value pairs, memoized per distinct tuple
+    :param opts: JADN formatted options
+    :raise KeyError: invalid option given
+    :return: key/value formatted options
+    """
+    rslt = []
+    for opt in opts:
+        key, val = opt[0], opt[1:]
+        if args := OPTIONS.get(ord(key)):
+            rslt.append((args[0], args[1](val)))
+        else:
+            raise KeyError(f"Unknown option id of {key}")
+    return tuple(rslt)
+
+
+@lru_cache(maxsize=4096)
+def validated_options(opts: Tuple[str, ...]) -> Tuple[Tuple[str, Union[bool, int, float, str]], ...]:
+    """
+    Convert a JADN formatted option tuple to validated key/value pairs, memoized per distinct tuple
+    :param opts: JADN formatted options
+    :raise KeyError: invalid option given
+    :raise ValidationError: invalid option value given
+    :return: key/value formatted options, coerced to the option field types, in the order of the given options
+    """
+    parsed = dict(parse_options(opts))
+    values, fields_set, err = validate_model(Options, parsed)
+    if err:
+        raise err
+    return tuple((k, values[k]) for k in parsed if k in fields_set)
 
 
 class Options(BaseModel):
@@ -48,16 +105,45 @@ class Options(BaseModel):
 
     def __init__(self, *args, **kwargs):
         data = {}
+        validated = True  # Values from Options instances and option lists are already validated
         for arg in args:
-            if inspect.isclass(arg) or isinstance(arg, Options):
+            if isinstance(arg, Options):
+                data.update({k: v for k, v in arg.__dict__.items() if v not in NULL_ARGS})
+            elif inspect.isclass(arg):
                 keys = [*self.__fields__, *self.__custom__]
                 data.update({k: getattr(arg, k) for k in keys if getattr(arg, k, None) not in NULL_ARGS})
+                validated = False
             elif isinstance(arg, list):
-                data.update(self.list2dict(arg))
+                data.update(validated_options(tuple(arg)))
             elif isinstance(arg, dict):
                 data.update(arg)
-        data.update(kwargs)
-        super().__init__(**data)
+                validated = False
+        for k, v in kwargs.items():
+            if not isinstance(v, CUSTOM_TYPES.get(k, ())):
+                validated = False
+            data[k] = v
+
+        if validated:  # Skip pydantic field validation, only check the options against the data type
+            check_options(data)
+            object.__setattr__(self, "__dict__", {**OPTION_DEFAULTS, **data})
+            object.__setattr__(self, "__fields_set__", set(data))
+            self._init_private_attributes()
+        else:
+            super().__init__(**data)
+
+    @classmethod
+    def from_validated(cls, values: Dict[str, Union[bool, int, float, str]]) -> "Options":
+        """
+        Create options from key/value pairs that were already validated, such as those of a generated Python schema module
+        The values are not parsed or validated again
+        :param values: validated key/value formatted options
+        :return: options
+        """
+        opts = cls.__new__(cls)
+        object.__setattr__(opts, "__dict__", {**OPTION_DEFAULTS, **values})
+        object.__setattr__(opts, "__fields_set__", set(values))
+        opts._init_private_attributes()
+        return opts
 
     def schema(self) -> List[str]:
         """
@@ -75,15 +161,7 @@ class Options(BaseModel):
         :raise ValueError: invalid options given
         :return: original options
         """
-        if fields := set(opts.keys()) - set(cls.__custom__) - set(FIELD_OPTION_KEYS):
-            data_type = opts.get("data_type")
-            if required := set(REQUIRED_TYPE_OPTIONS.get(data_type, ())):
-                if missing := (required - fields):
-                    raise ValueError(f"{data_type} missing required option of {missing.pop()}")
-            if allowed := set(ALLOWED_TYPE_OPTIONS.get(data_type, ())):
-                if extra := (fields - allowed):
-                    raise ValueError(f"{data_type} has extra options of {extra}")
-        return opts
+        return check_options(opts)
 
     # Helpers
     @classmethod
@@ -111,14 +189,7 @@ class Options(BaseModel):
         :raise KeyError: invalid option given
         :return: key/value formatted options
         """
-        rslt = {}
-        for opt in opts:
-            key, val = opt[0], opt[1:]
-            if args := OPTIONS.get(ord(key)):
-                rslt[args[0]] = args[1](val)
-            else:
-                raise KeyError(f"Unknown option id of {key}")
-        return rslt
+        return dict(parse_options(tuple(opts)))
 
     def isArray(self) -> bool:
         """
@@ -213,3 +284,7 @@ class Options(BaseModel):
             "name": {"exclude": True},
             "validation": {"exclude": True}
         }
+
+
+# Field defaults, shared by instances that skip pydantic validation
+OPTION_DEFAULTS = {k: f.default for k, f in Options.__fields__.items()}
@@ -1,18 +1,26 @@
 """
 JADN Primitive Types
 """
+import base64
+import binascii
 import re
 
 from functools import partial
-from typing import Any, Union
-from pydantic import ValidationError, root_validator
+from typing import Any, NoReturn, Optional, Sequence, Union
+from pydantic import PrivateAttr, ValidationError, root_validator
 
 from jadnschema.utils.general import get_max_len, get_max_len_binary
+from .check import CheckErrors
 from .definitionBase import DefinitionBase
 from .options import Options  # pylint: disable=unused-import
-__all__ = ["Primitive", "Binary", "Boolean", "Integer", "Number", "String", "validate_format"]
+__all__ = ["Primitive", "Binary", "Boolean", "Integer", "Number", "String", "check_format", "decode_binary", "validate_format"]
 Primitive = Union["Binary", "Boolean", "Integer", "Number", "String"]
 primitives = ["Binary", "Boolean", "Integer", "Number", "String"]
+# Binary formats that only define the encoding of the value: {format: octets per encoded character}
+BINARY_ENCODINGS = {"b": 3 / 4, "x": 1 / 2}
+# Binary formats with a text value, validated by the format as text
+BINARY_TEXT_FORMATS = ("eui", )
+HEX_VALUE = re.compile(r"[0-9A-Fa-f]*")
 
 
 def validate_format(cls: DefinitionBase, fmt: str, val: Any) -> Any:
@@ -34,12 +42,71 @@ def validate_format(cls: DefinitionBase, fmt: str, val: Any) -> Any:
     raise ValidationError(f"{fmt} is not a valid format")
 
 
+def decode_binary(val: str, fmt: str = None) -> bytes:
+    """
+    Decode the value of a Binary type to octets, hex for the `x` format, text for `eui`, else base64 or base64url
+    :param val: encoded value
+    :param fmt: format of the Binary type
+    :raise ValueError: value is not validly encoded
+    :return: decoded octets
+    """
+    if not isinstance(val, str):
+        raise TypeError(f"Binary value is not expected string, given {type(val)}")
+    try:
+        if fmt == "x":
+            # bytes.fromhex skips whitespace, only hex digits are valid
+            if not HEX_VALUE.fullmatch(val):
+                raise ValueError("non-hexadecimal character found")
+            return bytes.fromhex(val)
+        if fmt in BINARY_TEXT_FORMATS:
+            return val.encode("utf-8")
+        val = val.replace("-", "+").replace("_", "/")
+        return base64.b64decode(val + "=" * (-len(val) % 4), validate=True)
+    except (binascii.Error, ValueError) as err:
+        raise ValueError(f"Binary value is not valid {'hex' if fmt == 'x' else 'base64'} - {err}") from err
+
+
+def check_format(cls: DefinitionBase, fmt: str, val: Any, path: str, errors: CheckErrors) -> bool:
+    """
+    Check the format of a given Primitive type, appending the violation to errors
+    :param cls: Primitive type to check
+    :param fmt: format to check against
+    :param val: value to check
+    :param path: JSON pointer of the value within the checked message
+    :param errors: found violations
+    :return: True/False if the value is valid for the format
+    """
+    try:
+        validate_format(cls, fmt, val)
+    except Exception as err:  # pylint: disable=broad-except
+        errors.add(path, "{} is invalid, not a valid {} - {}", cls.name, fmt, err)
+        return False
+    return True
+
+
+def formats_valid(cls: DefinitionBase, values: Sequence[Any]) -> bool:
+    """
+    Determine if all the given values are valid for the format of a given Primitive type
+    :param cls: Primitive type to validate
+    :param values: values to validate
+    :return: True/False if all the values are valid, or the type has no format
+    """
+    if fmt := cls.__options__.format:
+        try:
+            for val in values:
+                validate_format(cls, fmt, val)
+        except Exception:  # pylint: disable=broad-except
+            return False
+    return True
+
+
 class Binary(DefinitionBase):
     """
     A sequence of octets. Length is the number of octets.
     """
     __root__: str
     __options__ = Options(data_type="Binary")  # pylint: disable=used-before-assignment
+    _data: Optional[bytes] = PrivateAttr(None)  # decoded octets of the instance
 
     # Validation
     @root_validator(pre=True)
@@ -50,19 +117,69 @@ class Binary(DefinitionBase):
         :raise ValueError: invalid data given
         :return: original value
         """
-        val = value.get("__root__", None)
-        if fmt := cls.__options__.format:
-            validate_format(cls, fmt, val)
-        val_len = len(val)
+        data = cls.decode(value.get("__root__", None))
+        if (fmt := cls.__options__.format) and fmt not in BINARY_ENCODINGS:
+            validate_format(cls, fmt, data)
         min_len = cls.__options__.minv or 0
-        max_len = get_max_len_binary(cls)
-        #TODO: get byte length?
-        if min_len > val_len:
-            raise ValidationError(f"{cls.name} is invalid, minimum length of {min_len} bytes not met")
-        if max_len < val_len:
-            raise ValidationError(f"{cls.name} is invalid, maximum length of {max_len} bytes exceeded")
+        if min_len > len(data):
+            raise ValueError(f"{cls.name} is invalid, minimum length of {min_len} bytes not met")
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, str):
+            errors.add(path, "{} is invalid, expected a string", cls.name)
+            return
+        try:
+            data = cls.decode(value)
+        except ValueError as err:
+            errors.add(path, "{}", err)
+            return
+        if (fmt := cls.__options__.format) and fmt not in BINARY_ENCODINGS and not check_format(cls, fmt, data, path, errors):
+            return
+        if (min_len := cls.__options__.minv or 0) > len(data):
+            errors.add(path, "{} is invalid, minimum length of {} bytes not met", cls.name, min_len)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        if not all(type(v) is str for v in values):  # pylint: disable=unidiomatic-typecheck
+            return False
+        try:
+            decoded = list(map(cls.decode, values))
+        except ValueError:
+            return False
+        if decoded and (cls.__options__.minv or 0) > min(map(len, decoded)):
+            return False
+        fmt = cls.__options__.format
+        return formats_valid(cls, decoded) if fmt and fmt not in BINARY_ENCODINGS else True
+
+    # Helpers
+    @classmethod
+    def decode(cls, value: str) -> bytes:
+        """
+        Decode a value of the Binary type, the maximum length is checked before the value is decoded
+        :param value: encoded value
+        :raise ValueError: value is not validly encoded or exceeds the maximum length
+        :return: decoded octets
+        """
+        fmt = cls.__options__.format
+        max_len = get_max_len_binary(cls)
+        if not isinstance(value, str):
+            raise ValueError(f"{cls.name} is invalid, expected a string")
+        if len(value) * BINARY_ENCODINGS.get(fmt, 3 / 4) > max_len + 2:
+            raise ValueError(f"{cls.name} is invalid, maximum length of {max_len} bytes exceeded")
+        data = decode_binary(value, fmt)
+        if max_len < len(data):
+            raise ValueError(f"{cls.name} is invalid, maximum length of {max_len} bytes exceeded")
+        return data
+
+    @property
+    def data(self) -> memoryview:
+        """The decoded octets of the value, decoded once per instance"""
+        if self._data is None:
+            self._data = self.decode(self.__root__)
+        return memoryview(self._data)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -77,6 +194,15 @@ class Boolean(DefinitionBase):
     __root__: bool
     __options__ = Options(data_type="Boolean")  # pylint: disable=used-before-assignment
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, bool):
+            errors.add(path, "{} is invalid, expected a boolean", cls.name)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        return all(type(v) is bool for v in values)  # pylint: disable=unidiomatic-typecheck
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -112,6 +238,29 @@ class Integer(DefinitionBase):
             raise ValidationError(f"{cls.name} is invalid, maximum of {max_val} exceeded")
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, int) or isinstance(value, bool):
+            errors.add(path, "{} is invalid, expected an integer", cls.name)
+            return
+        if (fmt := cls.__options__.format) and not check_format(cls, fmt, str(value), path, errors):
+            return
+        if (min_val := cls.__options__.minv or 0) > value:
+            errors.add(path, "{} is invalid, minimum of {} not met", cls.name, min_val)
+        elif (max_val := cls.__options__.maxv or 0) != 0 and max_val < value:
+            errors.add(path, "{} is invalid, maximum of {} exceeded", cls.name, max_val)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        if not values:
+            return True
+        if not all(type(v) is int for v in values):  # pylint: disable=unidiomatic-typecheck
+            return False
+        max_val = cls.__options__.maxv or 0
+        if (cls.__options__.minv or 0) > min(values) or (max_val != 0 and max_val < max(values)):
+            return False
+        return formats_valid(cls, list(map(str, values)) if cls.__options__.format else values)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -147,6 +296,29 @@ class Number(DefinitionBase):
             raise ValidationError(f"{cls.name} is invalid, maximum of {max_val} exceeded")
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            errors.add(path, "{} is invalid, expected a number", cls.name)
+            return
+        if (fmt := cls.__options__.format) and not check_format(cls, fmt, str(value), path, errors):
+            return
+        if (min_val := cls.__options__.minf or 0) > value:
+            errors.add(path, "{} is invalid, minimum of {} not met", cls.name, min_val)
+        elif (max_val := cls.__options__.maxf or 0) != 0 and max_val < value:
+            errors.add(path, "{} is invalid, maximum of {} exceeded", cls.name, max_val)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        if not all(type(v) in (int, float) for v in values):  # pylint: disable=unidiomatic-typecheck
+            return False
+        # Compare each value, min/max are not reliable with NaN values
+        min_val = cls.__options__.minf or 0
+        max_val = cls.__options__.maxf or 0
+        if any(min_val > v for v in values) or (max_val != 0 and any(max_val < v for v in values)):
+            return False
+        return formats_valid(cls, list(map(str, values)) if cls.__options__.format else values)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -182,6 +354,30 @@ class String(DefinitionBase):
             raise ValueError(f"{cls.name} is invalid, maximum length of {max_len} characters exceeded")
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, str):
+            errors.add(path, "{} is invalid, expected a string", cls.name)
+            return
+        if (fmt := cls.__options__.format) and not check_format(cls, fmt, value, path, errors):
+            return
+        val_len = len(value)
+        if (min_len := cls.__options__.minv or 0) > val_len:
+            errors.add(path, "{} is invalid, minimum length of {} characters not met", cls.name, min_len)
+        elif (max_len := get_max_len(cls)) < val_len:
+            errors.add(path, "{} is invalid, maximum length of {} characters exceeded", cls.name, max_len)
+
+    @classmethod
+    def batch_valid(cls, values: Sequence[Any]) -> bool:
+        if not values:
+            return True
+        if not all(type(v) is str for v in values):  # pylint: disable=unidiomatic-typecheck
+            return False
+        lengths = list(map(len, values))
+        if (cls.__options__.minv or 0) > min(lengths) or get_max_len(cls) < max(lengths):
+            return False
+        return formats_valid(cls, values)
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -2,18 +2,105 @@
 JADN Structure Types
 """
 from enum import Enum, EnumMeta
-from typing import Any, ClassVar, Optional, Union
-from pydantic import Extra, root_validator
+from typing import Any, Callable, ClassVar, Dict, Hashable, NoReturn, Optional, Union
+from pydantic import Extra, ValidationError, root_validator
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import ModelField  # pylint: disable=no-name-in-module
 from pydantic.utils import GetterDict
 
 from jadnschema.schema.info import Config
-from jadnschema.utils.general import get_max_v
+from jadnschema.utils.general import canonical, canonical_unordered, get_max_v
 
+from .check import CheckErrors, pointer
 from .definitionBase import DefinitionBase, DefinitionMeta
 from .options import Options  # pylint: disable=unused-import
-from .primitives import validate_format
+from .primitives import Binary, Boolean, Integer, Number, String, validate_format
 
 __all__ = ["Array", "ArrayOf", "Choice", "Enumerated", "Map", "MapOf", "Record"]
+PRIMITIVE_TYPES = {c.__name__: c for c in (Binary, Boolean, Integer, Number, String)}
+
+
+def check_count(cls: DefinitionBase, count: int, path: str, errors: CheckErrors) -> NoReturn:
+    """
+    Check the number of values of a structure against its min/max options
+    :param cls: structure type to check
+    :param count: number of values given
+    :param path: JSON pointer of the value within the checked message
+    :param errors: found violations
+    """
+    if count < (cls.__options__.minv or 0):
+        errors.add(path, "{} is invalid, minimum property count not met", cls.name)
+    elif count > get_max_v(cls):
+        errors.add(path, "{} is invalid, maximum property count exceeded", cls.name)
+
+
+def check_fields(cls: DefinitionBase, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+    """
+    Check the values of a Map/Record type by field name
+    :param cls: structure type to check
+    :param value: value to check
+    :param path: JSON pointer of the value within the checked message
+    :param errors: found violations
+    """
+    if not isinstance(value, dict):
+        errors.add(path, "{} is invalid, expected an object", cls.name)
+        return
+    fields = cls._field_index()
+    for key in value:
+        if key not in fields:
+            errors.add(pointer(path, key), "KeyType of `{}` is not valid within the schema", key)
+    check_count(cls, len(value), path, errors)
+    tagged = tagged_fields(cls)
+    for key, field in fields.items():
+        if key in value:
+            if key in tagged and isinstance(field_cls := cls._field_class(field), type) and issubclass(field_cls, Choice):
+                field_cls._check_tagged(value.get(tagged[key]), value[key], pointer(path, key), errors)
+            else:
+                cls._check_field(field, value[key], pointer(path, key), errors)
+        elif field.field_info.extra["options"].isRequired():
+            errors.add(pointer(path, key), "{}.{} is required", cls.name, key)
+
+
+def tagged_fields(cls: DefinitionBase) -> Dict[str, str]:
+    """
+    Get the Choice fields of a Map/Record type whose tag is given by another field, built once per definition
+    :param cls: structure type to get the tagged fields of
+    :return: {choice field name: tag field name}
+    """
+    if (tagged := cls.__dict__.get("__tagged_fields__")) is None:
+        fields = cls._field_index()
+        ids = {str(f.field_info.extra["id"]): k for k, f in fields.items()}
+        tagged = {}
+        for key, field in fields.items():
+            if (tag_id := field.field_info.extra["options"].tagid) is not None and str(tag_id) in ids:
+                tagged[key] = ids[str(tag_id)]
+        setattr(cls, "__tagged_fields__", tagged)
+    return tagged
+
+
+def type_class(cls: DefinitionBase, type_: str) -> Optional[DefinitionBase]:
+    """
+    Get the definition class of a schema defined or primitive type
+    :param cls: structure type referencing the type
+    :param type_: name of the type
+    :return: definition class or None if the type is unknown
+    """
+    return cls.__config__.types.get(type_) or PRIMITIVE_TYPES.get(type_)
+
+
+def check_type(cls: DefinitionBase, type_: str, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+    """
+    Check a value against a schema defined or primitive type, used for the key/value types of ArrayOf/MapOf
+    :param cls: structure type being checked
+    :param type_: name of the type to check against
+    :param value: value to check
+    :param path: JSON pointer of the value within the checked message
+    :param errors: found violations
+    """
+    if val_cls := type_class(cls, type_):
+        val_cls._check(value, path, errors)
+    elif not isinstance(value, (int, float, str)):
+        errors.add(path, "Value of `{}` is not valid within the schema", value)
 
 
 # Meta Classes
@@ -75,12 +162,14 @@ class Array(DefinitionBase):
             value = value._obj
 
             if fmt := cls.__options__.format:
-                print(f"Array format: {value}")
-                validate_format(cls, fmt, value)
+                parts = validate_format(cls, fmt, value)
 
                 # special case : format MTI3LjAuMC4x/30 to [MTI3LjAuMC4x, 30]
                 if isinstance(value, (list, tuple)):
                     value = value
+                elif isinstance(parts, list):
+                    # network formats return the split address and prefix
+                    value = parts
                 elif '/' in value:
                     val = value.split("/")
                     value = []
@@ -106,6 +195,30 @@ class Array(DefinitionBase):
 
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if fmt := cls.__options__.format:
+            try:
+                parts = validate_format(cls, fmt, value)
+            except Exception as err:  # pylint: disable=broad-except
+                errors.add(path, "{} is invalid, not a valid {} - {}", cls.name, fmt, err)
+                return
+            # special case : format MTI3LjAuMC4x/30 to [MTI3LjAuMC4x, 30]
+            if isinstance(value, str):
+                value = parts if isinstance(parts, list) else [int(v) if v.isdigit() else v for v in value.split("/")]
+        if not isinstance(value, list):
+            errors.add(path, "{} is invalid, expected an array", cls.name)
+            return
+        fields = list(cls._field_index().values())
+        if len(value) > len(fields):
+            errors.add(path, "{} is invalid, too many values", cls.name)
+        check_count(cls, len(value), path, errors)
+        for idx, field in enumerate(fields):
+            if idx < len(value) and value[idx] is not None:
+                cls._check_field(field, value[idx], pointer(path, idx), errors)
+            elif field.field_info.extra["options"].isRequired():
+                errors.add(pointer(path, idx), "{}.{} is required", cls.name, field.alias)
+
     class Options:
         data_type = "Array"
 
@@ -143,13 +256,16 @@ class ArrayOf(DefinitionBase):
         if len(val) > maxProps:
             raise ValueError("maximum property count exceeded")
 
+        if (idx := cls.duplicate_index(val)) != -1:
+            raise ValueError(f"{cls.name} is invalid, duplicate value at index {idx}")
+
         vtype = cls.__options__.vtype
         if not vtype or vtype is None:
             raise ValueError(f"ValueType of `{vtype}` is unknown")   
                 
-        # Check known type value objects
-        if val_cls := cls.__config__.types.get(vtype):
-            if isinstance(val, list):
+        # Check known type value objects, individually if the batch check fails to find the invalid value
+        if val_cls := type_class(cls, vtype):
+            if isinstance(val, list) and not val_cls.batch_valid(val):
                for v in val:
                     try:
                         val_cls.validate(v) 
@@ -168,6 +284,20 @@ class ArrayOf(DefinitionBase):
 
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, list):
+            errors.add(path, "Expected ArrayOf values")
+            return
+        check_count(cls, len(value), path, errors)
+        if (idx := cls.duplicate_index(value)) != -1:
+            errors.add(pointer(path, idx), "{} is invalid, duplicate value", cls.name)
+        vtype = cls.__options__.vtype
+        if (val_cls := type_class(cls, vtype)) and val_cls.batch_valid(value):
+            return
+        for idx, val in enumerate(value):
+            check_type(cls, vtype, val, pointer(path, idx), errors)
+
     # Helpers
     @classmethod
     def expandCompact(cls, value: Any) -> Any:
@@ -178,6 +308,48 @@ class ArrayOf(DefinitionBase):
             raise ValueError(f"ValueType of `{vtype}` is not valid within the schema")
         return value
 
+    @classmethod
+    def canonical(cls, value: Any) -> Hashable:
+        """
+        Convert the given array to a hashable canonical form, `set`/`unordered` arrays are independent of the item order
+        :param value: array to convert
+        :return: canonical form of the array
+        """
+        if not isinstance(value, (list, tuple)):
+            return canonical(value)
+        itms = map(cls._item_canonical(), value)
+        if cls.__options__.set or cls.__options__.unordered:
+            return canonical_unordered(itms)
+        return list, tuple(itms)
+
+    @classmethod
+    def duplicate_index(cls, value: list) -> int:
+        """
+        Find the first duplicate item of a `unique`/`set` array, items are compared by their canonical form
+        :param value: array to check
+        :return: index of the first duplicate item or -1 if the items are unique or the array may contain duplicates
+        """
+        if not (cls.__options__.unique or cls.__options__.set):
+            return -1
+        item_canonical = cls._item_canonical()
+        seen = set()
+        for idx, val in enumerate(value):
+            key = item_canonical(val)
+            if key in seen:
+                return idx
+            seen.add(key)
+        return -1
+
+    @classmethod
+    def _item_canonical(cls) -> Callable[[Any], Hashable]:
+        """
+        Get the canonical form function of the array items
+        :return: canonical form function of the value type
+        """
+        if val_cls := cls.__config__.types.get(cls.__options__.vtype):
+            return val_cls.canonical
+        return canonical
+
     class Options:
         data_type = "ArrayOf"
 
@@ -213,7 +385,95 @@ class Choice(DefinitionBase, metaclass=OptionalFieldsMeta):
         # Else object found, regular pydantic validation
         else:
             return value
-        
+
+    @classmethod
+    def validate(cls, value: Any) -> "Choice":
+        """
+        Validate the value as a Choice type, an object is dispatched by its key and only the selected field is validated
+        :param value: value to validate
+        :raise ValidationError: invalid value given
+        :return: validated Choice instance
+        """
+        if isinstance(value, dict) and "__root__" not in value:
+            if len(value) != 1:
+                raise ValidationError([ErrorWrapper(ValueError(f"Choice type should only have one field, not {len(value)}"), loc="__root__")], cls)
+            return cls.validate_tagged(*next(iter(value.items())))
+        return super().validate(value)
+
+    @classmethod
+    def validate_tagged(cls, tag: str, value: Any) -> "Choice":
+        """
+        Validate a value of the Choice type against the field selected by the tag
+        The root validators of the type are run on the selected field, unknown tags are validated by pydantic for an extensible type
+        :param tag: name of the selected field, the key of the value or the value of an explicit tag field
+        :param value: value of the selected field
+        :raise ValidationError: invalid tag or value given
+        :return: validated Choice instance
+        """
+        if (field := cls._tag_index().get(tag)) is None:
+            if cls.__options__.extend:
+                return super().validate({str(tag): value})
+            raise ValidationError([ErrorWrapper(ValueError(f"Value `{tag}` is not valid for {cls.name}"), loc="__root__")], cls)
+        values = {field.alias: value}
+        try:
+            for validator in cls.__pre_root_validators__:
+                values = validator(cls, values)
+            val, err = field.validate(values.get(field.alias), {}, loc=field.alias, cls=cls)
+            if err:
+                raise ValidationError([err], cls)
+            values = {field.name: val}
+            for _, validator in cls.__post_root_validators__:
+                values = validator(cls, values)
+        except ValidationError:
+            raise
+        except (ValueError, TypeError, AssertionError) as err:
+            raise ValidationError([ErrorWrapper(err, loc="__root__")], cls) from err
+        return cls.construct(_fields_set={field.name}, **values)
+
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if isinstance(value, str):
+            if value not in cls._field_index():
+                errors.add(path, "Value `{}` is not valid for {}", value, cls.name)
+        elif not isinstance(value, dict):
+            errors.add(path, "{} is invalid, expected an object", cls.name)
+        elif len(value) != 1:
+            errors.add(path, "Choice type should only have one field, not {}", len(value))
+        else:
+            key, val = next(iter(value.items()))
+            cls._check_tagged(key, val, pointer(path, key), errors)
+
+    @classmethod
+    def _check_tagged(cls, tag: Any, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        """
+        Check a value of the Choice type against the field selected by the tag
+        :param tag: name of the selected field, the key of the value or the value of an explicit tag field
+        :param value: value of the selected field
+        :param path: JSON pointer of the value within the checked message
+        :param errors: found violations
+        """
+        if field := cls._tag_index().get(tag):
+            cls._check_field(field, value, path, errors)
+        elif not cls.__options__.extend:
+            errors.add(path, "Value `{}` is not valid for {}", tag, cls.name)
+
+    @classmethod
+    def _tag_index(cls) -> Dict[Union[int, str], ModelField]:
+        """
+        Get the fields of the Choice by their tag, the field id (as an integer or a string key) with the id option
+        and the field name otherwise, built once per definition
+        :return: fields by tag
+        """
+        if (index := cls.__dict__.get("__tag_index__")) is None:
+            if cls.__options__.id:
+                index = {}
+                for field in cls._field_index().values():
+                    f_id = field.field_info.extra["id"]
+                    index[f_id] = index[str(f_id)] = field
+            else:
+                index = cls._field_index()
+            setattr(cls, "__tag_index__", index)
+        return index
 
     class Options:
         data_type = "Choice"
@@ -257,6 +517,15 @@ class Enumerated(DefinitionBase, metaclass=EnumeratedMeta):  # pylint: disable=i
                     return value
         raise ValueError(f"Value `{val}` is not valid for {cls.name}")
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if cls.__options__.id:
+            valid = any(value == v.value.extra.get("id", None) for v in cls.__enums__)
+        else:
+            valid = isinstance(value, str) and value in cls.__enums__.__members__
+        if not valid:
+            errors.add(path, "Value `{}` is not valid for {}", value, cls.name)
+
     # Helpers
     @classmethod
     def expandCompact(cls, value: int) -> str:
@@ -298,6 +567,10 @@ class Map(DefinitionBase):
 
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        check_fields(cls, value, path, errors)
+
     class Config:
         extra = Extra.allow
 
@@ -335,15 +608,18 @@ class MapOf(DefinitionBase):
             raise ValueError("maximum property count exceeded")      
 
         ktype = cls.__options__.ktype
-        k_cls = cls.__config__.types.get(ktype) 
+        k_cls = type_class(cls, ktype)
         if not ktype or ktype is None:
             raise ValueError(f"KeyType of `{ktype}` is not valid within the schema")   
 
         vtype = cls.__options__.vtype
-        v_cls = cls.__config__.types.get(vtype)
+        v_cls = type_class(cls, vtype)
         if not vtype or vtype is None:
             raise ValueError(f"ValueType of `{vtype}` is not valid within the schema")                
 
+        if k_cls and v_cls and k_cls.batch_valid(list(val.keys())) and v_cls.batch_valid(list(val.values())):
+            return value
+
         for k, v in val.items():
             try:
                 k_cls.validate(k) 
@@ -356,6 +632,20 @@ class MapOf(DefinitionBase):
     
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        if not isinstance(value, dict):
+            errors.add(path, "{} is invalid, expected an object", cls.name)
+            return
+        check_count(cls, len(value), path, errors)
+        ktype, vtype = cls.__options__.ktype, cls.__options__.vtype
+        k_cls, v_cls = type_class(cls, ktype), type_class(cls, vtype)
+        if k_cls and v_cls and k_cls.batch_valid(list(value.keys())) and v_cls.batch_valid(list(value.values())):
+            return
+        for key, val in value.items():
+            check_type(cls, ktype, key, pointer(path, key), errors)
+            check_type(cls, vtype, val, pointer(path, key), errors)
+
     # Helpers
     @classmethod
     def expandCompact(cls, value: dict) -> dict:
@@ -395,8 +685,19 @@ class Record(DefinitionBase):
         if len(value) > maxProps:
             raise ValueError("maximum property count exceeded")
 
+        # Explicitly tagged Choice values are validated against the field selected by the tag field
+        for key, tag_key in tagged_fields(cls).items():
+            if key in value and tag_key in value and not isinstance(value[key], DefinitionBase):
+                field_cls = cls._field_class(cls._field_index()[key])
+                if isinstance(field_cls, type) and issubclass(field_cls, Choice):
+                    value = {**value, key: field_cls.validate_tagged(value[tag_key], value[key])}
+
         return value
 
+    @classmethod
+    def _check(cls, value: Any, path: str, errors: CheckErrors) -> NoReturn:
+        check_fields(cls, value, path, errors)
+
     class Config:
         extra = Extra.forbid
 
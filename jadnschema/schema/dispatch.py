@@ -0,0 +1,134 @@
+"""
+JADN Export Dispatch
+Select the exported types a value may be an instance of without validating the value against each export
+"""
+from typing import Any, Dict, FrozenSet, Hashable, List, NamedTuple, NoReturn, Optional, Set
+from .definitions import Definition
+__all__ = ["ExportIndex", "value_kind"]
+
+# JSON value kinds accepted by each base type: {data type: kinds}
+TYPE_KINDS = {
+    "Binary": ("string", ),
+    "Boolean": ("boolean", ),
+    "Integer": ("integer", ),
+    "Number": ("number", "integer"),
+    "String": ("string", ),
+    "Enumerated": ("string", ),
+    "Choice": ("object", "string"),
+    "Array": ("array", ),
+    "ArrayOf": ("array", ),
+    "Map": ("object", ),
+    "MapOf": ("object", ),
+    "Record": ("object", "array")  # Compact Records are serialized as arrays
+}
+
+
+def value_kind(value: Any) -> Optional[str]:
+    """
+    Get the JSON value kind of a deserialized value
+    :param value: value to get the kind of
+    :return: object, array, string, boolean, integer, number, or None if the value is not a JSON value
+    """
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    return None
+
+
+class Discriminator(NamedTuple):
+    """
+    Keys an object must have to be an instance of an exported type
+    """
+    export: str               #: Name of the exported type
+    order: int                #: Position of the type within the exports
+    required: FrozenSet[str]  #: Keys the object must have
+    single: bool = False      #: The object must have only one key, a Choice tag
+
+
+class ExportIndex:
+    """
+    Discriminator index of the exported types of a schema, built once from the required top-level keys of the
+    Map/Record exports, the tags of the Choice exports, the items of the Enumerated exports and the value kinds
+    of all exports. Exports without a discriminator, such as MapOf or Records without required fields, are only
+    candidates for objects that no keyed export matches.
+    """
+    __slots__ = ("exports", "objects", "keys", "kinds", "open", "values")
+    exports: List[str]                     # Exported type names in order
+    objects: List[str]                     # Exports accepting objects
+    keys: Dict[str, List[Discriminator]]   # {key: discriminators anchored by the key}
+    kinds: Dict[str, List[str]]            # {value kind: exports accepting values of the kind other than objects}
+    open: List[str]                        # Object exports without a discriminator
+    values: Dict[str, Set[Hashable]]       # {Enumerated/Choice export: valid scalar values}
+
+    def __init__(self, types: Dict[str, Definition], exports: List[str]):
+        self.exports = [e for e in exports if e in types]
+        self.objects = []
+        self.keys = {}
+        self.kinds = {}
+        self.open = []
+        self.values = {}
+        for order, export in enumerate(self.exports):
+            def_cls = types[export]
+            kinds = TYPE_KINDS.get(def_cls.data_type, ())
+            if def_cls.data_type == "Enumerated":
+                if def_cls.__options__.id:
+                    kinds = ("integer", )
+                    self.values[export] = {v.value.extra.get("id") for v in def_cls.__enums__}
+                else:
+                    self.values[export] = set(def_cls.__enums__.__members__)
+            elif def_cls.data_type == "Choice":
+                self.values[export] = set(def_cls._field_index())
+            for kind in kinds:
+                if kind == "object":
+                    self.objects.append(export)
+                    self._add_object(def_cls, export, order)
+                else:
+                    self.kinds.setdefault(kind, []).append(export)
+
+    def _add_object(self, def_cls: Definition, export: str, order: int) -> NoReturn:
+        fields = def_cls._field_index()
+        if def_cls.data_type == "MapOf" or def_cls.__options__.id or not fields:
+            self.open.append(export)
+        elif def_cls.data_type == "Choice":
+            for tag in fields:
+                self.keys.setdefault(tag, []).append(Discriminator(export, order, frozenset((tag, )), True))
+        elif required := [k for k, f in fields.items() if f.field_info.extra["options"].isRequired()]:
+            # Anchored by the first required key, the object must have all required keys
+            self.keys.setdefault(required[0], []).append(Discriminator(export, order, frozenset(required)))
+        else:
+            self.open.append(export)
+
+    def candidates(self, value: Any) -> List[str]:
+        """
+        Get the exported types the value may be an instance of, in export order
+        :param value: deserialized value
+        :return: names of the candidate exports, a single name unless the value's shape is ambiguous
+        """
+        kind = value_kind(value)
+        if kind == "object":
+            if value and all(str(k).isdigit() for k in value):
+                # Compact objects have field ids as keys, the exports can't be told apart by key
+                return list(self.objects)
+            keys = value.keys()
+            matched = {}
+            for key in keys:
+                for disc in self.keys.get(key, ()):
+                    if (len(keys) == 1 if disc.single else disc.required <= keys):
+                        matched.setdefault(disc.export, disc.order)
+            if matched:
+                return sorted(matched, key=matched.get)
+            return list(self.open)
+
+        candidates = self.kinds.get(kind, [])
+        if self.values:
+            candidates = [e for e in candidates if e not in self.values or value in self.values[e]]
+        return list(candidates)
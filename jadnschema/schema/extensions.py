@@ -2,14 +2,13 @@
 JADN Schema Extension removal functions
 """
 import os
-import inflect
 
 from dataclasses import dataclass, field
-from typing import Dict, Generator, List, NoReturn, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, NoReturn, Optional, Set, Tuple, Union
 from .definitions import Options
 from .consts import CORE_TYPES, DEF_ORDER_FILE_NAMES, EXTENSIONS, ID_OPTIONS, OPTION_ID
 from ..exceptions import SchemaException
-__all__ = ["unfold_extensions"]
+__all__ = ["DefType", "unfold_definitions", "unfold_extensions"]
 
 
 @dataclass
@@ -98,152 +97,80 @@ def get_def_order(basedir: str = os.path.curdir) -> Tuple[str, ...]:
 
 
 # Extension unfolding/simplify
-def unfold_link(defs: DefinitionDict, sys: str) -> NoReturn:
-    """
-    Replace Key and Link options with explicit types
-    :param defs:
-    :param sys:
-    :return:
-    """
-    ltypes = []     # Types that have links
-    keys = {}       # Key names for types that have keys
-
-    for type_def in tuple(defs.values()):
-        if len(type_def.fields) > 0 and type_def.type != "Enumerated":
-            for field_def in type_def.fields:
-                field_opts, type_opts = field_def.options.split()
-                if field_opts.key:
-                    delattr(field_opts, "key")
-                    new_name = f"{type_def.name}{sys}{field_def.name}"
-                    if new_name not in defs:
-                        defs[new_name] = DefType(
-                            name=new_name,
-                            type=field_def.type,
-                            options=type_opts,
-                            description=field_def.description
-                        )
-                    # Redirect field to explicit type definition
-                    field_def = DefType(
-                        name=new_name,
-                        type=new_name,
-                        options=field_opts
-                    )
-                    keys.update({type_def.name: new_name})
-                elif field_opts.link and type_def.name not in ltypes:
-                    ltypes.append(type_def.name)
-
-    for type_name in ltypes:
-        type_def = defs.get(type_name)
-        for field_def in type_def.fields:
-            field_opts, type_opts = field_def.options.split()
-            if field_opts.link:
-                delattr(field_def.options, "link")
-                if key_type := keys.get(field_def.type):
-                    field_def.type = key_type
-                else:
-                    raise SchemaException(f'{type_def.name}/{field_def.name}: "{field_def.type}" has no primary key')
-
-
-def unfold_multiplicity(defs: DefinitionDict, sys: str) -> NoReturn:
-    """
-    Replace field multiplicity with explicit ArrayOf type definitions
-    :param defs:
-    :param sys:
-    :return:
-    """
-    p = inflect.engine()
-    for type_def in tuple(defs.values()):
-        if len(type_def.fields) > 0 and type_def.type != "Enumerated":
-            for field_def in type_def.fields:
-                field_opts, type_opts = field_def.options.split()
-                if field_opts.maxc is not None and field_opts.maxc != 1:
-                    minc = field_opts.get("minc", 1) or 1
-                    new_name = [type_def.name, sys, p.plural(field_def.name) if p.get_count(field_def.name) == 1 else field_def.name]
-                    new_name = "".join(map(str.capitalize, new_name))
-                    # Point existing field to new ArrayOf
-                    if new_name not in defs:
-                        defs[new_name] = DefType(
-                            name=new_name,
-                            type="ArrayOf",
-                            options=Options(
-                                vtype=field_def.type if field_def.type != "ArrayOf" else type_opts.vtype,
-                                minv=max(minc, 1),  # Don't allow empty ArrayOf
-                                **({"maxv": field_opts.maxc} if field_opts.maxc > 1 else {}),  # maxv defaults to 0
-                                **({"unique": True} if type_opts.unique else {})  # Move unique option to ArrayOf
-                            ),
-                            description=field_def.description
-                        )
-                    delattr(field_opts, "maxc")
-                    field_def.type = new_name
-                    field_def.options = field_opts
-
-
-def unfold_anonymous_types(defs: DefinitionDict, sys: str) -> NoReturn:
-    """
-    Replace anonymous types in fields with explicit type definitions
-    :param defs:
-    :param sys:
-    :return:
-    """
-    for type_def in tuple(defs.values()):
-        if len(type_def.fields) > 0 and type_def.type != "Enumerated":
-            for field_def in type_def.fields:
-                # If FieldOptions contains a type option, create an explicit type
-                field_opts, type_opts = field_def.options.split()
-                if type_opts.dict(exclude_unset=True):
-                    # Move all type options to new type
-                    name = enum_pointer_name(type_opts, sys)  # If enum/pointer option, use derived enum typename
-                    new_name = [name] if name else [type_def.name, sys, field_def.name]
-                    new_name = "".join(map(str.capitalize, new_name)).replace("_", "-")
-                    if new_name not in defs:
-                        new_type = field_def.type if epx(type_opts) is None else "Enumerated"
-                        if new_type not in CORE_TYPES:  # Don't create a bad type definition
-                            raise SchemaException(f"{type_def.name}.{field_def.name} -> {new_type} is not a built in type")
-                        defs[new_name] = DefType(
-                            name=new_name,
-                            type=new_type,
-                            options=type_opts,
-                            description=field_def.description
-                        )
-                    # Redirect field to explicit type definition
-                    field_def.type = new_name
-                    field_def.options = field_opts
-
-
-def unfold_derived_enum(defs: DefinitionDict, sys: str) -> NoReturn:
+def unfold_derived_enum(defs: DefinitionDict, sys: str, derived: Iterable[str] = None, refs: Iterable[str] = None) -> Set[str]:
     """
     Generate Enumerated list of fields or JSON Pointers
-    :param defs:
-    :param sys:
-    :return:
+    Pointer paths are walked once per (type, base path) and derived types are expanded in dependency order
+    :param defs: type definitions to update
+    :param sys: character used to denote a system defined definition
+    :param derived: names of the derived Enumerated definitions, all definitions are checked if not given
+    :param refs: names of the ArrayOf/MapOf definitions, all definitions are checked if not given
+    :return: names of the added or modified definitions
     """
+    derived = {n: defs[n] for n in (defs if derived is None else derived) if defs[n].type == "Enumerated" and epx(defs[n].options) is not None}
+    refs = [n for n in (defs if refs is None else refs) if defs[n].type in ("ArrayOf", "MapOf")]
+    changed: Set[str] = set()
+    expanding: Set[str] = set()
+    paths: Dict[Tuple[str, str], Tuple[Tuple[int, str, str], ...]] = {}
+    walking: Set[str] = set()
+
+    def expand(def_name: str) -> NoReturn:  # Expand a derived Enumerated type after the type it is derived from
+        if def_name not in derived:
+            return
+        if def_name in expanding:
+            raise SchemaException(f"{def_name} is derived from itself")
+        expanding.add(def_name)
+        type_def = derived[def_name]
+        optx = epx(type_def.options)
+        items = enum_items if type_def.options.enum else pointer_items
+        type_def.fields = items(optx)
+        delattr(type_def.options, "enum")
+        delattr(type_def.options, "pointer")
+        del derived[def_name]
+        changed.add(def_name)
+        expanding.discard(def_name)
+
     def enum_items(def_name: str) -> List[EnumField]:
+        expand(def_name)
         if (def_type := defs.get(def_name)) and len(def_type.fields) > 0:
-            return [f.enum_field() for f in def_type.fields]
+            return [EnumField(*f.list()) if isinstance(f, EnumField) else f.enum() for f in def_type.fields]
         return []
 
-    def pointer_items(def_name: str) -> List[EnumField]:
-        def pathnames(d_name: str, base="") -> Generator[list, None, None]:  # Walk subfields of referenced type
-            if def_type := defs.get(d_name):
-                if len(def_type.fields) > 0:
-                    for f in def_type.fields:
-                        if f.options.dir:
-                            yield from pathnames(f.type, f"{f.name}/")
-                        else:
-                            yield [f.id, f"{base}{f.name}", f.description]
-            else:
+    def pathnames(d_name: str, base: str = "") -> Tuple[Tuple[int, str, str], ...]:  # Walk subfields of referenced type
+        key = (d_name, base)
+        if key not in paths:
+            if d_name in walking:
+                raise SchemaException(f"{d_name} has a circular pointer reference")
+            expand(d_name)
+            if (def_type := defs.get(d_name)) is None:
                 raise SchemaException(f"{d_name} does not exists within the schema")
+            walking.add(d_name)
+            items = []
+            for f in def_type.fields:
+                if isinstance(f, DefField) and f.options.dir:
+                    items.extend(pathnames(f.type, f"{base}{f.name}/"))
+                else:
+                    items.append((f.id, f"{base}{f.value if isinstance(f, EnumField) else f.name}", f.description))
+            walking.discard(d_name)
+            paths[key] = tuple(items)
+        return paths[key]
+
+    def pointer_items(def_name: str) -> List[EnumField]:
         return [EnumField(*f) for f in pathnames(def_name)]
 
-    def update_eref(enums: dict, opts: Options, optname: str) -> NoReturn:
+    def update_eref(enums: dict, type_def: DefType, optname: str) -> NoReturn:
+        opts = type_def.options
         if optVal := getattr(opts, optname):
             tmp_opts = Options([optVal] if optVal[0] in ID_OPTIONS else [])
             if name := enum_pointer_name(tmp_opts, sys):
+                changed.add(type_def.name)
                 if name in enums:  # Reference existing Enumerated type
                     setattr(opts, optname, enums[name])
                 else:  # Make new Enumerated type
-                    make_items = enum_items if opts.enum else pointer_items
+                    make_items = enum_items if tmp_opts.enum else pointer_items
                     setattr(opts, optname, name)
+                    enums[name] = name
+                    changed.add(name)
                     defs[name] = DefType(
                         name=name,
                         type="Enumerated",
@@ -251,32 +178,28 @@ def unfold_derived_enum(defs: DefinitionDict, sys: str) -> NoReturn:
                         fields=make_items(name.rsplit(sys, maxsplit=1)[0])
                     )
 
-    new_enums = {}
     # Replace enum/pointer options in Enumerated types with explicit items
-    for type_def in tuple(defs.values()):
-        if type_def.type == "Enumerated":
-            if ep_name := enum_pointer_name(type_def.options, sys):
-                optx = type_def.options.enum or type_def.options.pointer
-                items = enum_items if type_def.options.enum else pointer_items
-                type_def.fields = items(optx)
-                delattr(type_def.options, "enum")
-                delattr(type_def.options, "pointer")
-                new_enums[ep_name] = type_def.name
+    new_enums = {enum_pointer_name(d.options, sys): n for n, d in derived.items()}
+    for type_name in tuple(derived):
+        expand(type_name)
 
     # Create new Enumerated enum/pointer types if they don't already exist
-    for type_def in tuple(defs.values()):
-        if type_def.type in ("ArrayOf", "MapOf"):
-            update_eref(new_enums, type_def.options, "vtype")
-            update_eref(new_enums, type_def.options, "ktype")
+    for type_name in refs:
+        update_eref(new_enums, defs[type_name], "vtype")
+        update_eref(new_enums, defs[type_name], "ktype")
+    return changed
 
 
-def unfold_mapOf_enum(defs: DefinitionDict) -> NoReturn:
+def unfold_mapOf_enum(defs: DefinitionDict, mapofs: Iterable[str] = None) -> Set[str]:
     """
     Replace MapOf(enumerated key) with explicit Map
-    :param defs:
-    :return:
+    :param defs: type definitions to update
+    :param mapofs: names of the MapOf definitions, all definitions are checked if not given
+    :return: names of the modified definitions
     """
-    for type_name, type_def in tuple(defs.items()):
+    changed: Set[str] = set()
+    for type_name in tuple(defs if mapofs is None else mapofs):
+        type_def = defs[type_name]
         if type_def.type == "MapOf":
             ktype = type_def.options.ktype
             ktype = ktype[1:] if ktype.startswith(ENUM_ID) else ktype
@@ -293,6 +216,130 @@ def unfold_mapOf_enum(defs: DefinitionDict) -> NoReturn:
                         description=type_def.description,
                         fields=[DefField(id=f.id, name=f.value, type=value_type, options=Options(minc=0), description=f.description) for f in key_type.fields]
                     )
+                    changed.add(type_name)
+    return changed
+
+
+def unfold_definitions(defs: DefinitionDict, sys: str, extensions: Set[str] = None) -> Set[str]:
+    """
+    Remove the listed extensions or all extensions from the given definitions in place
+    Field level extensions (Link, Multiplicity, AnonymousType) are removed in a single traversal of the definitions,
+    type level extensions (DerivedEnum, MapOfEnum) are then applied to the definitions collected during the traversal
+    :param defs: type definitions to unfold, indexed by name
+    :param sys: character used to denote a system defined definition
+    :param extensions: the options to simplify
+        * AnonymousType:   Replace all anonymous type definitions with explicit
+        * Multiplicity:    Replace all multi-value fields with explicit ArrayOf type definitions
+        * DerivedEnum:     Replace all derived and pointer enumerations with explicit Enumerated type definitions
+        * MapOfEnum:       Replace all MapOf types with listed keys with explicit Map type definitions
+        * Link:            Replace Key and Link fields with explicit types
+    :return: names of the added or modified definitions
+    """
+    import inflect  # pylint: disable=import-outside-toplevel
+    exts = EXTENSIONS.union(extensions) if extensions else EXTENSIONS
+    p = inflect.engine()
+    changed: Set[str] = set()
+    derived: List[str] = []  # Enumerated types with enum/pointer options
+    refs: List[str] = []     # ArrayOf/MapOf types
+    keys = {}                # Key type names for types that have keys
+    links = []               # (type name, linked type, definition to redirect) for fields that are links
+
+    def add_def(type_def: DefType) -> NoReturn:
+        if type_def.name not in defs:
+            defs[type_def.name] = type_def
+            changed.add(type_def.name)
+            index_def(type_def)
+
+    def index_def(type_def: DefType) -> NoReturn:
+        if type_def.type == "Enumerated" and epx(type_def.options) is not None:
+            derived.append(type_def.name)
+        elif type_def.type in ("ArrayOf", "MapOf"):
+            refs.append(type_def.name)
+
+    def unfold_field(type_def: DefType, field_def: DefField) -> bool:
+        field_opts, type_opts = field_def.options.split()
+        link_def = None
+        if "Link" in exts:  # Replace Key and Link options with explicit types
+            if field_opts.key:
+                delattr(field_opts, "key")
+                new_name = f"{type_def.name}{sys}{field_def.name}"
+                add_def(DefType(name=new_name, type=field_def.type, options=type_opts, description=field_def.description))
+                keys[type_def.name] = new_name
+                field_def.type, type_opts = new_name, Options()
+            elif field_opts.link:
+                delattr(field_opts, "link")
+                link_def = field_def
+
+        multiple = "Multiplicity" in exts and field_opts.maxc is not None and field_opts.maxc != 1
+        unique = type_opts.unique if multiple else None
+        if unique:  # Move unique option to ArrayOf
+            delattr(type_opts, "unique")
+        vtype = field_def.type
+        if multiple and field_def.type == "ArrayOf":  # Repeated ArrayOf field uses the items directly
+            vtype, type_opts = type_opts.vtype, Options()
+
+        if "AnonymousType" in exts and type_opts.dict(exclude_unset=True):  # Expand inline definitions
+            name = enum_pointer_name(type_opts, sys)  # If enum/pointer option, use derived enum typename
+            new_name = [name] if name else [type_def.name, sys, field_def.name]
+            new_name = "".join(map(str.capitalize, new_name)).replace("_", "-")
+            if new_name not in defs:
+                new_type = field_def.type if epx(type_opts) is None else "Enumerated"
+                if new_type not in CORE_TYPES:  # Don't create a bad type definition
+                    raise SchemaException(f"{type_def.name}.{field_def.name} -> {new_type} is not a built in type")
+                add_def(DefType(name=new_name, type=new_type, options=type_opts, description=field_def.description))
+            field_def.type, type_opts = new_name, Options()
+
+        if multiple:  # Expand repeated types into ArrayOf definitions
+            minc = field_opts.minc or 1
+            new_name = [type_def.name, sys, p.plural(field_def.name) if p.get_count(field_def.name) == 1 else field_def.name]
+            new_name = "".join(map(str.capitalize, new_name))
+            if new_name not in defs:
+                add_def(DefType(
+                    name=new_name,
+                    type="ArrayOf",
+                    options=Options(
+                        vtype=vtype if field_def.type == "ArrayOf" else field_def.type,
+                        minv=max(minc, 1),  # Don't allow empty ArrayOf
+                        **({"maxv": field_opts.maxc} if field_opts.maxc > 1 else {}),  # maxv defaults to 0
+                        **({"unique": True} if unique else {})
+                    ),
+                    description=field_def.description
+                ))
+                link_def = defs[new_name] if link_def else None
+            delattr(field_opts, "maxc")
+            field_def.type, type_opts = new_name, Options()
+
+        if link_def is not None:
+            links.append((type_def.name, field_def.type if link_def is field_def else link_def.options.vtype, link_def))
+        options = Options(field_opts, type_opts)
+        if options != field_def.options:
+            field_def.options = options
+            return True
+        return False
+
+    # Single traversal of the existing definitions
+    for type_def in tuple(defs.values()):
+        index_def(type_def)
+        if type_def.type != "Enumerated" and len(type_def.fields) > 0:
+            for field_def in type_def.fields:
+                if unfold_field(type_def, field_def):
+                    changed.add(type_def.name)
+
+    for type_name, link_type, link_def in links:  # Redirect links to the explicit key types
+        if not (key_type := keys.get(link_type)):
+            raise SchemaException(f'{type_name}: "{link_type}" has no primary key')
+        if isinstance(link_def, DefField):
+            link_def.type = key_type
+            changed.add(type_name)
+        else:
+            link_def.options.vtype = key_type
+            changed.add(link_def.name)
+
+    if "DerivedEnum" in exts:  # Generate Enumerated list of fields or JSON Pointers
+        changed |= unfold_derived_enum(defs, sys, derived, refs)
+    if "MapOfEnum" in exts:  # Generate explicit Map from MapOf
+        changed |= unfold_mapOf_enum(defs, [r for r in refs if defs[r].type == "MapOf"])
+    return changed
 
 
 def unfold_extensions(types: list, sys: str, extensions: Set[str] = None) -> list:
@@ -308,17 +355,6 @@ def unfold_extensions(types: list, sys: str, extensions: Set[str] = None) -> lis
         * Link:            Replace Key and Link fields with explicit types
     :return: simplified type definitions
     """
-    exts = EXTENSIONS.union(extensions) if extensions else EXTENSIONS
     defs = {val[0]: DefType(*val) for val in types}
-
-    if "Link" in exts:  # Replace Key and Link options with explicit types
-        unfold_link(defs, sys)
-    if "Multiplicity" in exts:  # Expand repeated types into ArrayOf definitions
-        unfold_multiplicity(defs, sys)
-    if "AnonymousType" in exts:  # Expand inline definitions into named type definitions
-        unfold_anonymous_types(defs, sys)
-    if "DerivedEnum" in exts:  # Generate Enumerated list of fields or JSON Pointers
-        unfold_derived_enum(defs, sys)
-    if "MapOfEnum" in exts:  # Generate explicit Map from MapOf
-        unfold_mapOf_enum(defs)
+    unfold_definitions(defs, sys, extensions)
     return [d.list() for d in defs.values()]
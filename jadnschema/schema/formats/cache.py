@@ -0,0 +1,107 @@
+"""
+JADN Format Validation Cache
+Bounded memo of format validation results for formats that are costly to validate and see repeated values
+"""
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, NamedTuple, NoReturn, Tuple
+__all__ = ["CacheInfo", "FormatCache", "memoize"]
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a format cache
+    """
+    hits: int     #: Lookups answered from the cache
+    misses: int   #: Lookups that ran the validation
+    maxsize: int  #: Maximum number of cached results
+    maxkey: int   #: Maximum length of a cached value, longer values are not cached
+    size: int     #: Number of cached results
+
+
+class FormatCache:
+    """
+    Least recently used cache of validation results, both valid and invalid values are cached
+    The cache is bounded in entries and in key length so untrusted values cannot grow it without limit
+    """
+    __slots__ = ("_entries", "_lock", "hits", "misses", "maxkey", "maxsize")
+    _entries: "OrderedDict[str, Tuple[bool, Any]]"
+    hits: int
+    misses: int
+    maxkey: int
+    maxsize: int
+
+    def __init__(self, maxsize: int = 4096, maxkey: int = 255):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.maxkey = maxkey
+        self.maxsize = maxsize
+
+    def __call__(self, fun: Callable[[str], Any], val: str) -> Any:
+        """
+        Validate a value, using the cached result if available
+        :param fun: validation function
+        :param val: value to validate
+        :raise Exception: cached or raised exception of the validation function
+        :return: result of the validation function
+        """
+        if not isinstance(val, str) or len(val) > self.maxkey or self.maxsize <= 0:
+            return fun(val)
+        with self._lock:
+            entry = self._entries.get(val)
+            if entry is not None:
+                self._entries.move_to_end(val)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            try:
+                entry = (True, fun(val))
+            except (TypeError, ValueError) as err:
+                entry = (False, (type(err), err.args))
+            with self._lock:
+                self._entries[val] = entry
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        valid, rslt = entry
+        if valid:
+            return rslt
+        err_cls, args = rslt
+        raise err_cls(*args)
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache
+        :return: cache statistics
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, self.maxkey, len(self._entries))
+
+    def clear(self) -> NoReturn:
+        """
+        Remove all cached results and reset the statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def memoize(maxsize: int = 4096, maxkey: int = 255) -> Callable[[Callable[[str], Any]], Callable[[str], Any]]:
+    """
+    Decorator to cache the results of a format validation function, the cache is available as `cache` of the function
+    :param maxsize: maximum number of cached results
+    :param maxkey: maximum length of a cached value
+    :return: decorator
+    """
+    def wrapper(fun: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache = FormatCache(maxsize, maxkey)
+
+        @wraps(fun)
+        def validate(val: str) -> Any:
+            return cache(fun, val)
+
+        validate.cache = cache
+        return validate
+    return wrapper
@@ -1,7 +1,9 @@
 """
 JADN Validation Constants
 """
-__all__ = ["HOSTNAME_MAX_LENGTH"]
+__all__ = ["EMAIL_MAX_LENGTH", "HOSTNAME_MAX_LENGTH", "URL_SCHEME_MAX_LENGTH"]
 
 # Format Validation constants
 HOSTNAME_MAX_LENGTH = 255
+EMAIL_MAX_LENGTH = 254  # RFC 5321 § 4.5.3.1.3, path limit without the angle brackets
+URL_SCHEME_MAX_LENGTH = len("https://")
@@ -2,8 +2,9 @@
 JADN Internationalised Domain Names in Applications (IDNA) Formats
 """
 import re
-import idna.codec  # pylint: disable=unused-import
 
+from .cache import memoize
+from .consts import EMAIL_MAX_LENGTH, HOSTNAME_MAX_LENGTH, URL_SCHEME_MAX_LENGTH
 from .general import email
 from .network import hostname
 from ...utils import addKey
@@ -18,6 +19,7 @@ IDNA_Formats = {}
 
 
 @addKey(d=IDNA_Formats, k="idn-hostname")
+@memoize(maxkey=URL_SCHEME_MAX_LENGTH + HOSTNAME_MAX_LENGTH)
 def idn_hostname(val: str) -> str:
     """
     Validate an IDN Hostname - RFC 5890 § 2.3.2.3
@@ -28,6 +30,7 @@ def idn_hostname(val: str) -> str:
         raise TypeError(f"IDN Email given is not expected string, given {type(val)}")
 
     val = re.sub(r"^https?://", "", val)
+    import idna.codec  # pylint: disable=import-outside-toplevel,unused-import
     try:
         val = val.encode("idna")
     except Exception as err:
@@ -37,6 +40,7 @@ def idn_hostname(val: str) -> str:
 
 
 @addKey(d=IDNA_Formats, k="idn-email")
+@memoize(maxkey=EMAIL_MAX_LENGTH)
 def idn_email(val: str) -> str:
     """
     Validate an IDN Email - RFC 6531
@@ -50,6 +54,7 @@ def idn_email(val: str) -> str:
     if len(val) != 2:
         raise ValueError("IDN Email address invalid")
 
+    import idna.codec  # pylint: disable=import-outside-toplevel,unused-import
     try:
         val = b"@".join([v.encode("idna") for v in val]).decode("utf-8")
     except Exception as err:
@@ -2,26 +2,32 @@
 JADN Network Formats
 """
 import re
-import netaddr
 
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+from .cache import memoize
 from .consts import HOSTNAME_MAX_LENGTH
 from ...utils import addKey
 import base64
+if TYPE_CHECKING:  # netaddr is imported on first validation to keep import time down
+    import netaddr
 
 __all__ = [
     # All formats
     "NetworkFormats",
     # Specific
-    "hostname", "IPv4", "IPv6", "EUI", "IPv4_Address", "IPv6_Address", "IPv4_Network", "IPv6_Network"
+    "hostname", "IPv4", "IPv6", "EUI", "IPv4_Address", "IPv6_Address", "IPv4_Network", "IPv6_Network",
+    # Helpers
+    "is_ipv4", "is_ipv6", "validate_addresses"
 ]
 
 NetworkFormats = {}
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 
 
 # From https://stackoverflow.com/questions/2532053/validate-a-hostname-string
 @addKey(d=NetworkFormats)
+@memoize(maxkey=HOSTNAME_MAX_LENGTH + 1)  # hostname may have a trailing dot
 def hostname(val: str) -> str:
     """
     Check if valid Hostname - RFC 1034 § 3.1
@@ -47,33 +53,41 @@ def hostname(val: str) -> str:
 
 
 @addKey(d=NetworkFormats, k="ipv4")
-def IPv4(val: str) -> IPv4Address:
+def IPv4(val: str, as_object: bool = False) -> Union[IPv4Address, str]:
     """
     JSON Schema
     RFC 2673 § 3.2# "dotted-quad"
     :param val: IPv4 Address to validate
-    :return: None or Exception
+    :param as_object: return the address as an `IPv4Address`
+    :return: given address or address object
+    :raises: TypeError, ValueError
     """
     if not isinstance(val, str):
         raise TypeError(f"IPv4 address given is not expected string, given {type(val)}")
-    return IPv4Address(val)
+    if not is_ipv4(val):
+        raise ValueError(f"{val!r} does not appear to be an IPv4 address")
+    return IPv4Address(val) if as_object else val
 
 
 @addKey(d=NetworkFormats, k="ipv6")
-def IPv6(val: str) -> IPv6Address:
+def IPv6(val: str, as_object: bool = False) -> Union[IPv6Address, str]:
     """
     JSON Schema
     RFC 4291 § 2.2 "IPv6 address"
     :param val: IPv6 Address to validate
-    :return: None or Exception
+    :param as_object: return the address as an `IPv6Address`
+    :return: given address or address object
+    :raises: TypeError, ValueError
     """
     if not isinstance(val, str):
         raise TypeError(f"IPv6 address given is not expected string, given {type(val)}")
-    return IPv6Address(val)
+    if not is_ipv6(val):
+        raise ValueError(f"{val!r} does not appear to be an IPv6 address")
+    return IPv6Address(val) if as_object else val
 
 
 @addKey(d=NetworkFormats, k="eui")
-def EUI(val: Union[bytes, str]) -> netaddr.EUI:
+def EUI(val: Union[bytes, str]) -> "netaddr.EUI":
     """
     IEEE Extended Unique Identifier (MAC Address), EUI-48 or EUI-64
     :param val: EUI to validate
@@ -83,120 +97,156 @@ def EUI(val: Union[bytes, str]) -> netaddr.EUI:
         raise TypeError(f"EUI is not expected type, given {type(val)}")
 
     val = val if isinstance(val, str) else val.decode("utf-8")
+    import netaddr  # pylint: disable=import-outside-toplevel,redefined-outer-name
     return netaddr.EUI(val)
 
 
-# How to validate??
 @addKey(d=NetworkFormats, k="ipv4-addr")
-def IPv4_Address(val: str) -> IPv4Address:
+def IPv4_Address(val: Union[bytes, str], as_object: bool = False) -> Union[IPv4Address, bytes, str]:
     """
     IPv4 address as specified in RFC 791 § 3.1
-    :param val: IPv4 Address to validate
-    :return: None or Exception
+    :param val: base64 encoded IPv4 Address, or the decoded Binary value, to validate
+    :param as_object: return the address as an `IPv4Address`
+    :return: given address or address object
+    :raises: TypeError, ValueError
     """
-    # Convert val to bytes
-    try:
-        bytes = base64.b64decode(val)
-        val = bytes.decode("utf-8")
-    except Exception as e:
-            raise TypeError(f"{e}")
- 
-    if not isinstance(val, str):
-        raise TypeError(f"IPv4 address given is not expected string, given {type(val)}")
-    return IPv4Address(val)
+    addr = IPv4(b64_text(val))
+    return IPv4Address(addr) if as_object else val
 
 
-# How to validate??
 @addKey(d=NetworkFormats, k="ipv6-addr")
-def IPv6_Address(val: str) -> IPv6Address:
+def IPv6_Address(val: Union[bytes, str], as_object: bool = False) -> Union[IPv6Address, bytes, str]:
     """
     IPv6 address as specified in RFC 8200 § 3
-    :param val: IPv6 Address to validate
-    :return: None or Exception
+    :param val: base64 encoded IPv6 Address, or the decoded Binary value, to validate
+    :param as_object: return the address as an `IPv6Address`
+    :return: given address or address object
+    :raises: TypeError, ValueError
     """
-    # Convert val to bytes
-    try:
-        bytes = base64.b64decode(val)
-        val = bytes.decode("utf-8")
-    except Exception as e:
-            raise TypeError(f"{e}")
-    
-    if not isinstance(val, str):
-        raise TypeError(f"IPv6 address given is not expected string, given {type(val)}")
-    return IPv6Address(val)
+    addr = IPv6(b64_text(val))
+    return IPv6Address(addr) if as_object else val
 
 
 @addKey(d=NetworkFormats, k="ipv4-net")
-def IPv4_Network(val: Union[list, str, tuple]) -> Union[IPv4Address, IPv4Network]:
+def IPv4_Network(val: Union[list, str, tuple], as_object: bool = False) -> Union[IPv4Address, IPv4Network, list]:
     """
     Binary IPv4 address and Integer prefix length as specified in RFC 4632 § 3.1
-    :param val: IPv4 network address to validate
-    :return: None or exception
+    :param val: IPv4 network address to validate, base64 address and optional prefix as a string or text address and prefix as a list
+    :param as_object: return the network as an `IPv4Address`/`IPv4Network`
+    :return: address and prefix as a list, base64 address for a string, or network object
+    :raises: TypeError, ValueError
     """
-    if not isinstance(val, (list, str, tuple)):
-        raise TypeError(f"IPv4 Network is not expected type, given {type(val)}")
+    return _network(val, 4, as_object)
 
-    #val = val if isinstance(val, (list, tuple)) else val.split("/")
-    if isinstance(val, (list, tuple)):
-        val = val
-    elif '/' in val:
-        val = val.split("/")
-        try:
-            bytes = base64.b64decode(val[0]) #decode
-            bin = bytes.decode("utf-8")
-        except Exception as e:
-            raise TypeError(f"{e}")
-        val = [bin, val[1]]
-    else:
-        try:
-            bytes = base64.b64decode(val) #decode
-            val = [bytes.decode("utf-8")]
-        except Exception as e:
-            raise TypeError(f"{e}")
-    
-    if len(val) == 1:
-        return IPv4(val[0])
 
-    if len(val) != 2:
-        raise ValueError(f"IPv4 Network is not 2 values, given {len(val)}")
+@addKey(d=NetworkFormats, k="ipv6-net")
+def IPv6_Network(val: Union[list, str, tuple], as_object: bool = False) -> Union[IPv6Address, IPv6Network, list]:
+    """
+    Binary IPv6 address and Integer prefix length as specified in RFC 4291 § 2.3
+    :param val: IPv6 network address to validate, base64 address and optional prefix as a string or text address and prefix as a list
+    :param as_object: return the network as an `IPv6Address`/`IPv6Network`
+    :return: address and prefix as a list, base64 address for a string, or network object
+    :raises: TypeError, ValueError
+    """
+    return _network(val, 6, as_object)
 
-    val = "/".join(map(str, val))
-    return IPv4Network(val, strict=False)
+
+def validate_addresses(values: Iterable[Union[list, str, tuple]], fmt: str = "ipv4-net") -> List[int]:
+    """
+    Validate a list of addresses/networks of the same format
+    :param values: addresses to validate
+    :param fmt: network format of the addresses, one of `ipv4`, `ipv6`, `ipv4-addr`, `ipv6-addr`, `ipv4-net`, `ipv6-net`
+    :return: indexes of the invalid addresses
+    """
+    fun = NetworkFormats[fmt]
+    invalid = []
+    for idx, val in enumerate(values):
+        try:
+            fun(val)
+        except (TypeError, ValueError):
+            invalid.append(idx)
+    return invalid
+
+
+# Address parsing
+def is_ipv4(val: str) -> bool:
+    """
+    Determine if the text is an IPv4 dotted-quad, the same addresses as `ipaddress.IPv4Address` without creating one
+    :param val: text to check
+    :return: True/False if the text is a valid address
+    """
+    octets = val.split(".")
+    if len(octets) != 4:
+        return False
+    for octet in octets:
+        if not (0 < len(octet) <= 3 and octet.isascii() and octet.isdigit()):
+            return False
+        if (octet[0] == "0" and len(octet) > 1) or int(octet) > 255:
+            return False
+    return True
+
+
+def is_ipv6(val: str) -> bool:
+    """
+    Determine if the text is an IPv6 address, the same addresses as `ipaddress.IPv6Address` without creating one
+    :param val: text to check
+    :return: True/False if the text is a valid address
+    """
+    val, scope, scope_id = val.partition("%")
+    if scope and (not scope_id or "%" in scope_id):
+        return False
+    if "::" in val:
+        if val.count("::") > 1:
+            return False
+        head, _, tail = val.partition("::")
+        groups = (head.split(":") if head else []) + (tail.split(":") if tail else [])
+    else:
+        groups = val.split(":")
+    count = len(groups)
+    if groups and "." in groups[-1] and not val.endswith("::"):  # Only the last group may be a dotted-quad
+        if not is_ipv4(groups.pop()):
+            return False
+        count += 1
+    if count > 7 if "::" in val else count != 8:
+        return False
+    return all(0 < len(g) <= 4 and HEX_DIGITS.issuperset(g) for g in groups)
 
 
-@addKey(d=NetworkFormats, k="ipv6-net")
-def IPv6_Network(val: Union[list, str, tuple]) -> Union[IPv6Address, IPv6Network]:
+def b64_text(val: Union[bytes, str]) -> str:
     """
-    Binary IPv6 address and Integer prefix length as specified in RFC 4291 § 2.3
-    :param val: IPv6 network address to validate
-    :return: None or exception
+    Decode a base64 encoded address to text
+    :param val: base64 encoded address or the decoded octets of the address
+    :raises: TypeError
+    :return: address text
     """
+    try:
+        return (val if isinstance(val, bytes) else base64.b64decode(val)).decode("utf-8")
+    except Exception as err:
+        raise TypeError(f"{err}") from err
+
+
+def _network(val: Union[list, str, tuple], version: int, as_object: bool) -> Union[IPv4Address, IPv4Network, IPv6Address, IPv6Network, list, str]:
     if not isinstance(val, (list, str, tuple)):
-        raise TypeError(f"IPv6 Network is not expected type, given {type(val)}")
+        raise TypeError(f"IPv{version} Network is not expected type, given {type(val)}")
+    address, network, is_addr, max_prefix = (IPv4Address, IPv4Network, is_ipv4, 32) if version == 4 else (IPv6Address, IPv6Network, is_ipv6, 128)
 
-    #val = val if isinstance(val, (list, tuple)) else val.split("/")
     if isinstance(val, (list, tuple)):
-        val = val
-    elif '/' in val:
-        val = val.split("/")
-        try:
-            bytes = base64.b64decode(val[0]) #decode
-            bin = bytes.decode("utf-8")
-        except Exception as e:
-            raise TypeError(f"{e}")
-        val = [bin, val[1]]
+        addr, *prefix = (str(v) for v in val)
+        parts = val
     else:
-        try:
-            bytes = base64.b64decode(val) #decode
-            val = [bytes.decode("utf-8")]
-        except Exception as e:
-            raise TypeError(f"{e}")
-        
-    if len(val) == 1:
-        return IPv6(val[0])
-
-    if len(val) != 2:
-        raise ValueError(f"IPv6 Network is not 2 values, given {len(val)}")
-
-    val = "/".join(map(str, val))
-    return IPv6Network(val, strict=False)
+        b64_addr, sep, prefix_str = val.partition("/")
+        addr, prefix = b64_text(b64_addr), [prefix_str] if sep else []
+        parts = [b64_addr, int(prefix_str) if prefix_str.isdigit() else prefix_str] if sep else [b64_addr]
+
+    if not prefix:
+        if not is_addr(addr):
+            raise ValueError(f"{addr!r} does not appear to be an IPv{version} address")
+        return address(addr) if as_object else (val if isinstance(val, str) else parts)
+    if len(prefix) != 1:
+        raise ValueError(f"IPv{version} Network is not 2 values, given {len(prefix) + 1}")
+
+    prefix = prefix[0]
+    if not (is_addr(addr) and prefix.isascii() and prefix.isdigit() and int(prefix) <= max_prefix):
+        # Netmask prefixes & invalid networks, let ipaddress determine the validity
+        return network(f"{addr}/{prefix}", strict=False)
+    return network(f"{addr}/{prefix}", strict=False) if as_object else parts
@@ -2,17 +2,94 @@
 JADN RFC3339 Formats
 """
 import datetime
-import strict_rfc3339
+import re
 
+from functools import lru_cache
+from typing import Any, Callable, Dict, NoReturn
 from ... import utils
 __all__ = [
     # All formats
     "RFC3339_Formats",
     # Specific formats
-    "date_time", "date", "time"
+    "date_time", "date", "time",
+    # Helpers
+    "set_cache_size"
 ]
 
 RFC3339_Formats = {}
+CACHE_SIZE = 1024  # Parsed values cached per format, 0 disables the cache
+
+# RFC 3339 § 5.6 - date-time, full-date & partial-time (without fractions), matched against the whole value
+# Digits are ASCII only, `T` and `Z` may be lower case as allowed by the NOTE of § 5.6
+DATE_TIME = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})[Tt]([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]+))?(?:([Zz])|([+\-])([0-9]{2}):([0-9]{2}))")
+FULL_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+PARTIAL_TIME = re.compile(r"([0-9]{2}):([0-9]{2}):([0-9]{2})")
+
+
+def parse_date_time(val: str) -> datetime.datetime:
+    """
+    Parse a datetime - RFC 3339 § 5.6, the values are validated in a single pass while building the datetime
+    :param val: DateTime instance to parse
+    :raise ValueError: invalid datetime
+    :return: timezone aware datetime
+    """
+    if not (m := DATE_TIME.fullmatch(val)):
+        raise ValueError(f"{val} is not a valid RFC 3339 date-time")
+    year, month, day, hour, minute, second, frac, utc, sign, off_h, off_m = m.groups()
+    if utc:
+        tz = datetime.timezone.utc
+    else:
+        if not (int(off_h) <= 23 and int(off_m) <= 59):
+            raise ValueError(f"{val} has an invalid timezone offset")
+        offset = datetime.timedelta(hours=int(off_h), minutes=int(off_m))
+        tz = datetime.timezone(-offset if sign == "-" else offset)
+    micro = int(frac[:6].ljust(6, "0")) if frac else 0
+    # datetime validates the ranges of the values, including the days in the month
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), micro, tzinfo=tz)
+
+
+def parse_date(val: str) -> datetime.date:
+    """
+    Parse a date - RFC 3339 § 5.6 full-date
+    :param val: Date instance to parse
+    :raise ValueError: invalid date
+    :return: date
+    """
+    if not (m := FULL_DATE.fullmatch(val)):
+        raise ValueError(f"{val} is not a valid RFC 3339 full-date")
+    return datetime.date(*map(int, m.groups()))
+
+
+def parse_time(val: str) -> datetime.time:
+    """
+    Parse a time - RFC 3339 § 5.6 partial-time
+    :param val: Time instance to parse
+    :raise ValueError: invalid time
+    :return: time
+    """
+    if not (m := PARTIAL_TIME.fullmatch(val)):
+        raise ValueError(f"{val} is not a valid RFC 3339 partial-time")
+    return datetime.time(*map(int, m.groups()))
+
+
+def _build_parsers() -> Dict[str, Callable[[str], Any]]:
+    parsers = {"date-time": parse_date_time, "date": parse_date, "time": parse_time}
+    if CACHE_SIZE:
+        return {fmt: lru_cache(maxsize=CACHE_SIZE)(fun) for fmt, fun in parsers.items()}
+    return parsers
+
+
+_parsers = _build_parsers()
+
+
+def set_cache_size(size: int) -> NoReturn:
+    """
+    Set the number of parsed values cached per format, parsed values are immutable and are shared between calls
+    :param size: cache size, 0 disables the cache
+    """
+    global CACHE_SIZE  # pylint: disable=global-statement
+    CACHE_SIZE = size
+    _parsers.update(_build_parsers())
 
 
 @utils.addKey(d=RFC3339_Formats, k="date-time")
@@ -24,13 +101,7 @@ def date_time(val: str) -> datetime.datetime:
     """
     if not isinstance(val, str):
         raise TypeError(f"datetime given is not expected string, given {type(val)}")
-
-    try:
-        strict_rfc3339.validate_rfc3339(val)
-    except Exception as err:  # pylint: disable=broad-except
-        # TODO: change to better exception
-        raise ValueError from err
-    return datetime.datetime.fromisoformat(val)
+    return _parsers["date-time"](val)
 
 
 @utils.addKey(d=RFC3339_Formats)
@@ -42,12 +113,7 @@ def date(val: str) -> datetime.date:
     """
     if not isinstance(val, str):
         raise TypeError(f"date given is not expected string, given {type(val)}")
-    try:
-        d = datetime.datetime.strptime(val, '%Y-%m-%d').date()
-    except Exception as err:  # pylint: disable=broad-except
-        # TODO: change to better exception
-        raise ValueError from err
-    return d
+    return _parsers["date"](val)
 
 
 @utils.addKey(d=RFC3339_Formats)
@@ -59,9 +125,4 @@ def time(val: str) -> datetime.time:
     """
     if not isinstance(val, str):
         raise TypeError(f"time given is not expected string, given {type(val)}")
-    try:
-        t = datetime.datetime.strptime(val, '%H:%M:%S').time()
-    except Exception as err:  # pylint: disable=broad-except
-        # TODO: change to better exception
-        raise ValueError from err
-    return t
+    return _parsers["time"](val)
@@ -1,9 +1,10 @@
 """
 JADN RFC3987 Formats
 """
-import rfc3986
-
+from typing import TYPE_CHECKING
 from ...utils import addKey
+if TYPE_CHECKING:  # rfc3986 is imported on first validation to keep import time down
+    import rfc3986
 __all__ = [
     # All formats
     "RFC3986_Formats",
@@ -15,7 +16,7 @@ RFC3986_Formats = {}
 
 
 @addKey(d=RFC3986_Formats, k="uri")
-def uri(val: str) -> rfc3986.ParseResult:
+def uri(val: str) -> "rfc3986.ParseResult":
     """
     Validate an URI - RFC 3987
     :param val: URI instance to validate
@@ -24,6 +25,7 @@ def uri(val: str) -> rfc3986.ParseResult:
     if not isinstance(val, str):
         raise TypeError(f"uri given is not expected string, given {type(val)}")
 
+    import rfc3986  # pylint: disable=import-outside-toplevel,redefined-outer-name
     try:
         return rfc3986.urlparse(val)
     except Exception as err:  # pylint: disable=broad-except
@@ -32,7 +34,7 @@ def uri(val: str) -> rfc3986.ParseResult:
 
 
 @addKey(d=RFC3986_Formats, k="uri-reference")
-def uri_reference(val: str) -> rfc3986.URIReference:
+def uri_reference(val: str) -> "rfc3986.URIReference":
     """
     Validate an URI-Reference - RFC 3987
     :param val: URI-Reference instance to validate
@@ -41,6 +43,7 @@ def uri_reference(val: str) -> rfc3986.URIReference:
     if not isinstance(val, str):
         raise TypeError(f"uri-reference given is not expected string, given {type(val)}")
 
+    import rfc3986  # pylint: disable=import-outside-toplevel,redefined-outer-name
     try:
         return rfc3986.uri_reference(val)
     except Exception as err:  # pylint: disable=broad-except
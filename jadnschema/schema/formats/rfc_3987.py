@@ -1,8 +1,6 @@
 """
 JADN RFC3987 Formats
 """
-import rfc3987
-
 from typing import Any, Optional, TypedDict
 from ...utils import addKey
 __all__ = [
@@ -36,6 +34,7 @@ def iri(val: str) -> ParseResults:
     if not isinstance(val, str):
         raise TypeError(f"iri given is not expected string, given {type(val)}")
 
+    import rfc3987  # pylint: disable=import-outside-toplevel
     try:
         return ParseResults(**rfc3987.parse(val, rule="IRI"))
     except Exception as err:  # pylint: disable=broad-except
@@ -53,6 +52,7 @@ def iri_reference(val: str) -> ParseResults:
     if not isinstance(val, str):
         raise TypeError(f"iri given is not expected string, given {type(val)}")
 
+    import rfc3987  # pylint: disable=import-outside-toplevel
     try:
         return ParseResults(**rfc3987.parse(val, rule="IRI_reference"))
     except Exception as err:  # pylint: disable=broad-except
@@ -10,12 +10,14 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, NoReturn, Optional, Set, Union, get_args
 from pydantic import Field, root_validator
 from pydantic.main import ModelMetaclass, PrivateAttr  # pylint: disable=no-name-in-module
+from .backends import SchemaValidator, ValidatorBackend, ValidatorBackends
 from .baseModel import BaseModel
 from .consts import EXTENSIONS, OPTION_ID
 from .info import Exports, Information
-from .definitions import DefTypes, Definition, DefinitionBase, make_def
+from .definitions import CheckResult, DefTypes, Definition, DefinitionBase, ErrorMode, make_def
 from .definitions.field import getFieldType
-from .extensions import unfold_extensions
+from .dispatch import ExportIndex
+from .extensions import DefType, unfold_definitions
 from .formats import ValidationFormats
 from ..exceptions import FormatError, SchemaException
 __pdoc__ = {
@@ -24,20 +26,24 @@ __pdoc__ = {
 }
 
 
+def resolve_types(def_types: Dict[str, Definition], cls_defs: Dict[str, Definition], namespace: Set = None) -> NoReturn:
+    for def_cls in def_types.values():
+        try:
+            def_cls.update_forward_refs(**cls_defs)
+        except Exception as err:
+            # Schema is unresolved
+            if namespace and err.name.split('__')[0] in namespace:
+               continue
+            else:
+                raise Exception(err)
+
+
 def update_types(types: Union[dict, list], formats: Dict[str, Callable] = None, namespace: Set = None) -> dict:
     if isinstance(types, list):
         def_types = {td[0]: make_def(td, formats) for td in types}
         cls_defs = {d.__name__: d for d in def_types.values()}
         cls_defs.update(DefTypes)
-        for def_cls in def_types.values():
-            try:
-                def_cls.update_forward_refs(**cls_defs)
-            except Exception as err:
-                # Schema is unresolved
-                if namespace and err.name.split('__')[0] in namespace:
-                   continue
-                else:
-                    raise Exception(err)
+        resolve_types(def_types, cls_defs, namespace)
         return def_types
     return types
 
@@ -61,6 +67,8 @@ class Schema(BaseModel, metaclass=SchemaMeta):  # pylint: disable=invalid-metacl
     info: Optional[Information] = Field(default_factory=Information)
     types: dict = Field(default_factory=dict)  # Dict[str, Definition]
     _info: bool = PrivateAttr(False)
+    _export_index: Optional[ExportIndex] = PrivateAttr(None)
+    _validators: Dict[ValidatorBackend, SchemaValidator] = PrivateAttr(default_factory=dict)
     __formats__: Dict[str, Callable] = ValidationFormats
 
     def __init__(self, **kwargs):
@@ -93,14 +101,50 @@ class Schema(BaseModel, metaclass=SchemaMeta):  # pylint: disable=invalid-metacl
     def validate(self, value: Any) -> Definition:
         """
         Validate the given data against the exported types
+        The candidate exports are selected by the shape of the data, the data is validated against a single export
+        unless its shape is ambiguous, then the candidates are tried in export order
         :param value: data to validate
+        :raise SchemaException: data is not an instance of any exported type
         :return: validated data as an instance of the exported type
         """
-        if self.info:
-            if self.info.exports:
-                for export in self.info.exports:
-                    return self.validate_as(export[0], value)
-        raise SchemaException("Value is not a valid exported type")
+        candidates = self.dispatch(value)
+        if len(candidates) == 1:
+            return self.validate_as(candidates[0], value)
+        error = None
+        for export in candidates:
+            try:
+                return self.validate_as(export, value)
+            except (TypeError, ValueError) as err:
+                error = err
+        raise SchemaException("Value is not a valid exported type") from error
+
+    def dispatch(self, value: Any) -> List[str]:
+        """
+        Get the exported types the given data may be an instance of, the export index is built on first use
+        :param value: data to get the exports of
+        :return: names of the candidate exports in export order
+        """
+        if self._export_index is None:
+            exports = self.info.exports.schema() if self.info and self.info.exports else []
+            self._export_index = ExportIndex(self.types, exports)
+        return self._export_index.candidates(value)
+
+    def validator(self, backend: Union[ValidatorBackend, str] = ValidatorBackend.Pydantic) -> SchemaValidator:
+        """
+        Get the validator of the schema for a backend, the validator is created once and reused
+        The `jsonschema` backend only validates the structure of the data, use the `pydantic` backend for semantic formats
+        The `jsonschema` backend requires `fastjsonschema` and reports at most one error per check
+        :param backend: validation backend, `pydantic` or `jsonschema`
+        :raise SchemaException: invalid backend or the backend cannot be created for the schema
+        :return: schema validator
+        """
+        try:
+            backend = ValidatorBackend(backend)
+        except ValueError as err:
+            raise SchemaException(f"{backend} is not a valid validator backend") from err
+        if (validator := self._validators.get(backend)) is None:
+            validator = self._validators[backend] = ValidatorBackends[backend](self)
+        return validator
 
     def validate_as(self, type_: str, value: Any) -> Definition:
         """
@@ -113,11 +157,25 @@ class Schema(BaseModel, metaclass=SchemaMeta):  # pylint: disable=invalid-metacl
             if type_ not in self.info.exports.json():
                 print("Type is not a valid exported definition")
         if cls := self.types.get(type_):
-            if isinstance(value, dict) and all(str(k).isdigit() for k in value.keys()):
+            if isinstance(value, dict) and not cls.__options__.id and all(str(k).isdigit() for k in value.keys()):
                 value = cls.expandCompact(value)
 
             return cls.validate(value)
         raise SchemaException(f"{type_} is not a valid type within the schema")
+
+    def check_as(self, type_: str, value: Any, mode: Union[ErrorMode, str] = ErrorMode.CollectAll) -> CheckResult:
+        """
+        Check the given data against a specific type without creating instances of the definitions
+        :param type_: name of the type
+        :param value: data to check
+        :param mode: error mode, `collect` all violations or `fail-fast` at the first violation
+        :return: check result, truthy if the data is valid, the errors are addressed by JSON pointer
+        """
+        if cls := self.types.get(type_):
+            if isinstance(value, dict) and not cls.__options__.id and all(str(k).isdigit() for k in value.keys()):
+                value = cls.expandCompact(value)
+            return cls.check(value, mode=mode)
+        raise SchemaException(f"{type_} is not a valid type within the schema")
     
     @root_validator
     def validate_exports(cls, v):
@@ -327,7 +385,31 @@ class Schema(BaseModel, metaclass=SchemaMeta):  # pylint: disable=invalid-metacl
             * Link:            Replace Key and Link fields with explicit types
         :return: simplified schema
         """
-        schema = self.schema()
         exts = EXTENSIONS.union(extensions) if extensions else EXTENSIONS
-        schema["types"] = unfold_extensions(schema["types"], self.info.config.Sys, exts)
+        defs = {name: DefType(*def_cls.schema()) for name, def_cls in self.types.items()}
+        changed = unfold_definitions(defs, self.info.config.Sys, exts)
+
+        # Rebuild the changed definitions and the definitions that depend on them, reuse the rest
+        dependents: Dict[str, Set[str]] = {}
+        for name, deps in self._dependencies().items():
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(name)
+        affected = set()
+        pending = [n for n in changed if n in defs]
+        while pending:
+            name = pending.pop()
+            if name not in affected:
+                affected.add(name)
+                pending.extend(dependents.get(name, ()))
+
+        rebuilt = {n: make_def(defs[n].list(), self.__formats__) for n in defs if n in affected}
+        types = {n: rebuilt.get(n) or self.types[n] for n in defs}
+        cls_defs = {d.__name__: d for d in types.values()}
+        cls_defs.update(DefTypes)
+        nms = set(self.info.namespaces) if self._info and self.info.namespaces else None
+        resolve_types(rebuilt, cls_defs, nms)
+
+        schema = {"types": types}
+        if self._info:
+            schema["info"] = self.info.schema()
         return Schema(**schema)
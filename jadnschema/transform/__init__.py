@@ -6,12 +6,15 @@ JADN Transform: Process a JADN schema to produce another JADN schema:
 - delete or truncate comments
 """
 
-from .resolve import SchemaPackage, resolve_imports
+from .resolve import SchemaPackage, clear_package_cache, load_package, load_packages, resolve_imports
 from .transform import strip_comments, unfold_extensions
 from .resolve_references import resolve
 
 __all__ = [
     "SchemaPackage",
+    "clear_package_cache",
+    "load_package",
+    "load_packages",
     "resolve_imports",
     "strip_comments",
     "unfold_extensions", 
@@ -1,8 +1,10 @@
 import copy
+import hashlib
 import json
 import os
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, List, NoReturn, Set, TextIO, Tuple, Union
 from jadn import check, load_any
 from jadn.definitions import (
@@ -20,14 +22,16 @@ class SchemaPackage:
     deps: Dict[str, Set[str]]            # Internal dependencies: {type1: {t2, t3}, type2: {t3, t4, t5}}
     refs: Dict[str, Dict[str, Set[str]]]  # External references {namespace1: {type1: {t2, t3}, ...}}
     used: Set[str]                        # Types from this package that have been referenced {t2, t3}
+    error: Optional[str]                  # Check error of an invalid schema, raised when the package is loaded
 
     def __init__(self, source: Union[dict, TextIO]):     # Read schema data, get package name
         if isinstance(source, dict):      # If schema is provided, save data
             self.schema = source
             self.source = ''
         else:
-            self.schema = load_any(source)
+            self.schema = read_schema(source)
             self.source = source.name
+        self.error = None
 
         try:
             self.package = self.schema['info']['package']
@@ -37,36 +41,165 @@ class SchemaPackage:
         self.namespaces = self.schema['info']['namespaces'] if 'namespaces' in self.schema['info'] else {}
         self.clear()
 
-    def load(self) -> NoReturn:     # Validate schema, build type dependencies and external references
+    def load(self, deps: Dict[str, Set[str]] = None) -> NoReturn:     # Validate schema, build type dependencies and external references
         if hasattr(self, 'deps'):           # Ignore if already loaded
             return
-        check(self.schema)
+        if deps is None:                    # Dependencies of a schema already checked, see `check_package`
+            if self.error:
+                raise_error(self.error)
+            deps = check_package(self.schema)
         self.tx = {t[TypeName]: t for t in self.schema['types']}
-        
-        # DK returned a tuple rather than just a dict in JADN 0.7.2, fixed in JADN 0.7.3 >
-        # deps_and_types = build_deps(self.schema) 
-        # self.deps = deps_and_types[0]
-        
-        self.deps = build_deps(self.schema) 
-        
+
         self.refs = defaultdict(lambda: defaultdict(set))
-        for tn in self.deps:
-            for dn in list(self.deps[tn]):     # Iterate over copy so original can be modified safely
+        for tn in deps:
+            for dn in list(deps[tn]):     # Iterate over copy so original can be modified safely
                 if ':' in dn:
-                    self.deps[tn].remove(dn)
+                    deps[tn].remove(dn)
                     nsid, typename = dn.split(':', maxsplit=1)
                     try:
                         self.refs[self.namespaces[nsid]][tn].add(typename)
                     except KeyError as e:
                         raise_error(f'Resolve: no namespace defined for {e}')
+        self.deps = deps    # Only mark as loaded once all references are known
 
     def clear(self) -> NoReturn:
         self.used = set()
 
+    def copy(self) -> "SchemaPackage":     # Copy of a loaded package, resolving only changes the used types and appends types
+        pkg = copy.copy(self)
+        pkg.schema = {**self.schema, 'types': list(self.schema['types'])}
+        pkg.clear()
+        return pkg
+
     def add_used(self, t) -> NoReturn:
         self.used.add(t)
 
 
+# Package cache: {file path: ((mtime, size), sha256 digest, loaded package)}
+_package_cache: Dict[str, Tuple[Tuple[int, int], str, SchemaPackage]] = {}
+
+
+def read_schema(fp: TextIO) -> dict:
+    """
+    Read a schema file without checking it, the schema is checked once when the package is loaded
+    :param fp: open schema file, JADN is read as JSON and other formats are converted by `jadn.load_any`
+    :return: JADN data
+    """
+    if getattr(fp, 'name', '').endswith('.jadn'):
+        return json.load(fp)
+    return load_any(fp)
+
+
+def check_package(schema: dict) -> Dict[str, Set[str]]:
+    """
+    Validate a schema and build its type dependencies, run in the worker processes of `load_packages`
+    :param schema: JADN data
+    :return: dependencies of each type
+    """
+    check(schema)
+    # DK returned a tuple rather than just a dict in JADN 0.7.2, fixed in JADN 0.7.3 >
+    # deps_and_types = build_deps(self.schema)
+    # self.deps = deps_and_types[0]
+    return build_deps(schema)
+
+
+def _load_source(source: Union[dict, str]) -> Tuple[Optional[dict], Optional[Dict[str, Set[str]]], Optional[str]]:
+    # Read and check a schema, run in the worker processes -> (JADN data or None if unreadable, dependencies, error)
+    # Errors are returned as text, the exceptions of the readers and checks may not be picklable
+    schema = None
+    try:
+        if isinstance(source, str):
+            with open(source, 'r', encoding='UTF-8') as fp:
+                schema = read_schema(fp)
+        else:
+            schema = source
+        return schema, check_package(schema), None
+    except Exception as e:  # pylint: disable=broad-except
+        name = f' {source}' if isinstance(source, str) else ''
+        return schema, None, f'Schema package{name} is invalid: {e}'
+
+
+def _read_package(source: Union[dict, TextIO]) -> Tuple[Optional[SchemaPackage], Union[dict, str, None], Optional[tuple]]:
+    # Get a cached package or the source to load -> (package, source to load, cache key of the file)
+    path = getattr(source, 'name', None)
+    if isinstance(source, dict):
+        return None, source, None
+    if not isinstance(path, str) or not os.path.isfile(path):
+        sm = SchemaPackage(source)
+        return sm, sm.schema, None
+
+    abspath = os.path.abspath(path)
+    stat = os.stat(abspath)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    entry = _package_cache.get(abspath)
+    if entry and entry[0] == stamp:
+        return entry[2].copy(), None, None
+
+    with open(abspath, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if entry and entry[1] == digest:
+        _package_cache[abspath] = (stamp, digest, entry[2])
+        return entry[2].copy(), None, None
+    return None, path, (abspath, stamp, digest)
+
+
+def load_packages(sources: List[Union[dict, TextIO]], max_workers: int = None) -> List[SchemaPackage]:
+    """
+    Read and check schema packages, reusing the checked packages of files that have not changed
+    Files are matched by modification time and size, then by content hash if the modification time changed
+    The packages not cached are read and checked in parallel in worker processes, the checks are CPU bound
+    Check errors are deferred until the package is resolved so unreferenced packages do not fail the resolution,
+    files that cannot be read have no package and are skipped
+    :param sources: schema data or open schema files
+    :param max_workers: maximum number of worker processes, defaults to the available CPUs, 1 loads the packages in this process
+    :return: loaded schema packages, in the order of the sources, None for the files that cannot be read
+    """
+    entries = [list(_read_package(source)) for source in sources]
+    pending = [e for e in entries if e[1] is not None]
+    if max_workers is None:
+        max_workers = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    if len(pending) > 1 and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_load_source, [e[1] for e in pending]))
+    else:
+        results = [_load_source(e[1]) for e in pending]
+
+    for entry, (schema, deps, error) in zip(pending, results):
+        sm, source, key = entry
+        if schema is None:
+            print(f'* Resolve: {error}')
+            continue
+        if sm is None:
+            sm = entry[0] = SchemaPackage(schema)
+            if isinstance(source, str):
+                sm.source = source
+        if error:  # Raised if the package is resolved, don't cache
+            sm.error = error
+            continue
+        sm.load(deps)
+        if key:
+            _package_cache[key[0]] = (key[1], key[2], sm.copy())
+    return [e[0] for e in entries]
+
+
+def load_package(source: Union[dict, TextIO]) -> SchemaPackage:
+    """
+    Read and check a schema package, reusing the checked package of files that have not changed
+    :param source: schema data or an open schema file
+    :return: loaded schema package
+    """
+    if (sm := load_packages([source])[0]) is None:
+        raise_error(f'Schema package {getattr(source, "name", "")} cannot be read')
+    return sm
+
+
+def clear_package_cache() -> NoReturn:
+    """
+    Remove all cached schema packages
+    """
+    _package_cache.clear()
+
+
 # Resolve util functions
 def merge_tname(tref: str, package: str, namespaces: Dict[str, str], nsids: dict, sys: str = '$') -> str:
     """
@@ -117,8 +250,9 @@ def make_enum(sm: SchemaPackage, tname: str, sys: str = '$') -> bool:
 
 # add referenced typenames in this package to used list
 def add_types(sm: SchemaPackage, tname: str, sys: str = '$') -> NoReturn:
-    if {tname} - sm.used:
-        sm.add_used(tname)
+    if tname in sm.used:    # Already added along with its dependencies
+        return
+    sm.add_used(tname)
     try:
         for tn in sm.deps[tname]:
             add_types(sm, tn, sys)
@@ -129,38 +263,46 @@ def add_types(sm: SchemaPackage, tname: str, sys: str = '$') -> NoReturn:
 
 # add referenced types from other packages to used list
 def resolve(sm: SchemaPackage, types: Set[str], packages: dict, sys: str = '$') -> NoReturn:
-    if set(types) - sm.used:
-        sm.load()
-    for tn in types:
-        add_types(sm, tn, sys)
-    for pkg in sm.refs:
-        if pkg in packages:
-            print(f'  Resolve {pkg} into {sm.package}')
-            resolve(packages[pkg], {t for k, v in sm.refs[pkg].items() if k in sm.used for t in v}, packages)
-        else:
-            print(f'* Resolve: package {pkg} not found.')
+    work = deque([(sm, set(types))])
+    missing = set()
+    while work:
+        pkg, tnames = work.popleft()
+        if not (tnames := tnames - pkg.used):    # Only walk types not already resolved
+            continue
+        pkg.load()
+        for tn in tnames:
+            add_types(pkg, tn, sys)
+        for ns, trefs in pkg.refs.items():
+            if ns in packages:
+                print(f'  Resolve {ns} into {pkg.package}')
+                work.append((packages[ns], {t for k, v in trefs.items() if k in pkg.used for t in v}))
+            elif ns not in missing:
+                missing.add(ns)
+                print(f'* Resolve: package {ns} not found.')
 
 
 # Add referenced types to schema. dirname => other schema files
-def resolve_imports(schema: dict, schema_list: list, no_nsid: Tuple[str, ...] = ()):
+def resolve_imports(schema: dict, schema_list: list, no_nsid: Tuple[str, ...] = (), max_workers: int = None):
     sys = '$'  # Character reserved for use in tool-generated type names
     # if 'namespaces' not in schema['info']:
     #    return schema
-    root = SchemaPackage(schema)
+    root, *loaded = load_packages([schema, *schema_list], max_workers)     # Load and check packages in parallel
     packages = {root.package: root}
     nsids = defaultdict(list)
 
-    for fn in schema_list:  
-        sm = SchemaPackage(fn)
+    for fn, sm in zip(schema_list, loaded):  # Build namespace index
+        if sm is None:
+            continue
+        src = getattr(fn, 'name', fn)
         if sm.package not in packages:            # Add new package to list
             packages.update({sm.package: sm})
         elif root.package == sm.package and root.schema == sm.schema:     # Update source of root schema if found
-            packages[sm.package].source = fn
-        elif packages[sm.package].source != fn:                   # Flag multiple files with same package name
-            print(f'* Duplicate package {sm.package}, Using: {packages[sm.package].source}, Ignoring: {fn}')
+            packages[sm.package].source = src
+        elif packages[sm.package].source != src:                   # Flag multiple files with same package name
+            print(f'* Duplicate package {sm.package}, Using: {packages[sm.package].source}, Ignoring: {src}')
         for i, m in sm.namespaces.items():
             nsids[m].append('' if i in no_nsid else i)
-        resolve(root, root.schema['info']['exports'] if 'exports' in root.schema['info'] else set(), packages)
+    resolve(root, set(root.schema['info']['exports']) if 'exports' in root.schema['info'] else set(), packages)
 
     for t in root.used.copy():
         if t[0] in (OPTION_ID['enum'], OPTION_ID['pointer']):
@@ -1,6 +1,6 @@
 import copy
 
-from typing import Generator, List, NoReturn, Set, Union
+from typing import Dict, List, NoReturn, Set, Tuple, Union
 from jadn.definitions import (
     TypeName, BaseType, TypeDesc, Fields, ItemID, ItemValue, ItemDesc, FieldName, FieldOptions, FieldDesc, OPTION_ID,
     EXTENSIONS, OPTION_TYPES, is_builtin, has_fields, TypeDefinition, EnumFieldDefinition, GenFieldDefinition)
@@ -113,6 +113,9 @@ def unfold_anonymous_types(schema: dict, sys: str) -> NoReturn:
 # Generate Enumerated list of fields or JSON Pointers
 def unfold_derived_enum(schema: dict, sys: str) -> NoReturn:
     typex = {t[TypeName]: n for n, t in enumerate(schema['types'])}       # Build type index
+    paths: Dict[Tuple[str, str], Tuple[list, ...]] = {}                   # Pointer paths by (type, base path)
+    expanding: Set[str] = set()
+    walking: Set[str] = set()
 
     def update_eref(enums: dict, opts: List[OPTION_TYPES], optname: str) -> NoReturn:
         n = get_optx(opts, optname)
@@ -123,38 +126,58 @@ def unfold_derived_enum(schema: dict, sys: str) -> NoReturn:
                 else:                   # Make new Enumerated type
                     make_items = enum_items if opts[n][1:2] == OPTION_ID['enum'] else pointer_items
                     opts[n] = f'{opts[n][:1]}{name}'
+                    enums.update({name: name})
+                    typex.update({name: len(schema['types'])})
                     schema['types'].append(TypeDefinition(name, 'Enumerated', [], '', [EnumFieldDefinition(*f) for f in make_items(name.rsplit(sys, maxsplit=1)[0])]))
 
+    def expand(rtype: str) -> NoReturn:     # Expand a derived Enumerated type after the type it is derived from
+        tdef = schema['types'][typex[rtype]] if rtype in typex else None
+        if tdef is None or tdef.BaseType != 'Enumerated' or (optx := epx(tdef.TypeOptions)) is None:
+            return
+        if rtype in expanding:
+            raise_error(f'{rtype} is derived from itself')
+        expanding.add(rtype)
+        to = tdef.TypeOptions
+        items = enum_items if to[optx][:1] == OPTION_ID['enum'] else pointer_items
+        tdef.Fields = [EnumFieldDefinition(*f) for f in items(to[optx][1:])]
+        del to[optx]
+        expanding.discard(rtype)
+
     def enum_items(rtype: str) -> list:
+        expand(rtype)
         tdef = schema['types'][typex[rtype]]
         if tdef.BaseType == 'Enumerated':
             return [[f.ItemID, f.ItemValue, f.ItemDesc] for f in tdef.Fields]
         fields = tdef.Fields if has_fields(tdef.BaseType) else []
         return [[f.FieldID, f.FieldName, f.FieldDesc] for f in fields]
 
-    def pointer_items(rtype: str) -> list:
-        def pathnames(rtype: str, base='') -> Generator[list, None, None]:  # Walk subfields of referenced type
+    def pathnames(rtype: str, base='') -> Tuple[list, ...]:  # Walk subfields of referenced type
+        if (rtype, base) not in paths:
+            if rtype in walking:
+                raise_error(f'{rtype} has a circular pointer reference')
+            walking.add(rtype)
             tdef = schema['types'][typex[rtype]]  # TODO: proper error handling for built-in or non-existing reference
+            names = []
             if has_fields(tdef.BaseType):
                 for f in tdef.Fields:
                     if OPTION_ID['dir'] in f.FieldOptions:
                         if f.FieldType in typex:
-                            yield from pathnames(f.FieldType, f'{f.FieldName}/')
+                            names.extend(pathnames(f.FieldType, f'{base}{f.FieldName}/'))
                     else:
-                        yield [base + f.FieldName, f.FieldDesc]
+                        names.append([base + f.FieldName, f.FieldDesc])
+            walking.discard(rtype)
+            paths[(rtype, base)] = tuple(names)
+        return paths[(rtype, base)]
+
+    def pointer_items(rtype: str) -> list:
         return [[n+1] + f for n, f in enumerate(pathnames(rtype))]
 
     enums = {}
-    for tdef in list(schema['types']):  # Replace enum/pointer options in Enumerated types with explicit items
-        if tdef.BaseType == 'Enumerated':
-            to = tdef.TypeOptions
-            if rname := epname(to, sys):
-                optx = get_optx(to, 'enum')
-                optx = optx if optx is not None else get_optx(to, 'pointer')
-                items = enum_items if to[optx][:1] == OPTION_ID['enum'] else pointer_items
-                tdef.Fields = items(to[optx][1:])
-                del to[optx]
-                enums.update({rname: tdef.TypeName})
+    for tdef in schema['types']:
+        if tdef.BaseType == 'Enumerated' and (rname := epname(tdef.TypeOptions, sys)):
+            enums.update({rname: tdef.TypeName})
+    for tname in list(enums.values()):  # Replace enum/pointer options in Enumerated types with explicit items
+        expand(tname)
 
     # Create new Enumerated enum/pointer types if they don't already exist
     for tdef in list(schema['types']):
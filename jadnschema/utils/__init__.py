@@ -2,7 +2,7 @@
 Utility functions & classes
 """
 from .general import (
-    addKey, check_values, classproperty, default_decode, default_encode, ellipsis_str, floatString, isBase64, safe_cast, toStr, unixTimeMillis
+    addKey, canonical, canonical_unordered, check_values, classproperty, default_decode, default_encode, ellipsis_str, floatString, isBase64, safe_cast, toStr, unixTimeMillis
 )
 from .enums import EnumBase
 from .ext_dicts import ObjectDict, FrozenDict, QueryDict
@@ -10,6 +10,8 @@ from .ext_dicts import ObjectDict, FrozenDict, QueryDict
 __all__ = [
     # General
     "addKey",
+    "canonical",
+    "canonical_unordered",
     "check_values",
     "classproperty",
     "default_decode",
@@ -7,10 +7,14 @@ import re
 import sys
 
 from datetime import datetime
-from typing import Any, Callable, Dict, Type, Union
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Iterable, Type, Union
 
 from jadnschema.schema.info import Config
 
+# JADN defaults of the schema Config
+CONFIG_DEFAULTS = Config().schema()
+
 
 def addKey(d: dict, k: str = None) -> Callable:
     """
@@ -46,6 +50,37 @@ def check_values(val: Any) -> Any:
 
 
 
+def canonical(itm: Any) -> Hashable:
+    """
+    Convert the given value to a hashable canonical form, equal values have equal forms and hashes
+    Objects are compared without order of their keys, booleans are not equal to the numbers 0/1
+    :param itm: value to convert
+    :return: canonical form of the value
+    """
+    if isinstance(itm, bool):
+        return bool, itm
+    if isinstance(itm, (int, float, str, bytes)) or itm is None:
+        return itm
+    if isinstance(itm, dict):
+        return dict, frozenset((k, canonical(v)) for k, v in itm.items())
+    if isinstance(itm, (list, tuple)):
+        return list, tuple(map(canonical, itm))
+    if isinstance(itm, (set, frozenset)):
+        return set, frozenset(map(canonical, itm))
+    if isinstance(itm, bytearray):
+        return bytes(itm)
+    return itm
+
+
+def canonical_unordered(itms: Iterable[Hashable]) -> Hashable:
+    """
+    Combine canonical forms of the items of an array to the canonical form of an unordered array
+    :param itms: canonical forms of the array items
+    :return: canonical form of the array, independent of the item order
+    """
+    return Counter, frozenset(Counter(itms).items())
+
+
 def default_decode(itm: Any, decoders: Dict[Type, Callable[[Any], Any]] = None) -> Any:
     """
     Default decode the given object to the predefined types
@@ -173,46 +208,35 @@ def unixTimeMillis(dt: datetime) -> float:
     return (dt - epoch).total_seconds() * 1000.0
 
 
+def get_max_config(cls, key: str) -> int:
+    """
+    Get the schema default maximum from the Config of the loaded schema, or the JADN default if not configured
+    :param cls: definition to get the maximum of
+    :param key: Config key of the maximum - `$MaxBinary`, `$MaxString`, or `$MaxElements`
+    :return: configured maximum
+    """
+    info = getattr(cls.__config__, "info", None)
+    if isinstance(info, dict) and (maxProps := info.get(key)) is not None:
+        return int(maxProps)
+    return int(CONFIG_DEFAULTS[key])
+
+
 def get_max_len(cls) -> int:
-    config = Config()
-    if cls.__options__.maxv is None:
-        try:
-            maxProps = cls.__config__.info.get('$MaxString')
-        except AttributeError:
-            maxProps = config.MaxElements
-            pass   
-    else:
-        maxProps = cls.__options__.maxv or config.MaxElements
-        
-    return int(maxProps)
+    if maxProps := cls.__options__.maxv:
+        return int(maxProps)
+    return get_max_config(cls, "$MaxString")
 
 
 def get_max_len_binary(cls) -> int:
-    config = Config()
-    if cls.__options__.maxv is None:
-        try:
-            maxProps = cls.__config__.info.get('$MaxBinary')
-        except AttributeError:
-            maxProps = config.MaxElements
-            pass   
-    else:
-        maxProps = cls.__options__.maxv or config.MaxElements
-        
-    return int(maxProps)
+    if maxProps := cls.__options__.maxv:
+        return int(maxProps)
+    return get_max_config(cls, "$MaxBinary")
 
 
 def get_max_v(cls) -> int:
-    config = Config()
-    if cls.__options__.maxv is None:
-        try:
-            maxProps = cls.__config__.info.get('$MaxElements')
-        except AttributeError:
-            maxProps = config.MaxElements
-            pass   
-    else:
-        maxProps = cls.__options__.maxv or config.MaxElements
-        
-    return int(maxProps)
+    if maxProps := cls.__options__.maxv:
+        return int(maxProps)
+    return get_max_config(cls, "$MaxElements")
 
 
 class classproperty(property):
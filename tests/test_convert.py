@@ -2,10 +2,16 @@
 Test JADN Schema Conversions
 Conversions -> JADN to ...
 """
+import importlib.util
+import json
 import os
+import subprocess
+import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
-from jadnschema import convert, jadn
+from jadnschema import Schema, convert, jadn
+from jadnschema.exceptions import FormatError
 
 
 # TODO: Read and Write JIDL and HTML, Write Markdown, JSON Schema, XSD, CDDL
@@ -60,6 +66,43 @@ class JidlConvert(BasicConvert, TestCase):
 
 
 # TODO: Read formats, compare to expected valid schema
+class JidlRead(TestCase):
+    _jidl = '\n'.join([
+        'package: "http://test/jidl/v1"  // URLs in values are not comments',
+        'exports: ["Command"]',
+        '',
+        'Command = Record  // A command',
+        '   1 action   Action',
+        '   2 target/  Targets{1..*} optional  // Target list',
+        '   3 args     String{pattern="^[a-z]{2}$"} [0..*]',
+        '',
+        'Action = Enumerated',
+        '   1 scan  // Scan it',
+        '',
+        'Targets = ArrayOf(Action) unique',
+        '',
+        'Status = Enumerated.ID',
+        ' 200  // OK:: success',
+    ])
+
+    def test_loads(self):
+        schema = convert.jidl_loads(self._jidl).schema()
+        self.assertEqual(schema['info'], {'package': 'http://test/jidl/v1', 'exports': ['Command']})
+        self.assertListEqual(schema['types'][0], ['Command', 'Record', [], 'A command', [
+            [1, 'action', 'Action', [], ''],
+            [2, 'target', 'Targets', ['{1', '[0', '<'], 'Target list'],
+            [3, 'args', 'String', ['%^[a-z]{2}$', '[0', ']0'], '']
+        ]])
+        self.assertListEqual(schema['types'][2], ['Targets', 'ArrayOf', ['*Action', 'q'], ''])
+        self.assertListEqual(schema['types'][3][4], [[200, 'OK', 'success']])
+
+    def test_errors(self):
+        with self.assertRaisesRegex(FormatError, 'line 2, column 14'):
+            convert.jidl_loads('A = Record\n   1 a String{x}')
+        with self.assertRaisesRegex(FormatError, 'line 1, column 3'):
+            convert.jidl_loads('  1 a String')
+
+
 class CddlConvert(BasicConvert, TestCase):
     def _convert(self, schema):
         cddl_doc = convert.cddl_dumps(schema)
@@ -92,3 +135,93 @@ class XsdConvert(BasicConvert, TestCase):
         # self.maxDiff = None
         # self.assertEqual(jadn.canonicalize(schema), jadn.canonicalize(schema_new))
 '''
+
+
+class PythonConvert(TestCase):
+    _schema = os.path.join(dir_path, 'schema/oc2ls-v1.1-lang_resolved.jadn')
+
+    def _import(self, source: str, name: str):
+        spec = importlib.util.spec_from_loader(name, loader=None)
+        module = importlib.util.module_from_spec(spec)
+        exec(compile(source, f'<{name}>', 'exec'), module.__dict__)  # pylint: disable=exec-used
+        return module
+
+    def test_module(self):
+        schema = Schema.parse_file(self._schema)
+        source = convert.py_dumps(schema)
+        self.assertEqual(source, convert.py_dumps(self._schema))
+        generated = self._import(source, 'oc2ls_generated').load_schema()
+        self.assertEqual(generated.schema(), schema.schema())
+        self.assertTrue(generated.check_as('OpenC2-Command', {'action': 'query', 'target': {'features': ['versions']}}))
+
+    def test_type_names(self):
+        schema = Schema.parse_obj({
+            'info': {'package': 'http://test/python/v1', 'exports': ['Schema']},
+            'types': [
+                ['Schema', 'Record', [], 'Shadows the imported names', [
+                    [1, 'options', 'Options', [], ''],
+                    [2, 'class', 'String', ['[0'], '']
+                ]],
+                ['Options', 'Enumerated', [], '', [[1, 'a b', ''], [2, 'c', '']]]
+            ]
+        })
+        generated = self._import(convert.py_dumps(schema), 'names_generated').load_schema()
+        self.assertEqual(generated.schema(), schema.schema())
+        generated.validate_as('Schema', {'options': 'a b', 'class': 'x'})
+
+    def test_keyword_fields(self):
+        schema = Schema.parse_obj({
+            'info': {'package': 'http://test/python-keywords/v1', 'exports': ['Transfer']},
+            'types': [
+                ['Transfer', 'Record', [], '', [
+                    [1, 'from', 'String', [], ''],
+                    [2, 'import', 'String', ['[0'], ''],
+                    [3, 'in', 'Integer', ['[0'], ''],
+                    [4, 'for', 'String', ['[0'], '']
+                ]]
+            ]
+        })
+        generated = self._import(convert.py_dumps(schema), 'keywords_generated').load_schema()
+        self.assertEqual(generated.schema(), schema.schema())
+        value = {'from': 'a', 'import': 'b', 'in': 1, 'for': 'c'}
+        self.assertTrue(generated.check_as('Transfer', value))
+        self.assertEqual(generated.validate_as('Transfer', value).from_.__root__, 'a')
+
+    def test_hash_seed(self):
+        code = f'import sys; from jadnschema import convert; sys.stdout.write(convert.py_dumps({self._schema!r}))'
+        sources = []
+        for seed in ('1', '2'):
+            env = {**os.environ, 'PYTHONHASHSEED': seed, 'PYTHONPATH': os.pathsep.join(filter(None, (os.path.dirname(dir_path), os.environ.get('PYTHONPATH'))))}
+            sources.append(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env).stdout)
+        self.assertEqual(*sources)
+
+
+class JsonSchemaToJadnConvert(TestCase):
+    _json_schema = {
+        '$id': 'http://test/json-schema/v1',
+        'type': 'object',
+        'properties': {'catalog': {'$ref': '#assembly_test_catalog'}},
+        'required': ['catalog'],
+        'definitions': {
+            'test:catalog': {'$id': '#assembly_test_catalog', 'description': 'A catalog', 'type': 'object', 'properties': {
+                'uuid': {'$ref': '#/definitions/StringDatatype'},
+                'groups': {'type': 'array', 'items': {'$ref': '#assembly_test_group'}}
+            }},
+            'test:group': {'$id': '#assembly_test_group', 'type': 'object', 'properties': {'id': {'type': 'string'}}},
+            'StringDatatype': {'description': 'str', 'type': 'string', 'pattern': '^\\S+$'}
+        }
+    }
+
+    def test_convert(self):
+        schema = convert.json_to_jadn_dumps(self._json_schema)
+        types = {t[0]: t for t in schema['types']}
+        self.assertListEqual(types['$Root'][4], [[1, 'catalog', 'Catalog', [], 'A catalog']])
+        self.assertListEqual(types['Catalog'][4][0], [1, 'uuid', 'StringDatatype', ['[0'], ''])
+        self.assertListEqual(types['Groups'][2], ['*Group'])
+        self.assertEqual(schema, convert.json_to_jadn_dumps(json.dumps(self._json_schema)))
+
+    def test_concurrent(self):
+        expected = convert.json_to_jadn_dumps(self._json_schema)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(convert.json_to_jadn_dumps, [self._json_schema] * 16))
+        self.assertTrue(all(r == expected for r in results))
@@ -1,12 +1,17 @@
 """
 Test JADN Messages
 """
+import datetime
 import json
 import os
+import subprocess
+import sys
+import zlib
 
 from unittest import TestCase, skip
 from jadnschema import Schema
-from jadnschema.convert import Message, SerialFormats
+from jadnschema.convert import Message, MessageType, SerialFormats
+from jadnschema.convert.message.serialize import Compression, DecodeLimits, MessageLimitError, decode_msg, encode_msg
 
 schema = "oc2ls-v1.1-lang_resolved"
 
@@ -77,3 +82,179 @@ class Messages(TestCase):
 
     def test_loadMessage_yaml(self):
         self._loadMessage(SerialFormats.YAML)
+
+
+class LazyImports(TestCase):
+    def test_backends_not_imported(self):
+        code = "import sys, jadnschema.convert; print(','.join(m for m in ('cbor2', 'bson', 'yaml', 'graphviz', 'terminaltables') if m in sys.modules))"
+        rslt = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(rslt.stdout.strip(), "")
+
+    def test_backend_loaded_on_use(self):
+        from jadnschema.convert.message.serialize import decode_msg, encode_msg  # pylint: disable=import-outside-toplevel
+        msg = {"action": "query", "target": {"features": []}}
+        self.assertDictEqual(decode_msg(encode_msg(msg, SerialFormats.CBOR, raw=True), SerialFormats.CBOR, raw=True), msg)
+
+
+class DecodeGuards(TestCase):
+    _limits = DecodeLimits(max_depth=4, max_elements=3, max_string=10, max_binary=5)
+    _formats = (SerialFormats.JSON, SerialFormats.CBOR, SerialFormats.MSGPACK)
+
+    def _decode(self, msg: dict, fmt: SerialFormats) -> dict:
+        return decode_msg(encode_msg(msg, fmt, raw=True), fmt, raw=True, limits=self._limits)
+
+    def test_within_limits(self):
+        msg = {"action": "query", "target": {"features": ["pairs"]}}
+        for fmt in self._formats:
+            self.assertDictEqual(self._decode(msg, fmt), msg)
+
+    def test_exceeds_limits(self):
+        for msg in ({"a": [[[[1]]]]}, {"a": [1, 2, 3, 4]}, {"a": "x" * 11}):
+            for fmt in self._formats:
+                with self.assertRaises(MessageLimitError, msg=f"{fmt} {msg}"):
+                    self._decode(msg, fmt)
+
+    def test_multibyte_strings(self):
+        msg = {"d": "\u7528\u6237@\u4f8b\u5b50.\u5e7f\u544a"}  # 8 characters, 24 octets
+        for fmt in self._formats:
+            self.assertDictEqual(self._decode(msg, fmt), msg, fmt)
+
+    def test_chunked_strings(self):
+        chunks = b"".join(encode_msg({"d": "abcd"}, SerialFormats.CBOR, raw=True)[3:] for _ in range(3))
+        msg = b"\xa1\x61d\x7f" + chunks + b"\xff"  # {"d": "abcd" "abcd" "abcd"} as an indefinite length string
+        with self.assertRaises(MessageLimitError):
+            decode_msg(msg, SerialFormats.CBOR, raw=True, limits=self._limits)
+        self.assertDictEqual(decode_msg(msg, SerialFormats.CBOR, raw=True, limits=DecodeLimits(max_string=12)), {"d": "abcd" * 3})
+
+    def test_large_messages(self):
+        limits = DecodeLimits(max_depth=3, max_elements=400, max_string=30, max_binary=30)
+        msg = {f"k{i}": {"s": '"\\' * 15, "a": [i, "x" * 30]} for i in range(400)}
+        for fmt in self._formats:
+            encoded = encode_msg(msg, fmt, raw=True)
+            self.assertDictEqual(decode_msg(encoded, fmt, raw=True, limits=limits), msg, fmt)
+            for over in ({**msg, "k400": 1}, {**msg, "k0": {"s": "x" * 31}}, {**msg, "k0": {"a": [[1]]}}):
+                with self.assertRaises(MessageLimitError, msg=fmt):
+                    decode_msg(encode_msg(over, fmt, raw=True), fmt, raw=True, limits=limits)
+
+    def test_small_messages(self):
+        limits = DecodeLimits(max_depth=1, max_elements=100, max_string=100, max_binary=100)
+        for fmt in self._formats:
+            self.assertDictEqual(decode_msg(encode_msg({"a": 1}, fmt, raw=True), fmt, raw=True, limits=limits), {"a": 1})
+            with self.assertRaises(MessageLimitError, msg=fmt):
+                decode_msg(encode_msg({"a": [1]}, fmt, raw=True), fmt, raw=True, limits=limits)
+
+    def test_max_bytes(self):
+        with self.assertRaises(MessageLimitError):
+            decode_msg(json.dumps({"a": [1] * 50}), SerialFormats.JSON, raw=True, limits=DecodeLimits(max_bytes=64))
+
+    def test_schema_limits(self):
+        limits = DecodeLimits.from_config({"$MaxElements": 10, "$MaxString": 20, "$MaxBinary": 5})
+        self.assertEqual(limits.max_elements, 10)
+        self.assertEqual(limits.max_string, 20)
+        self.assertEqual(limits.max_binary, 5)
+
+
+class ProtobufWire(TestCase):
+    _schema = Schema.parse_obj({
+        "info": {"package": "http://test/protobuf/v1"},
+        "types": [
+            ["Test", "Record", [], "", [
+                [1, "a", "Integer", [], ""],
+                [2, "b", "String", ["[0"], ""],
+                [3, "c", "Integer", ["[0", "]0"], ""]
+            ]]
+        ]
+    })
+
+    def test_wire_format(self):
+        msg = {"a": 150, "b": "testing", "c": [3, 270, 86942]}
+        encoded = encode_msg(msg, SerialFormats.PROTOBUF, raw=True, schema=self._schema, root="Test")
+        self.assertEqual(encoded.hex(), "089601" "120774657374696e67" "1a06038e029ea705")
+        self.assertDictEqual(decode_msg(encoded, SerialFormats.PROTOBUF, raw=True, schema=self._schema, root="Test"), msg)
+
+    def test_round_trip(self):
+        schema = Schema.parse_file(Messages._base_schema)
+        for root, msg in (
+            ("OpenC2-Command", {"action": "deny", "target": {"ipv4_connection": {"src_addr": "1.2.3.4/24", "src_port": 80, "protocol": "tcp"}}}),
+            ("OpenC2-Response", {"status": 200, "results": {"versions": ["1.0"], "rate_limit": 1.5, "pairs": {"query": ["features"]}}})
+        ):
+            encoded = encode_msg(msg, SerialFormats.PROTOBUF, raw=True, schema=schema, root=root)
+            self.assertDictEqual(decode_msg(encoded, SerialFormats.PROTOBUF, raw=True, schema=schema, root=root), msg)
+
+    def test_requires_schema(self):
+        with self.assertRaises(ValueError):
+            encode_msg({"a": 1}, SerialFormats.PROTOBUF, raw=True)
+
+
+class SchemaCompression(TestCase):
+    _msg = {"action": "query", "target": {"features": ["versions", "profiles", "pairs"]}, "args": {"response_requested": "complete"}}
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._compression = Compression.from_schema(Schema.parse_file(Messages._base_schema), binary=True)
+
+    def test_round_trip(self):
+        for fmt in (SerialFormats.JSON, SerialFormats.YAML, SerialFormats.XML, SerialFormats.CBOR):
+            for raw in (True, False):
+                encoded = encode_msg(self._msg, fmt, raw=raw, compression=self._compression)
+                self.assertDictEqual(decode_msg(encoded, fmt, raw=raw, compression=self._compression), self._msg, f"{fmt} raw={raw}")
+
+    def test_dictionary(self):
+        plain = encode_msg(self._msg, SerialFormats.JSON, raw=True).encode("utf-8")
+        compressed = encode_msg(self._msg, SerialFormats.JSON, raw=True, compression=self._compression)
+        self.assertLess(len(compressed) * 1.5, len(zlib.compress(plain, 9)))
+
+    def test_mismatch(self):
+        other = Compression.from_schema({"types": [["T", "Record", [], "", [[1, "a", "String", [], ""]]]]})
+        encoded = encode_msg(self._msg, SerialFormats.JSON, raw=True, compression=self._compression)
+        with self.assertRaises(ValueError):
+            decode_msg(encoded, SerialFormats.JSON, raw=True, compression=other)
+        with self.assertRaises(MessageLimitError):
+            decode_msg(encoded, SerialFormats.JSON, raw=True, compression=self._compression, limits=DecodeLimits(max_bytes=32))
+
+
+class MessageEnvelope(TestCase):
+    def _message(self) -> Message:
+        return Message(recipients=["consumer@example.com"], origin="producer", msg_type=MessageType.Response, content_type=SerialFormats.CBOR, content={"status": 200, "status_text": "\u00f5\u00be"})
+
+    def test_round_trip(self):
+        msg = self._message()
+        loaded = Message.loads(msg.dumps())
+        self.assertEqual(loaded.recipients, msg.recipients)
+        self.assertEqual(loaded.request_id, msg.request_id)
+        self.assertEqual(loaded.created, msg.created.replace(microsecond=msg.created.microsecond // 1000 * 1000))
+        self.assertEqual(loaded.content_type, SerialFormats.CBOR)
+        self.assertDictEqual(loaded.content, msg.content)
+
+    def test_created_timezones(self):
+        msg = self._message()
+        msg.created = datetime.datetime(2021, 1, 21, 11, 8, 57, 123999)
+        self.assertEqual(Message.loads(msg.dumps()).created, datetime.datetime(2021, 1, 21, 11, 8, 57, 123000))
+        msg.created = datetime.datetime(2021, 1, 21, 12, 8, 57, 123999, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+        self.assertEqual(Message.loads(msg.dumps()).created, datetime.datetime(2021, 1, 21, 11, 8, 57, 123000))
+        msg.created = datetime.datetime(1969, 12, 31, 23, 59, 59, 999500)
+        self.assertEqual(Message.loads(msg.dumps()).created, datetime.datetime(1969, 12, 31, 23, 59, 59, 999000))
+
+    def test_lazy_content(self):
+        envelope = self._message().dumps()
+        loaded = Message.loads(envelope[:-1] + b"\xff")
+        self.assertEqual(loaded.origin, "producer")
+        self.assertEqual(loaded.dumps()[:-1], envelope[:-1])
+        with self.assertRaises(Exception):
+            loaded.content
+
+    def test_writable_buffer(self):
+        envelope = bytearray(self._message().dumps())
+        loaded = Message.loads(envelope)
+        envelope.extend(b"\x00")  # the buffer is not held by the message
+        envelope[-2] = 0
+        self.assertDictEqual(loaded.content, self._message().content)
+        with self.assertRaises(ValueError):
+            Message.loads(envelope)
+        envelope.clear()
+
+    def test_invalid(self):
+        envelope = self._message().dumps()
+        for msg in (envelope[:-1], b"XX" + envelope[2:], envelope[:12]):
+            with self.assertRaises(ValueError):
+                Message.loads(msg)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from jadnschema.convert.schema.writers.json_schema.schema_validator import validate_schema
+from jadnschema.convert.schema.writers.json_schema.schema_validator import validate_schema, validate_schemas
 
 class BasicTypes(TestCase):
     
@@ -842,4 +842,13 @@ class BasicTypes(TestCase):
         self.assertTrue(is_invalid)
         
         response = validate_schema(self.oc2lsv11_json)
-        self.assertTrue(response)        
\ No newline at end of file
+        self.assertTrue(response)        
+
+class BatchSchemas(TestCase):
+
+    def test_validate_schemas(self):
+        results = validate_schemas([{"type": "object"}, {"type": 12}])
+        self.assertListEqual([valid for valid, _ in results], [True, False])
+
+        results = validate_schemas([{"types": []}, {"types": [], "other": {}}], jadn=True)
+        self.assertListEqual([valid for valid, _ in results], [True, False])
@@ -2,15 +2,93 @@
 Test JADN Schema transformations
 Transformation -> Reduce Complexity
 """
+import copy
+import json
+import os
+import tempfile
+
 from unittest import TestCase, skip
+from unittest.mock import patch
+from jadn import check
 from jadnschema import jadn
+from jadnschema.exceptions import SchemaException
+from jadnschema.schema import Schema
 from jadnschema.schema.consts import EXTENSIONS
+from jadnschema.schema.extensions import unfold_extensions
+from jadnschema.transform import clear_package_cache, resolve_imports
 
 
 class Resolve(TestCase):
-    schema = {}  # TODO: test Merge imported definitions
+    schema = {
+        'info': {'package': 'http://example.com/base', 'exports': ['Top'], 'namespaces': {'ls': 'http://example.com/lib'}},
+        'types': [['Top', 'Record', [], '', [[1, 'a', 'ls:Thing', [], '']]]]
+    }
+    lib = {
+        'info': {'package': 'http://example.com/lib'},
+        'types': [
+            ['Thing', 'Record', [], '', [[1, 'x', 'String', [], ''], [2, 'y', 'Other', [], '']]],
+            ['Other', 'Integer', [], ''],
+            ['Unused', 'String', [], '']
+        ]
+    }
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.files = []
+        for name, schema in (('base', self.schema), ('lib', self.lib)):
+            fname = os.path.join(self.tmpdir.name, f'{name}.jadn')
+            with open(fname, 'w', encoding='UTF-8') as f:
+                json.dump(schema, f)
+            self.files.append(fname)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _resolve(self, max_workers: int = None) -> dict:
+        fps = [open(f, 'r', encoding='UTF-8') for f in self.files]
+        try:
+            return resolve_imports(copy.deepcopy(self.schema), fps, max_workers=max_workers)
+        finally:
+            for fp in fps:
+                fp.close()
+
+    def test_resolve(self):
+        types = [t[0] for t in self._resolve()['types']]
+        self.assertListEqual(types, ['Top', 'Thing$ls', 'Other$ls'])
 
-    # def test_resolve(self):
+    def test_resolve_cached(self):
+        first = self._resolve()
+        with patch('jadnschema.transform.resolve.check', wraps=check) as checker:
+            self.assertDictEqual(self._resolve(), first)
+        self.assertEqual(checker.call_count, 1)  # Only the root schema is checked again
+
+    def test_resolve_processes(self):
+        clear_package_cache()
+        self.assertDictEqual(self._resolve(max_workers=2), self._resolve(max_workers=1))
+
+    def test_resolve_checks_once(self):
+        clear_package_cache()
+        with patch('jadnschema.transform.resolve.check', wraps=check) as checker, patch('jadn.core.check', new=checker):
+            self._resolve(max_workers=1)
+        self.assertEqual(checker.call_count, 3)  # The root schema and each file
+
+    def test_resolve_invalid_packages(self):
+        for name, content in (('invalid', {'info': {'package': 'http://example.com/bad'}, 'types': [['Bad', 'Unknown', [], '']]}), ('unreadable', None)):
+            fname = os.path.join(self.tmpdir.name, f'{name}.jadn')
+            with open(fname, 'w', encoding='UTF-8') as f:
+                f.write('{' if content is None else json.dumps(content))
+            self.files.append(fname)
+        for max_workers in (1, 2):  # Unreferenced packages do not stop the resolution
+            clear_package_cache()
+            self.assertListEqual([t[0] for t in self._resolve(max_workers)['types']], ['Top', 'Thing$ls', 'Other$ls'])
+
+        self.schema = copy.deepcopy(self.schema)
+        self.schema['info']['namespaces']['bad'] = 'http://example.com/bad'
+        self.schema['types'][0][4].append([2, 'b', 'bad:Bad', [], ''])
+        for max_workers in (1, 2):
+            clear_package_cache()
+            with self.assertRaises(ValueError):
+                self._resolve(max_workers)
 
 
 class StripComments(TestCase):
@@ -536,3 +614,92 @@ class UnfoldExtensions(TestCase):
 
     def test_link_all(self):
         self.do_unfold_test(self.schema_link_folded, self.schema_link_unfolded_all)
+
+
+class DerivedEnumExpansion(TestCase):
+    types = [
+        ['Catalog', 'Record', [], '', [
+            [1, 'a', 'TypeA', [], 'Leaf field (e.g., file)'],
+            [2, 'b', 'TypeB', ['<'], 'Collection field (e.g., dir)']
+        ]],
+        ['TypeA', 'Record', [], '', [
+            [1, 'x', 'Number', [], ''],
+            [2, 'y', 'Number', [], '']
+        ]],
+        ['TypeB', 'Record', [], '', [
+            [1, 'foo', 'String', [], 'Type'],
+            [2, 'bar', 'TypeC', ['<'], 'Nested collection']
+        ]],
+        ['TypeC', 'Record', [], '', [
+            [1, 'size', 'Integer', [], 'Size']
+        ]],
+        ['Derived-Paths', 'Enumerated', ['#Paths'], 'Derived from a derived type'],
+        ['Paths', 'Enumerated', ['>Catalog'], ''],
+        ['Path-List', 'ArrayOf', ['*>Catalog'], ''],
+        ['Field-List', 'ArrayOf', ['*#TypeA'], ''],
+        ['Other-Field-List', 'ArrayOf', ['*#TypeA'], '']
+    ]
+
+    def setUp(self) -> None:
+        unfolded = unfold_extensions(self.types, '$', {'DerivedEnum'})
+        self.types_out = {t[0]: t for t in unfolded}
+
+    def test_nested_pointers(self):
+        paths = [f[1] for f in self.types_out['Paths'][4]]
+        self.assertListEqual(paths, ['a', 'b/foo', 'b/bar/size'])
+
+    def test_dependency_order(self):
+        self.assertListEqual(self.types_out['Derived-Paths'][4], self.types_out['Paths'][4])
+
+    def test_shared_enum(self):
+        self.assertEqual(self.types_out['Path-List'][2].vtype, 'Paths')
+        self.assertEqual(self.types_out['Field-List'][2].vtype, 'TypeA$Enum')
+        self.assertEqual(self.types_out['Other-Field-List'][2].vtype, 'TypeA$Enum')
+        self.assertListEqual([f[1] for f in self.types_out['TypeA$Enum'][4]], ['x', 'y'])
+
+    def test_circular_pointer(self):
+        types = [
+            ['Loop', 'Record', [], '', [[1, 'next', 'Loop', ['<'], '']]],
+            ['Loop-Paths', 'Enumerated', ['>Loop'], '']
+        ]
+        with self.assertRaises(SchemaException):
+            unfold_extensions(types, '$', {'DerivedEnum'})
+
+
+class SimplifyPatch(TestCase):
+    schema = {
+        'info': {'package': 'http://example.com/simplify', 'exports': ['Rec']},
+        'types': [
+            ['Rec', 'Record', [], '', [
+                [1, 'name', 'String', ['{2'], ''],
+                [2, 'child', 'Child', [], '']
+            ]],
+            ['Child', 'Record', [], '', [
+                [1, 'size', 'Integer', ['{1'], '']
+            ]],
+            ['Unrelated', 'Record', [], '', [
+                [1, 'size', 'Integer', [], '']
+            ]]
+        ]
+    }
+
+    def setUp(self) -> None:
+        self.original = Schema.loads(self.schema)
+        self.simplified = self.original.simplify()
+
+    def test_unchanged_reused(self):
+        self.assertIs(self.simplified.types['Unrelated'], self.original.types['Unrelated'])
+
+    def test_dependents_rebuilt(self):
+        self.assertIsNot(self.simplified.types['Child'], self.original.types['Child'])
+        self.assertIsNot(self.simplified.types['Rec'], self.original.types['Rec'])
+        self.assertIn('Rec$Name', self.simplified.types)
+        self.assertIn('Child$Size', self.simplified.types)
+
+    def test_link_missing_key(self):
+        types = [
+            ['A', 'Record', [], '', [[1, 'ref', 'B', ['L'], '']]],
+            ['B', 'Record', [], '', [[1, 'id', 'String', [], '']]]
+        ]
+        with self.assertRaises(SchemaException):
+            unfold_extensions(types, '$', {'Link'})
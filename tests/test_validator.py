@@ -1,11 +1,20 @@
+import base64
+import datetime
+import importlib.util
+import ipaddress
 import os
+import sys
 
-from unittest import TestCase, skip
+from unittest import TestCase, mock, skip, skipUnless
 from pydantic import ValidationError
 from jadnschema import Schema
+from jadnschema.schema import ErrorMode
+from jadnschema.schema.definitions.primitives import decode_binary
+from jadnschema.exceptions import SchemaException
 
 CMD_TYPE = "OpenC2-Command"
 RSP_TYPE = "OpenC2-Response"
+FASTJSONSCHEMA = importlib.util.find_spec("fastjsonschema") is not None
 
 
 class CommandValidation(TestCase):
@@ -146,3 +155,396 @@ class ResponseValidation(TestCase):
                 ]
             }
         })
+
+
+class CheckOnly(TestCase):
+    _test_root = os.path.join(os.path.abspath(os.path.dirname(__file__)))
+    _schema = f"{_test_root}/schema/oc2ls-v1.0.1-resolved.jadn"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_file(cls._schema)
+
+    def test_valid(self):
+        result = self._schema_obj.check_as(CMD_TYPE, {
+            "action": "query",
+            "target": {
+                "features": ["versions", "profiles"]
+            }
+        })
+        self.assertTrue(result)
+        self.assertListEqual(result.errors, [])
+
+    def test_invalid_paths(self):
+        result = self._schema_obj.check_as(CMD_TYPE, {
+            "action": "deny",
+            "target": {
+                "ipv4_connection": {
+                    "protocol": "tcpx",
+                    "src_port": "80"
+                }
+            },
+            "bogus": 1
+        })
+        self.assertFalse(result)
+        self.assertSetEqual({e.path for e in result.errors}, {
+            "/bogus",
+            "/target/ipv4_connection/protocol",
+            "/target/ipv4_connection/src_port"
+        })
+
+    def test_unknown_type(self):
+        with self.assertRaises(SchemaException):
+            self._schema_obj.check_as("Unknown-Type", {})
+
+    def test_fail_fast(self):
+        result = self._schema_obj.check_as(CMD_TYPE, {
+            "action": "deny",
+            "target": {
+                "ipv4_connection": {
+                    "protocol": "tcpx",
+                    "src_port": "80"
+                }
+            },
+            "bogus": 1
+        }, mode=ErrorMode.FailFast)
+        self.assertFalse(result)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].path, "/bogus")
+
+    def test_lazy_message(self):
+        value = "x" * 10000
+        result = self._schema_obj.check_as(CMD_TYPE, {
+            "action": "query",
+            "target": {
+                "features": [value]
+            }
+        }, mode="fail-fast")
+        error = result.errors[0]
+        self.assertEqual(error.path, "/target/features/0")
+        self.assertIs(error.args[0], value)
+        self.assertLess(len(error.message), 200)
+
+
+class UniqueArrays(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/unique/v1", "exports": ["Root"]},
+            "types": [
+                ["Root", "Record", [], "", [[1, "u", "Uniq", ["[0"], ""], [2, "s", "Sets", ["[0"], ""]]],
+                ["Uniq", "ArrayOf", ["*Obj", "q"], ""],
+                ["Sets", "ArrayOf", ["*Tags", "q"], ""],
+                ["Tags", "ArrayOf", ["*String", "s"], ""],
+                ["Obj", "Map", [], "", [[1, "a", "Integer", ["[0"], ""], [2, "b", "String", ["[0"], ""]]]
+            ]
+        })
+
+    def test_unique(self):
+        self._schema_obj.validate_as("Root", {"u": [{"a": 1}, {"b": "x"}], "s": [["a", "b"], ["a", "c"]]})
+        with self.assertRaises(ValidationError):
+            self._schema_obj.validate_as("Root", {"u": [{"a": 1, "b": "x"}, {"b": "x", "a": 1}]})
+
+    def test_set_unordered(self):
+        result = self._schema_obj.check_as("Root", {"s": [["a", "b"], ["b", "a"]]})
+        self.assertEqual([e.path for e in result.errors], ["/s/1"])
+        result = self._schema_obj.check_as("Root", {"s": [["a", "a"]]})
+        self.assertEqual([e.path for e in result.errors], ["/s/0/1"])
+
+    def test_canonical(self):
+        tags = self._schema_obj.types["Tags"]
+        self.assertEqual(tags.canonical(["a", "b"]), tags.canonical(["b", "a"]))
+        self.assertNotEqual(self._schema_obj.types["Uniq"].canonical([{"a": 1}, {"a": 2}]), self._schema_obj.types["Uniq"].canonical([{"a": 2}, {"a": 1}]))
+
+
+class BatchPrimitives(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/batch/v1", "exports": ["Root"]},
+            "types": [
+                ["Root", "Record", [], "", [
+                    [1, "p", "Ports", ["[0"], ""], [2, "n", "Names", ["[0"], ""], [3, "i", "Ints", ["[0"], ""]
+                ]],
+                ["Ints", "ArrayOf", ["*Integer", "}5000"], ""],
+                ["Ports", "ArrayOf", ["*Port", "}5000"], ""],
+                ["Port", "Integer", ["{0", "}65535"], ""],
+                ["Names", "ArrayOf", ["*Name", "}5000"], ""],
+                ["Name", "String", ["{1", "}10"], ""]
+            ]
+        })
+
+    def test_batch_valid(self):
+        port = self._schema_obj.types["Port"]
+        self.assertTrue(port.batch_valid(list(range(1000))))
+        self.assertFalse(port.batch_valid([1, 2, 70000]))
+        self.assertFalse(port.batch_valid([1, True]))
+        name = self._schema_obj.types["Name"]
+        self.assertTrue(name.batch_valid(["a", "bcd"]))
+        self.assertFalse(name.batch_valid(["a", ""]))
+
+    def test_fallback_finds_invalid(self):
+        self._schema_obj.validate_as("Root", {"p": list(range(1000)), "n": ["a"] * 100})
+        with self.assertRaises(ValidationError):
+            self._schema_obj.validate_as("Root", {"p": [*range(1000), 70000]})
+        result = self._schema_obj.check_as("Root", {"p": [*range(1000), 70000], "n": ["a", "b", ""]})
+        self.assertEqual([e.path for e in result.errors], ["/p/1000", "/n/2"])
+
+    def test_primitive_value_types(self):
+        self._schema_obj.validate_as("Root", {"i": list(range(1000))})
+        with self.assertRaises(ValidationError):
+            self._schema_obj.validate_as("Root", {"i": [*range(1000), "a"]})
+
+
+class OptionOrder(TestCase):
+    def test_validated_order(self):
+        from jadnschema.schema.definitions.options import validated_options  # pylint: disable=import-outside-toplevel
+        opts = ("}5", "[0", "{1", "/ipv4-addr", "%^a+$", "q", "]3", "y1.5")
+        self.assertListEqual([k for k, _ in validated_options(opts)], ["maxv", "minc", "minv", "format", "pattern", "unique", "maxc", "minf"])
+
+
+class FormatValidators(TestCase):
+    def test_date_time(self):
+        from jadnschema.schema.formats import rfc_3339  # pylint: disable=import-outside-toplevel
+        self.assertEqual(rfc_3339.date_time("2020-01-01T10:00:00.1234567+05:30"), datetime.datetime(2020, 1, 1, 10, 0, 0, 123456, tzinfo=datetime.timezone(datetime.timedelta(hours=5, minutes=30))))
+        self.assertEqual(rfc_3339.date_time("2020-01-01T10:00:00Z").tzinfo, datetime.timezone.utc)
+        self.assertEqual(rfc_3339.date_time("2020-01-01t10:00:00z"), rfc_3339.date_time("2020-01-01T10:00:00Z"))  # RFC 3339 § 5.6 NOTE
+        for val in (
+            "2020-02-30T10:00:00Z", "2020-01-01T10:00:60Z", "2020-01-01 10:00:00", "2020-01-01T10:00:00+24:00",
+            "2020-01-01T10:00:00Z\n", "\u0661\u0662\u0663\u0664-01-01T10:00:00Z"
+        ):
+            with self.assertRaises(ValueError, msg=val):
+                rfc_3339.date_time(val)
+        self.assertEqual(rfc_3339.date("2020-01-05"), datetime.date(2020, 1, 5))
+        self.assertEqual(rfc_3339.time("10:11:12"), datetime.time(10, 11, 12))
+        for fun, val in ((rfc_3339.date, "2020-1-5"), (rfc_3339.date, "2020-01-05\n"), (rfc_3339.time, "10:11:12\n")):
+            with self.assertRaises(ValueError, msg=val):
+                fun(val)
+
+    def test_idna_cache(self):
+        from jadnschema.schema.formats.jadn_idna import idn_hostname  # pylint: disable=import-outside-toplevel
+        idn_hostname.cache.clear()
+        for _ in range(3):
+            self.assertEqual(idn_hostname("bücher.example"), "xn--bcher-kva.example")
+            with self.assertRaises(ValueError):
+                idn_hostname("-invalid-.example")
+            with self.assertRaises(ValueError):
+                idn_hostname("a" * 300)
+        info = idn_hostname.cache.info()
+        self.assertEqual((info.hits, info.misses, info.size), (4, 2, 2))
+
+    def test_network_addresses(self):
+        from jadnschema.schema.formats import network  # pylint: disable=import-outside-toplevel
+        b64 = lambda addr: base64.b64encode(addr.encode()).decode()  # pylint: disable=unnecessary-lambda-assignment
+        self.assertListEqual(network.IPv4_Network(f"{b64('127.0.0.1')}/30"), [b64("127.0.0.1"), 30])
+        self.assertEqual(network.IPv6_Network(f"{b64('fe80::1')}/64", as_object=True), ipaddress.IPv6Network("fe80::/64"))
+        self.assertEqual(network.IPv4("10.0.0.1", as_object=True), ipaddress.IPv4Address("10.0.0.1"))
+        for val in ("1.2.3.04", "1.2.3.256", "1.2.3", "1.2.3.4.5", "١.2.3.4"):
+            self.assertFalse(network.is_ipv4(val), val)
+        for val in ("1::2::3", "1:2:3:4:5:6:7:8:9", "fe80::1%", "12345::", "::1.2.3.256", "1.2.3.4::", "1:1.2.3.4::"):
+            self.assertFalse(network.is_ipv6(val), val)
+        for val in ("::", "1::", "::ffff:1.2.3.4", "fe80::1%eth0", "1:2:3:4:5:6:7:8"):
+            self.assertTrue(network.is_ipv6(val), val)
+        nets = [f"{b64('10.0.0.1')}/8", f"{b64('10.0.0')}/8", f"{b64('10.0.0.1')}/33", f"{b64('10.0.0.1')}/255.0.0.0"]
+        self.assertListEqual(network.validate_addresses(nets, "ipv4-net"), [1, 2])
+
+
+class BinaryOctets(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/binary/v1", "exports": ["Root"]},
+            "types": [
+                ["Root", "Record", [], "", [[1, "b", "Bytes", ["[0"], ""], [2, "h", "Hex", ["[0"], ""], [3, "a", "Addr", ["[0"], ""]]],
+                ["Bytes", "Binary", ["{2", "}4"], ""],
+                ["Hex", "Binary", ["/x", "}2"], ""],
+                ["Addr", "Binary", ["/ipv4-addr"], ""]
+            ]
+        })
+
+    def test_octet_length(self):
+        b64 = lambda val: base64.b64encode(val).decode()  # pylint: disable=unnecessary-lambda-assignment
+        # 4 octets is 8 base64 characters, the limits apply to the octets
+        self._schema_obj.validate_as("Root", {"b": b64(b"\x00\x01\x02\x03"), "h": "0a0b"})
+        for val in ({"b": b64(b"\x00" * 5)}, {"b": b64(b"\x00")}, {"h": "0a0b0c"}, {"h": "0a 0b"}, {"b": "not base64!"}):
+            with self.assertRaises(ValidationError, msg=val):
+                self._schema_obj.validate_as("Root", val)
+        result = self._schema_obj.check_as("Root", {"b": b64(b"\x00" * 5), "h": "zz"})
+        self.assertEqual([e.path for e in result.errors], ["/b", "/h"])
+
+    def test_decoded_once(self):
+        addr_cls = self._schema_obj.types["Addr"]
+        val = base64.b64encode(b"10.0.0.1").decode()
+        addr = addr_cls.parse_obj(val)
+        with mock.patch("jadnschema.schema.definitions.primitives.decode_binary", wraps=decode_binary) as decode:
+            self.assertEqual(addr.data, b"10.0.0.1")
+            self.assertIs(addr.data.obj, addr.data.obj)
+        decode.assert_called_once_with(val, "ipv4-addr")
+        self.assertNotIn("_data", addr.dict())
+        self.assertTrue(self._schema_obj.check_as("Root", {"a": val}))
+        self.assertFalse(self._schema_obj.check_as("Root", {"a": base64.b64encode(b"10.0.0.256").decode()}))
+
+
+class ExportDispatch(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/dispatch/v1", "exports": ["Command", "Response", "Event", "Status", "Extra"]},
+            "types": [
+                ["Command", "Record", [], "", [[1, "action", "String", [], ""], [2, "args", "Extra", ["[0"], ""]]],
+                ["Response", "Record", [], "", [[1, "status", "Integer", [], ""], [2, "results", "String", ["[0"], ""]]],
+                ["Event", "Choice", [], "", [[1, "alert", "String", [], ""], [2, "notice", "String", [], ""]]],
+                ["Status", "Enumerated", [], "", [[1, "ok", ""], [2, "error", ""]]],
+                ["Extra", "Map", [], "", [[1, "other", "String", ["[0"], ""]]]
+            ]
+        })
+
+    def test_dispatch(self):
+        self.assertListEqual(self._schema_obj.dispatch({"action": "scan", "args": {}}), ["Command"])
+        self.assertListEqual(self._schema_obj.dispatch({"status": 200}), ["Response"])
+        self.assertListEqual(self._schema_obj.dispatch({"alert": "x"}), ["Event"])
+        self.assertListEqual(self._schema_obj.dispatch({"alert": "x", "notice": "y"}), ["Extra"])
+        self.assertListEqual(self._schema_obj.dispatch("ok"), ["Status"])
+        self.assertListEqual(self._schema_obj.dispatch(1.5), [])
+
+    def test_validate(self):
+        self.assertEqual(self._schema_obj.validate({"status": 200}).__class__.__name__, "Response")
+        self.assertEqual(self._schema_obj.validate({"other": "x"}).__class__.__name__, "Extra")
+        with self.assertRaises(ValidationError):
+            self._schema_obj.validate({"status": "bad"})
+        with self.assertRaises(SchemaException):
+            self._schema_obj.validate("unknown")
+
+
+class ChoiceDispatch(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/choice/v1", "exports": ["Hash", "HashVal"]},
+            "types": [
+                ["Hash", "Choice", [], "", [
+                    [1, "md5", "Binary", ["/x", "{16", "}16"], ""],
+                    [2, "sha1", "Binary", ["/x", "{20", "}20"], ""]
+                ]],
+                ["HashVal", "Record", [], "", [
+                    [1, "algorithm", "String", [], ""],
+                    [2, "value", "Hash", ["&1"], ""]
+                ]]
+            ]
+        })
+
+    def test_intrinsic_tag(self):
+        hash_cls = self._schema_obj.types["Hash"]
+        val = hash_cls.validate({"sha1": "00" * 20})
+        self.assertEqual(val.__fields_set__, {"sha1"})
+        for invalid in ({"sha1": "!!"}, {"sha256": "00"}, {}, {"md5": "00" * 16, "sha1": "00" * 20}):
+            with self.assertRaises(ValidationError, msg=invalid):
+                hash_cls.validate(invalid)
+
+    def test_explicit_tag(self):
+        val = self._schema_obj.validate_as("HashVal", {"algorithm": "md5", "value": "00" * 16})
+        self.assertEqual(val.value_.__fields_set__, {"md5"})
+        with self.assertRaises(ValidationError):
+            self._schema_obj.validate_as("HashVal", {"algorithm": "sha1", "value": "!!"})
+        self.assertTrue(self._schema_obj.check_as("HashVal", {"algorithm": "md5", "value": "00" * 16}))
+        result = self._schema_obj.check_as("HashVal", {"algorithm": "sha256", "value": "00" * 16})
+        self.assertEqual([e.path for e in result.errors], ["/value"])
+
+    def test_id_tag(self):
+        schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/choice-id/v1", "exports": ["HashId"]},
+            "types": [
+                ["HashId", "Choice", ["="], "", [
+                    [1, "md5", "Binary", ["/x", "{16", "}16"], ""],
+                    [2, "sha1", "Binary", ["/x", "{20", "}20"], ""]
+                ]]
+            ]
+        })
+        hash_cls = schema_obj.types["HashId"]
+        for valid in ({"2": "00" * 20}, {2: "00" * 20}):
+            self.assertEqual(hash_cls.validate(valid).__fields_set__, {"sha1"}, msg=valid)
+            self.assertTrue(schema_obj.check_as("HashId", valid), msg=valid)
+            self.assertEqual(schema_obj.validate_as("HashId", valid).__fields_set__, {"sha1"}, msg=valid)
+        for invalid in ({"sha1": "00" * 20}, {"3": "00"}, {"2": "!!"}):
+            with self.assertRaises(ValidationError, msg=invalid):
+                hash_cls.validate(invalid)
+            self.assertFalse(schema_obj.check_as("HashId", invalid), msg=invalid)
+
+    def test_extend(self):
+        schema_obj = Schema.parse_obj({
+            "info": {"package": "http://test/choice-extend/v1", "exports": ["HashExt"]},
+            "types": [
+                ["HashExt", "Choice", ["X"], "", [
+                    [1, "md5", "Binary", ["/x", "{16", "}16"], ""]
+                ]]
+            ]
+        })
+        self.assertTrue(schema_obj.check_as("HashExt", {"sha256": "00" * 32}))
+        self.assertIn("sha256", schema_obj.types["HashExt"].validate({"sha256": "00" * 32}).dict())
+        with self.assertRaises(ValidationError):
+            self._schema_obj.types["Hash"].validate({"sha256": "00" * 32})
+
+    def test_root_validators(self):
+        def md5_only(cls, values: dict) -> dict:  # pylint: disable=unused-argument
+            if "md5" not in values:
+                raise ValueError("md5 is required")
+            return values
+
+        hash_cls = self._schema_obj.types["Hash"]
+        with mock.patch.object(hash_cls, "__post_root_validators__", [(False, md5_only)]):
+            self.assertEqual(hash_cls.validate({"md5": "00" * 16}).__fields_set__, {"md5"})
+            with self.assertRaises(ValidationError):
+                hash_cls.validate({"sha1": "00" * 20})
+
+
+class JsonSchemaBackend(TestCase):
+    _test_root = os.path.join(os.path.abspath(os.path.dirname(__file__)))
+    _schema = f"{_test_root}/schema/oc2ls-v1.1-lang_resolved.jadn"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._schema_obj = Schema.parse_file(cls._schema)
+        cls._validator = cls._schema_obj.validator("jsonschema") if FASTJSONSCHEMA else None
+
+    @skipUnless(FASTJSONSCHEMA, "fastjsonschema is not installed")
+    def test_cached(self):
+        self.assertIs(self._schema_obj.validator("jsonschema"), self._validator)
+        with self.assertRaises(SchemaException):
+            self._schema_obj.validator("unknown")
+
+    def test_requires_fastjsonschema(self):
+        with mock.patch.dict(sys.modules, {"fastjsonschema": None}):
+            with self.assertRaises(SchemaException):
+                Schema.parse_file(self._schema).validator("jsonschema")
+
+    @skipUnless(FASTJSONSCHEMA, "fastjsonschema is not installed")
+    def test_validate(self):
+        command = {"action": "query", "target": {"features": ["versions"]}}
+        self.assertDictEqual(self._validator.validate_as(CMD_TYPE, command), command)
+        self.assertDictEqual(self._validator.validate(command), command)
+        with self.assertRaises(SchemaException):
+            self._validator.validate_as(CMD_TYPE, {"action": "query"})
+
+    @skipUnless(FASTJSONSCHEMA, "fastjsonschema is not installed")
+    def test_check(self):
+        # The generated code stops at the first violation in either mode
+        for mode in (ErrorMode.CollectAll, ErrorMode.FailFast):
+            result = self._validator.check_as(CMD_TYPE, {"action": "bad", "target": {"features": ["unknown"]}}, mode)
+            self.assertEqual([e.path for e in result.errors], ["/action"])
+        result = self._validator.check_as(CMD_TYPE, {"action": "query", "target": {"features": ["unknown"]}})
+        self.assertEqual([e.path for e in result.errors], ["/target/features/0"])
+
+    @skipUnless(FASTJSONSCHEMA, "fastjsonschema is not installed")
+    def test_backends_agree(self):
+        messages = [
+            (CMD_TYPE, {"action": "query", "target": {"features": ["versions", "profiles"]}}),
+            (CMD_TYPE, {"action": "deny", "target": {"ipv4_connection": {"src_addr": "MTI3LjAuMC4x", "protocol": "tcp", "src_port": 80}}}),
+            (CMD_TYPE, {"action": "allow", "target": {"domain_name": "example.com"}, "args": {"duration": 5000, "response_requested": "complete"}}),
+            (CMD_TYPE, {"action": "allow", "target": {"email_addr": "user@example.com"}}),
+            (CMD_TYPE, {"action": "scan", "target": {"uri": "https://example.com/a"}}),
+            (RSP_TYPE, {"status": 200, "results": {"versions": ["1.1"], "pairs": {"query": ["features"]}}})
+        ]
+        for type_, message in messages:
+            self.assertTrue(self._schema_obj.check_as(type_, message), msg=message)
+            self.assertTrue(self._validator.check_as(type_, message), msg=message)
+            self.assertDictEqual(self._validator.validate_as(type_, message), message)